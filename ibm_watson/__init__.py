@@ -17,6 +17,12 @@ from ibm_cloud_sdk_core import IAMTokenManager, DetailedResponse, BaseService, A
 
 from .assistant_v1 import AssistantV1
 from .assistant_v2 import AssistantV2
+from .async_assistant_v2 import AsyncAssistantV2
+from .session_manager import SessionManager
+from .context_store import ContextStore
+from .log_export import LogExporter
+from .workspace_sync import WorkspaceSync
+from .workspace_cache import WorkspaceCache
 from .natural_language_understanding_v1 import NaturalLanguageUnderstandingV1
 from .text_to_speech_v1 import TextToSpeechV1
 from .discovery_v2 import DiscoveryV2
@@ -28,7 +28,7 @@ See: https://cloud.ibm.com/docs/assistant
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 import json
 import sys
 
@@ -37,7 +37,10 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
 
+from .bulk_classify import (MAX_BULK_CLASSIFY_UTTERANCES, BulkClassifyStats,
+                            bulk_classify_all)
 from .common import get_sdk_headers
+from .pagination import CursorPager, paginate
 
 ##############################################################################
 # Service
@@ -269,6 +272,53 @@ class AssistantV1(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def bulk_classify_all(
+        self,
+        workspace_id: str,
+        utterances: Iterable,
+        *,
+        chunk_size: int = MAX_BULK_CLASSIFY_UTTERANCES,
+        max_workers: int = 4,
+        max_retries: int = 5,
+        stats: Optional[BulkClassifyStats] = None,
+        **kwargs,
+    ) -> Iterator['BulkClassifyOutput']:
+        """
+        Identify intents and entities in any number of user utterances.
+
+        Splits the utterances into `bulk_classify` requests of at most `chunk_size`
+        utterances, sends up to `max_workers` requests at a time and yields the results
+        in input order as they become available. The utterances are read as they are
+        needed, so the input can be a generator. A request that is rate limited (HTTP
+        429) is retried after the time given by its `Retry-After` header, or with an
+        exponential backoff.
+
+        :param str workspace_id: Unique identifier of the workspace.
+        :param Iterable utterances: The utterances to classify, as
+               `BulkClassifyUtterance` objects, dictionaries or strings.
+        :param int chunk_size: (optional) Number of utterances per request, at most
+               the service maximum of 50.
+        :param int max_workers: (optional) Number of requests sent at the same time.
+        :param int max_retries: (optional) Number of times a rate-limited request is
+               retried.
+        :param BulkClassifyStats stats: (optional) Updated with the progress and
+               throughput of the run as results are yielded.
+        :param dict headers: A `dict` containing the request headers
+        :return: An iterator over the `BulkClassifyOutput` of each utterance.
+        :rtype: Iterator[BulkClassifyOutput]
+        """
+
+        def classify(chunk):
+            return self.bulk_classify(workspace_id, input=chunk, **kwargs)
+
+        return bulk_classify_all(classify,
+                                 utterances,
+                                 BulkClassifyOutput,
+                                 chunk_size=chunk_size,
+                                 max_workers=max_workers,
+                                 max_retries=max_retries,
+                                 stats=stats)
+
     #########################
     # Workspaces
     #########################
@@ -339,6 +389,42 @@ class AssistantV1(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_workspaces_iter(
+        self,
+        *,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all workspaces.
+
+        Iterates over the `Workspace` objects of all pages of `list_workspaces`. Accepts the
+        keyword arguments of `list_workspaces`. See `paginate`.
+
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields `Workspace` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_workspaces,
+                             items_key='workspaces',
+                             item_class=Workspace,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def create_workspace(
         self,
         *,
@@ -1088,6 +1174,45 @@ class AssistantV1(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_intents_iter(
+        self,
+        workspace_id: str,
+        *,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all intents.
+
+        Iterates over the `Intent` objects of all pages of `list_intents`. Accepts the
+        keyword arguments of `list_intents`. See `paginate`.
+
+        :param str workspace_id: Unique identifier of the workspace.
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields `Intent` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_intents,
+                             workspace_id,
+                             items_key='intents',
+                             item_class=Intent,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def create_intent(
         self,
         workspace_id: str,
@@ -1469,6 +1594,48 @@ class AssistantV1(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_examples_iter(
+        self,
+        workspace_id: str,
+        intent: str,
+        *,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all user input examples.
+
+        Iterates over the `Example` objects of all pages of `list_examples`. Accepts the
+        keyword arguments of `list_examples`. See `paginate`.
+
+        :param str workspace_id: Unique identifier of the workspace.
+        :param str intent: The intent name.
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields `Example` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_examples,
+                             workspace_id,
+                             intent,
+                             items_key='examples',
+                             item_class=Example,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def create_example(
         self,
         workspace_id: str,
@@ -1835,6 +2002,45 @@ class AssistantV1(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_counterexamples_iter(
+        self,
+        workspace_id: str,
+        *,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all counterexamples.
+
+        Iterates over the `Counterexample` objects of all pages of `list_counterexamples`. Accepts the
+        keyword arguments of `list_counterexamples`. See `paginate`.
+
+        :param str workspace_id: Unique identifier of the workspace.
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields `Counterexample` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_counterexamples,
+                             workspace_id,
+                             items_key='counterexamples',
+                             item_class=Counterexample,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def create_counterexample(
         self,
         workspace_id: str,
@@ -2182,6 +2388,45 @@ class AssistantV1(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_entities_iter(
+        self,
+        workspace_id: str,
+        *,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all entities.
+
+        Iterates over the `Entity` objects of all pages of `list_entities`. Accepts the
+        keyword arguments of `list_entities`. See `paginate`.
+
+        :param str workspace_id: Unique identifier of the workspace.
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields `Entity` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_entities,
+                             workspace_id,
+                             items_key='entities',
+                             item_class=Entity,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def create_entity(
         self,
         workspace_id: str,
@@ -2654,6 +2899,48 @@ class AssistantV1(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_values_iter(
+        self,
+        workspace_id: str,
+        entity: str,
+        *,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all entity values.
+
+        Iterates over the `Value` objects of all pages of `list_values`. Accepts the
+        keyword arguments of `list_values`. See `paginate`.
+
+        :param str workspace_id: Unique identifier of the workspace.
+        :param str entity: The name of the entity.
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields `Value` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_values,
+                             workspace_id,
+                             entity,
+                             items_key='values',
+                             item_class=Value,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def create_value(
         self,
         workspace_id: str,
@@ -3077,6 +3364,51 @@ class AssistantV1(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_synonyms_iter(
+        self,
+        workspace_id: str,
+        entity: str,
+        value: str,
+        *,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all entity value synonyms.
+
+        Iterates over the `Synonym` objects of all pages of `list_synonyms`. Accepts the
+        keyword arguments of `list_synonyms`. See `paginate`.
+
+        :param str workspace_id: Unique identifier of the workspace.
+        :param str entity: The name of the entity.
+        :param str value: The text of the entity value.
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields `Synonym` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_synonyms,
+                             workspace_id,
+                             entity,
+                             value,
+                             items_key='synonyms',
+                             item_class=Synonym,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def create_synonym(
         self,
         workspace_id: str,
@@ -3451,6 +3783,45 @@ class AssistantV1(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_dialog_nodes_iter(
+        self,
+        workspace_id: str,
+        *,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all dialog nodes.
+
+        Iterates over the `DialogNode` objects of all pages of `list_dialog_nodes`. Accepts the
+        keyword arguments of `list_dialog_nodes`. See `paginate`.
+
+        :param str workspace_id: Unique identifier of the workspace.
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields `DialogNode` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_dialog_nodes,
+                             workspace_id,
+                             items_key='dialog_nodes',
+                             item_class=DialogNode,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def create_dialog_node(
         self,
         workspace_id: str,
@@ -3974,6 +4345,55 @@ class AssistantV1(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_logs_iter(
+        self,
+        workspace_id: str,
+        *,
+        filter: Optional[str] = None,
+        sort: Optional[str] = None,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all log events in a workspace.
+
+        Iterates over the `Log` objects of all pages of `list_logs`, following the
+        pagination cursors. The next page is fetched in the background while the
+        current one is consumed, and requests that fail with HTTP 429 or 5xx are sent
+        again with the same cursor. See `CursorPager`.
+
+        :param str workspace_id: Unique identifier of the workspace.
+        :param str filter: (optional) A cacheable parameter that limits the results
+               to those matching the specified filter.
+        :param str sort: (optional) How to sort the returned log events.
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `CursorPager` that yields `Log` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_logs,
+                             workspace_id,
+                             items_key='logs',
+                             item_class=Log,
+                             filter=filter,
+                             sort=sort,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def list_all_logs(
         self,
         filter: str,
@@ -4046,6 +4466,52 @@ class AssistantV1(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_all_logs_iter(
+        self,
+        filter: str,
+        *,
+        sort: Optional[str] = None,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all log events in all workspaces.
+
+        Iterates over the `Log` objects of all pages of `list_all_logs`, following the
+        pagination cursors. The next page is fetched in the background while the
+        current one is consumed, and requests that fail with HTTP 429 or 5xx are sent
+        again with the same cursor. See `CursorPager`.
+
+        :param str filter: A cacheable parameter that limits the results to those
+               matching the specified filter.
+        :param str sort: (optional) How to sort the returned log events.
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `CursorPager` that yields `Log` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_all_logs,
+                             filter,
+                             items_key='logs',
+                             item_class=Log,
+                             sort=sort,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     #########################
     # User data
     #########################
@@ -4108,6 +4574,54 @@ class AssistantV1(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    #########################
+    # Pagination
+    #########################
+
+    def paginate(
+        self,
+        list_method: Callable[..., DetailedResponse],
+        *args,
+        items_key: str,
+        item_class=None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        Iterate over all pages of a list method.
+
+        Returns a `CursorPager` that calls `list_method` with the given arguments and
+        the cursor of each page, and yields the items of each page. The next page is
+        fetched in the background while the current one is consumed, and requests that
+        fail with HTTP 429 or 5xx are sent again with the same cursor. Pass `page_limit`
+        to choose the number of items in each page.
+
+        :param list_method: A method of this client that takes a `cursor`, such as
+               `list_intents`.
+        :param str items_key: The property of the result that holds the items of a
+               page, such as `intents`.
+        :param item_class: (optional) The model class of the items. By default the
+               items are yielded as `dict`.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields the items.
+        :rtype: CursorPager
+        """
+        return paginate(list_method,
+                        *args,
+                        items_key=items_key,
+                        item_class=item_class,
+                        cursor=cursor,
+                        prefetch=prefetch,
+                        max_retries=max_retries,
+                        **kwargs)
+
 
 class ListWorkspacesEnums:
     """
@@ -29,7 +29,7 @@ See: https://cloud.ibm.com/docs/assistant
 
 from datetime import datetime
 from enum import Enum
-from typing import BinaryIO, Dict, List, Optional
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
 import json
 import sys
 
@@ -38,7 +38,12 @@ from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
 
-from .common import get_sdk_headers
+from .assistant_v2_stream import (CompleteItemEvent, FinalResponseEvent,
+                                  MessageStream, PartialItemEvent)
+from .bulk_classify import (MAX_BULK_CLASSIFY_UTTERANCES, BulkClassifyStats,
+                            bulk_classify_all)
+from .common import get_sdk_headers, parse_sse_stream_data
+from .pagination import CursorPager, paginate
 
 ##############################################################################
 # Service
@@ -216,6 +221,42 @@ class AssistantV2(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_providers_iter(
+        self,
+        *,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all conversational skill providers.
+
+        Iterates over the `ProviderResponse` objects of all pages of `list_providers`. Accepts the
+        keyword arguments of `list_providers`. See `paginate`.
+
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields `ProviderResponse` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_providers,
+                             items_key='conversational_skill_providers',
+                             item_class=ProviderResponse,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def update_provider(
         self,
         provider_id: str,
@@ -417,6 +458,42 @@ class AssistantV2(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_assistants_iter(
+        self,
+        *,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all assistants.
+
+        Iterates over the `AssistantData` objects of all pages of `list_assistants`. Accepts the
+        keyword arguments of `list_assistants`. See `paginate`.
+
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields `AssistantData` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_assistants,
+                             items_key='assistants',
+                             item_class=AssistantData,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def delete_assistant(
         self,
         assistant_id: str,
@@ -959,6 +1036,7 @@ class AssistantV2(BaseService):
             data=data,
         )
 
+        kwargs.setdefault('stream', True)
         response = self.send(request, **kwargs)
         return response
 
@@ -1064,9 +1142,95 @@ class AssistantV2(BaseService):
             data=data,
         )
 
+        kwargs.setdefault('stream', True)
         response = self.send(request, **kwargs)
         return response
 
+    def message_stream_iter(
+        self,
+        assistant_id: str,
+        environment_id: str,
+        session_id: str,
+        *,
+        input: Optional['MessageInput'] = None,
+        context: Optional['MessageContext'] = None,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> MessageStream:
+        """
+        Send user input to assistant (stateful) and iterate over the streamed response.
+
+        Like `message_stream`, but the server-sent events are parsed as they arrive and
+        returned as typed events: `PartialItemEvent`, `CompleteItemEvent` and a final
+        `FinalResponseEvent` holding the `StatefulMessageResponse`. The text of the
+        partial items is collected per response item.
+
+        :param str assistant_id: The assistant ID or the environment ID of the
+               environment where the assistant is deployed.
+        :param str environment_id: Unique identifier of the environment.
+        :param str session_id: Unique identifier of the session.
+        :param MessageInput input: (optional) An input object that includes the
+               input text.
+        :param MessageContext context: (optional) Context data for the
+               conversation.
+        :param str user_id: (optional) A string value that identifies the user who
+               is interacting with the assistant.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `MessageStream` over the events of the response.
+        :rtype: MessageStream
+        """
+
+        response = self.message_stream(assistant_id,
+                                       environment_id,
+                                       session_id,
+                                       input=input,
+                                       context=context,
+                                       user_id=user_id,
+                                       **kwargs).get_result()
+        return MessageStream(parse_sse_stream_data(response),
+                             StatefulMessageResponse, response)
+
+    def message_stream_stateless_iter(
+        self,
+        assistant_id: str,
+        environment_id: str,
+        *,
+        input: Optional['MessageInput'] = None,
+        context: Optional['MessageContext'] = None,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> MessageStream:
+        """
+        Send user input to assistant (stateless) and iterate over the streamed response.
+
+        Like `message_stream_stateless`, but the server-sent events are parsed as they
+        arrive and returned as typed events: `PartialItemEvent`, `CompleteItemEvent` and
+        a final `FinalResponseEvent` holding the `StatelessMessageResponse`. The text of
+        the partial items is collected per response item.
+
+        :param str assistant_id: The assistant ID or the environment ID of the
+               environment where the assistant is deployed.
+        :param str environment_id: Unique identifier of the environment.
+        :param MessageInput input: (optional) An input object that includes the
+               input text.
+        :param MessageContext context: (optional) Context data for the
+               conversation.
+        :param str user_id: (optional) A string value that identifies the user who
+               is interacting with the assistant.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `MessageStream` over the events of the response.
+        :rtype: MessageStream
+        """
+
+        response = self.message_stream_stateless(assistant_id,
+                                                 environment_id,
+                                                 input=input,
+                                                 context=context,
+                                                 user_id=user_id,
+                                                 **kwargs).get_result()
+        return MessageStream(parse_sse_stream_data(response),
+                             StatelessMessageResponse, response)
+
     #########################
     # Bulk classify
     #########################
@@ -1141,6 +1305,53 @@ class AssistantV2(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def bulk_classify_all(
+        self,
+        skill_id: str,
+        utterances: Iterable,
+        *,
+        chunk_size: int = MAX_BULK_CLASSIFY_UTTERANCES,
+        max_workers: int = 4,
+        max_retries: int = 5,
+        stats: Optional[BulkClassifyStats] = None,
+        **kwargs,
+    ) -> Iterator['BulkClassifyOutput']:
+        """
+        Identify intents and entities in any number of user utterances.
+
+        Splits the utterances into `bulk_classify` requests of at most `chunk_size`
+        utterances, sends up to `max_workers` requests at a time and yields the results
+        in input order as they become available. The utterances are read as they are
+        needed, so the input can be a generator. A request that is rate limited (HTTP
+        429) is retried after the time given by its `Retry-After` header, or with an
+        exponential backoff.
+
+        :param str skill_id: Unique identifier of the skill.
+        :param Iterable utterances: The utterances to classify, as
+               `BulkClassifyUtterance` objects, dictionaries or strings.
+        :param int chunk_size: (optional) Number of utterances per request, at most
+               the service maximum of 50.
+        :param int max_workers: (optional) Number of requests sent at the same time.
+        :param int max_retries: (optional) Number of times a rate-limited request is
+               retried.
+        :param BulkClassifyStats stats: (optional) Updated with the progress and
+               throughput of the run as results are yielded.
+        :param dict headers: A `dict` containing the request headers
+        :return: An iterator over the `BulkClassifyOutput` of each utterance.
+        :rtype: Iterator[BulkClassifyOutput]
+        """
+
+        def classify(chunk):
+            return self.bulk_classify(skill_id, input=chunk, **kwargs)
+
+        return bulk_classify_all(classify,
+                                 utterances,
+                                 BulkClassifyOutput,
+                                 chunk_size=chunk_size,
+                                 max_workers=max_workers,
+                                 max_retries=max_retries,
+                                 stats=stats)
+
     #########################
     # Logs
     #########################
@@ -1231,6 +1442,56 @@ class AssistantV2(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_logs_iter(
+        self,
+        assistant_id: str,
+        *,
+        filter: Optional[str] = None,
+        sort: Optional[str] = None,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all log events for an assistant.
+
+        Iterates over the `Log` objects of all pages of `list_logs`, following the
+        pagination cursors. The next page is fetched in the background while the
+        current one is consumed, and requests that fail with HTTP 429 or 5xx are sent
+        again with the same cursor. See `CursorPager`.
+
+        :param str assistant_id: The assistant ID or the environment ID of the
+               environment where the assistant is deployed.
+        :param str filter: (optional) A cacheable parameter that limits the results
+               to those matching the specified filter.
+        :param str sort: (optional) How to sort the returned log events.
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :param dict headers: A `dict` containing the request headers
+        :return: A `CursorPager` that yields `Log` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_logs,
+                             assistant_id,
+                             items_key='logs',
+                             item_class=Log,
+                             filter=filter,
+                             sort=sort,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     #########################
     # User data
     #########################
@@ -1382,6 +1643,56 @@ class AssistantV2(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_environments_iter(
+        self,
+        assistant_id: str,
+        *,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all environments.
+
+        Iterates over the `Environment` objects of all pages of `list_environments`. Accepts the
+        keyword arguments of `list_environments`. See `paginate`.
+
+        :param str assistant_id: The assistant ID or the environment ID of the
+               environment where the assistant is deployed, depending on the type of
+               request:
+                - For message, session, and log requests, specify the environment ID of
+               the environment where the assistant is deployed.
+                - For all other requests, specify the assistant ID of the assistant.
+                To find the environment ID or assistant ID in the watsonx Assistant user
+               interface, open the assistant settings and scroll to the **Environments**
+               section.
+               **Note:** If you are using the classic Watson Assistant experience, always
+               use the assistant ID. To find the assistant ID in the user interface, open
+               the assistant settings and click API Details.
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields `Environment` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_environments,
+                             assistant_id,
+                             items_key='environments',
+                             item_class=Environment,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def get_environment(
         self,
         assistant_id: str,
@@ -1719,6 +2030,56 @@ class AssistantV2(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    def list_releases_iter(
+        self,
+        assistant_id: str,
+        *,
+        page_limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        List all releases.
+
+        Iterates over the `Release` objects of all pages of `list_releases`. Accepts the
+        keyword arguments of `list_releases`. See `paginate`.
+
+        :param str assistant_id: The assistant ID or the environment ID of the
+               environment where the assistant is deployed, depending on the type of
+               request:
+                - For message, session, and log requests, specify the environment ID of
+               the environment where the assistant is deployed.
+                - For all other requests, specify the assistant ID of the assistant.
+                To find the environment ID or assistant ID in the watsonx Assistant user
+               interface, open the assistant settings and scroll to the **Environments**
+               section.
+               **Note:** If you are using the classic Watson Assistant experience, always
+               use the assistant ID. To find the assistant ID in the user interface, open
+               the assistant settings and click API Details.
+        :param int page_limit: (optional) The number of records to return in each
+               page of results.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields `Release` objects.
+        :rtype: CursorPager
+        """
+
+        return self.paginate(self.list_releases,
+                             assistant_id,
+                             items_key='releases',
+                             item_class=Release,
+                             page_limit=page_limit,
+                             cursor=cursor,
+                             prefetch=prefetch,
+                             max_retries=max_retries,
+                             **kwargs)
+
     def get_release(
         self,
         assistant_id: str,
@@ -2672,6 +3033,54 @@ class AssistantV2(BaseService):
         response = self.send(request, **kwargs)
         return response
 
+    #########################
+    # Pagination
+    #########################
+
+    def paginate(
+        self,
+        list_method: Callable[..., DetailedResponse],
+        *args,
+        items_key: str,
+        item_class=None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> CursorPager:
+        """
+        Iterate over all pages of a list method.
+
+        Returns a `CursorPager` that calls `list_method` with the given arguments and
+        the cursor of each page, and yields the items of each page. The next page is
+        fetched in the background while the current one is consumed, and requests that
+        fail with HTTP 429 or 5xx are sent again with the same cursor. Pass `page_limit`
+        to choose the number of items in each page.
+
+        :param list_method: A method of this client that takes a `cursor`, such as
+               `list_intents`.
+        :param str items_key: The property of the result that holds the items of a
+               page, such as `intents`.
+        :param item_class: (optional) The model class of the items. By default the
+               items are yielded as `dict`.
+        :param str cursor: (optional) A token identifying the page of results to
+               start from.
+        :param bool prefetch: (optional) Whether to fetch the next page while the
+               current one is consumed.
+        :param int max_retries: (optional) Number of times a failed request is sent
+               again.
+        :return: A `CursorPager` that yields the items.
+        :rtype: CursorPager
+        """
+        return paginate(list_method,
+                        *args,
+                        items_key=items_key,
+                        item_class=item_class,
+                        cursor=cursor,
+                        prefetch=prefetch,
+                        max_retries=max_retries,
+                        **kwargs)
+
 
 class ListProvidersEnums:
     """
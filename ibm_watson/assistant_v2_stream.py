@@ -0,0 +1,196 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import namedtuple
+from typing import AsyncIterable, Dict, Iterable, Optional
+
+PartialItemEvent = namedtuple('PartialItemEvent',
+                              ['response_id', 'text', 'item'])
+PartialItemEvent.__doc__ = """
+A piece of a response item that is still being generated. `text` holds the
+text added by this piece and `item` the partial item as sent by the service.
+"""
+
+CompleteItemEvent = namedtuple('CompleteItemEvent',
+                               ['response_id', 'text', 'item'])
+CompleteItemEvent.__doc__ = """
+A response item that has been generated in full. `text` holds the whole text
+of the item and `item` the complete item as sent by the service.
+"""
+
+FinalResponseEvent = namedtuple('FinalResponseEvent', ['response'])
+FinalResponseEvent.__doc__ = """
+The last event of a stream. `response` holds the message response, as a
+`StatefulMessageResponse` or `StatelessMessageResponse`.
+"""
+
+
+def _response_id(item):
+    metadata = item.get('streaming_metadata') or {}
+    response_id = metadata.get('response_id')
+    if response_id is None:
+        response_id = metadata.get('id')
+    return response_id
+
+
+class _MessageEvents(object):
+    """
+    Turns the decoded data of streamed message events into typed events and
+    collects the text of the response items. Shared by the synchronous and
+    asyncio streams.
+    """
+
+    def __init__(self, response_class, response=None) -> None:
+        self.final_response = None
+        self._response_class = response_class
+        self._response = response
+        self._texts = {}
+
+    def text(self, response_id) -> Optional[str]:
+        """
+        Returns the text received so far for a response item, or `None` if no
+        item with that ID has been received.
+        """
+        parts = self._texts.get(response_id)
+        if parts is None:
+            return None
+        if len(parts) > 1:
+            parts[:] = [''.join(parts)]
+        return parts[0]
+
+    @property
+    def response_ids(self):
+        """The IDs of the response items received so far, in order."""
+        return list(self._texts)
+
+    def _process(self, data):
+        """
+        Turns the decoded data of one event into a typed event and updates the
+        collected text. Data of unknown events is skipped.
+        """
+        if 'partial_item' in data:
+            item = data['partial_item']
+            response_id = _response_id(item)
+            text = item.get('text') or ''
+            self._texts.setdefault(response_id, []).append(text)
+            return PartialItemEvent(response_id, text, item)
+        if 'complete_item' in data:
+            item = data['complete_item']
+            response_id = _response_id(item)
+            text = item.get('text')
+            if text is None:
+                text = self.text(response_id) or ''
+            self._texts[response_id] = [text]
+            return CompleteItemEvent(response_id, text, item)
+        if 'final_response' in data:
+            self.final_response = self._response_class.from_dict(
+                data['final_response'])
+            return FinalResponseEvent(self.final_response)
+        return None
+
+
+class MessageStream(_MessageEvents):
+    """
+    An iterator over the events of a streamed message response, returned by
+    `AssistantV2.message_stream_iter` and
+    `AssistantV2.message_stream_stateless_iter`.
+
+    Events are parsed as they arrive and yielded as `PartialItemEvent`,
+    `CompleteItemEvent` and `FinalResponseEvent` tuples. The text of the
+    partial items is collected per `streaming_metadata.response_id`, so
+    `text(response_id)` returns the text received so far for a response item,
+    and `final_response` holds the message response once the last event has
+    been received.
+
+    :param Iterable[dict] data: The decoded data of the server-sent events.
+    :param response_class: The model class of the final response.
+    :param response: (optional) The streamed `requests.Response`, closed by
+           `close`.
+    :attr final_response: The message response, or `None` before the stream
+          ends.
+    """
+
+    def __init__(self,
+                 data: Iterable[Dict],
+                 response_class,
+                 response=None) -> None:
+        _MessageEvents.__init__(self, response_class, response)
+        self._data = iter(data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        for data in self._data:
+            event = self._process(data)
+            if event is not None:
+                return event
+        raise StopIteration
+
+    def close(self) -> None:
+        """Stops reading the stream and releases the connection."""
+        if self._response is not None:
+            self._response.close()
+
+
+class AsyncMessageStream(_MessageEvents):
+    """
+    asyncio counterpart of `MessageStream`, returned by
+    `AsyncAssistantV2.message_stream_iter` and
+    `AsyncAssistantV2.message_stream_stateless_iter`.
+
+    :param AsyncIterable[dict] data: The decoded data of the server-sent
+           events.
+    :param response_class: The model class of the final response.
+    :param response: (optional) The streamed `aiohttp.ClientResponse`,
+           released by `aclose`.
+    :attr final_response: The message response, or `None` before the stream
+          ends.
+    """
+
+    def __init__(self,
+                 data: AsyncIterable[Dict],
+                 response_class,
+                 response=None) -> None:
+        _MessageEvents.__init__(self, response_class, response)
+        self._data = data.__aiter__()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        async for data in self._data:
+            event = self._process(data)
+            if event is not None:
+                return event
+        raise StopAsyncIteration
+
+    async def aclose(self) -> None:
+        """Stops reading the stream and releases the connection."""
+        if self._response is not None:
+            self._response.release()
@@ -0,0 +1,349 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+asyncio client for the watsonx Assistant v2 service.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import AsyncIterator, Iterable, Optional
+
+import requests
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
+from ibm_cloud_sdk_core.utils import is_json_mimetype
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .assistant_v2 import (AssistantV2, BulkClassifyOutput, MessageContext,
+                           MessageInput, StatefulMessageResponse,
+                           StatelessMessageResponse)
+from .assistant_v2_stream import AsyncMessageStream
+from .bulk_classify import (MAX_BULK_CLASSIFY_UTTERANCES, BulkClassifyStats,
+                            bulk_classify_all_async)
+from .common import parse_sse_stream_data_async
+from .pagination import AsyncCursorPager, paginate
+
+# Seconds to wait for a connection and for each read when no timeout is given
+DEFAULT_TIMEOUT = 60
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAssistantV2(AssistantV2):
+    """
+    asyncio client for the watsonx Assistant v2 service.
+
+    Offers the same methods as `AssistantV2`, but each method returns a
+    coroutine that resolves to the `DetailedResponse`, so any number of
+    conversations can be served concurrently from one event loop. Requests
+    share the connection pool of one `aiohttp.ClientSession`. Requires the
+    optional `aiohttp` package.
+
+    The `timeout` keyword argument of a method is honored as in `AssistantV2`:
+    a number of seconds, or a `(connect, read)` tuple, for connecting and for
+    each read. Streamed results, such as that of `message_stream`, are
+    `aiohttp.ClientResponse` objects; other non-JSON results and the
+    `http_response` of an `ApiException` are `requests.Response` objects, as
+    with `AssistantV2`. Access tokens are fetched in the default executor, so
+    they never block the event loop. Automatic retries are not supported.
+
+    Close the client with `close` or use it as an `async with` context
+    manager.
+
+    :param str version: Release date of the API version you want to use.
+    :param Authenticator authenticator: The authenticator specifies the
+           authentication mechanism.
+    :param str service_name: (optional) The name of the service to configure.
+    :param int max_connections: (optional) Maximum number of connections
+           open at the same time.
+    :param aiohttp.ClientSession http_session: (optional) A client session to
+           send the requests with. It is not closed by `close`.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        authenticator: Authenticator = None,
+        service_name: str = AssistantV2.DEFAULT_SERVICE_NAME,
+        max_connections: int = 100,
+        http_session: Optional['aiohttp.ClientSession'] = None,
+    ) -> None:
+        if aiohttp is None:
+            raise ImportError(
+                'aiohttp is required for the asyncio client. '
+                'Install it with `pip install ibm-watson[async]`')
+        AssistantV2.__init__(self,
+                             version,
+                             authenticator=authenticator,
+                             service_name=service_name)
+        self.max_connections = max_connections
+        self._http_session = http_session
+        self._owns_session = http_session is None
+        self._token_refresh = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the client session and its connections."""
+        if self._owns_session and self._http_session is not None:
+            await self._http_session.close()
+        self._http_session = None
+
+    def prepare_request(self, method, url, **kwargs) -> dict:
+        # Authentication may fetch a token with a blocking request, so it is
+        # left to `send`, which runs the fetch in an executor.
+        authenticator = self.authenticator
+        self.authenticator = NoAuthAuthenticator()
+        try:
+            return AssistantV2.prepare_request(self, method, url, **kwargs)
+        finally:
+            self.authenticator = authenticator
+
+    async def send(self, request, **kwargs) -> DetailedResponse:
+        """
+        Sends a request and wraps the response in a `DetailedResponse` or
+        raises an `ApiException`.
+        """
+        await self._authenticate(request)
+        kwargs = dict({'timeout': DEFAULT_TIMEOUT}, **kwargs)
+        kwargs = dict(kwargs, **self.http_config)
+        stream = kwargs.get('stream') or False
+
+        options = {
+            'headers': dict(request['headers']),
+            'params': request['params'],
+            'data': request['data'],
+            'timeout': self._timeout(kwargs.get('timeout')),
+        }
+        if self.disable_ssl_verification or kwargs.get('verify') is False:
+            options['ssl'] = False
+        proxies = kwargs.get('proxies') or {}
+        proxy = proxies.get(request['url'].split(':', 1)[0])
+        if proxy:
+            options['proxy'] = proxy
+
+        logger.debug('Sending HTTP request message')
+        response = await self._session().request(request['method'],
+                                                 request['url'], **options)
+        logger.debug('Received HTTP response message, status code %d',
+                     response.status)
+
+        if 200 <= response.status <= 299 and stream and \
+                response.status != 204 and request['method'] != 'HEAD':
+            return DetailedResponse(response=response,
+                                    headers=response.headers,
+                                    status_code=response.status)
+        try:
+            body = await response.read()
+        finally:
+            response.release()
+        http_response = self._requests_response(response, body)
+
+        if 200 <= response.status <= 299:
+            if response.status == 204 or request['method'] == 'HEAD':
+                result = None
+            elif not body:
+                result = None
+            elif is_json_mimetype(response.headers.get('Content-Type')):
+                try:
+                    result = json.loads(http_response.text, strict=False)
+                except ValueError as err:
+                    raise ApiException(
+                        code=response.status,
+                        http_response=http_response,
+                        message='Error processing the HTTP response',
+                    ) from err
+            else:
+                result = http_response
+            return DetailedResponse(response=result,
+                                    headers=http_response.headers,
+                                    status_code=response.status)
+
+        raise ApiException(response.status, http_response=http_response)
+
+    async def message_stream_iter(
+        self,
+        assistant_id: str,
+        environment_id: str,
+        session_id: str,
+        *,
+        input: Optional['MessageInput'] = None,
+        context: Optional['MessageContext'] = None,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncMessageStream:
+        """
+        Send user input to assistant (stateful) and iterate over the streamed response.
+
+        asyncio counterpart of `AssistantV2.message_stream_iter`. Iterate over
+        the returned stream with `async for`.
+
+        :rtype: AsyncMessageStream
+        """
+        response = await self.message_stream(assistant_id,
+                                             environment_id,
+                                             session_id,
+                                             input=input,
+                                             context=context,
+                                             user_id=user_id,
+                                             **kwargs)
+        response = response.get_result()
+        return AsyncMessageStream(parse_sse_stream_data_async(response),
+                                  StatefulMessageResponse, response)
+
+    async def message_stream_stateless_iter(
+        self,
+        assistant_id: str,
+        environment_id: str,
+        *,
+        input: Optional['MessageInput'] = None,
+        context: Optional['MessageContext'] = None,
+        user_id: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncMessageStream:
+        """
+        Send user input to assistant (stateless) and iterate over the streamed response.
+
+        asyncio counterpart of `AssistantV2.message_stream_stateless_iter`.
+        Iterate over the returned stream with `async for`.
+
+        :rtype: AsyncMessageStream
+        """
+        response = await self.message_stream_stateless(assistant_id,
+                                                       environment_id,
+                                                       input=input,
+                                                       context=context,
+                                                       user_id=user_id,
+                                                       **kwargs)
+        response = response.get_result()
+        return AsyncMessageStream(parse_sse_stream_data_async(response),
+                                  StatelessMessageResponse, response)
+
+    def bulk_classify_all(
+        self,
+        skill_id: str,
+        utterances: Iterable,
+        *,
+        chunk_size: int = MAX_BULK_CLASSIFY_UTTERANCES,
+        max_workers: int = 4,
+        max_retries: int = 5,
+        stats: Optional[BulkClassifyStats] = None,
+        **kwargs,
+    ) -> AsyncIterator['BulkClassifyOutput']:
+        """
+        Identify intents and entities in any number of user utterances.
+
+        asyncio counterpart of `AssistantV2.bulk_classify_all`. Iterate over
+        the results with `async for`; `max_workers` requests are sent at the
+        same time.
+
+        :rtype: AsyncIterator[BulkClassifyOutput]
+        """
+
+        def classify(chunk):
+            return self.bulk_classify(skill_id, input=chunk, **kwargs)
+
+        return bulk_classify_all_async(classify,
+                                       utterances,
+                                       BulkClassifyOutput,
+                                       chunk_size=chunk_size,
+                                       max_workers=max_workers,
+                                       max_retries=max_retries,
+                                       stats=stats)
+
+    def paginate(
+        self,
+        list_method,
+        *args,
+        items_key: str,
+        item_class=None,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        max_retries: int = 5,
+        **kwargs,
+    ) -> AsyncCursorPager:
+        """
+        Iterate over all pages of a list method.
+
+        asyncio counterpart of `AssistantV2.paginate`, also used by the
+        `list_*_iter` methods. Iterate over the returned pager with
+        `async for`.
+
+        :rtype: AsyncCursorPager
+        """
+        return paginate(list_method,
+                        *args,
+                        items_key=items_key,
+                        item_class=item_class,
+                        cursor=cursor,
+                        prefetch=prefetch,
+                        max_retries=max_retries,
+                        pager_class=AsyncCursorPager,
+                        **kwargs)
+
+    def _session(self):
+        if self._http_session is None:
+            self._owns_session = True
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections))
+        return self._http_session
+
+    async def _authenticate(self, request):
+        token_manager = getattr(self.authenticator, 'token_manager', None)
+        if token_manager is not None and \
+                (token_manager.access_token is None or
+                 token_manager.refresh_time < time.time()):
+            # Concurrent requests wait for the same token fetch
+            if self._token_refresh is None or self._token_refresh.done():
+                loop = asyncio.get_running_loop()
+                self._token_refresh = loop.run_in_executor(
+                    None, token_manager.get_token)
+            await asyncio.shield(self._token_refresh)
+        self.authenticator.authenticate(request)
+
+    @staticmethod
+    def _timeout(timeout):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+        else:
+            connect = read = timeout
+        return aiohttp.ClientTimeout(total=None,
+                                     sock_connect=connect,
+                                     sock_read=read)
+
+    @staticmethod
+    def _requests_response(response, body):
+        http_response = requests.Response()
+        http_response.status_code = response.status
+        http_response.headers = CaseInsensitiveDict(response.headers)
+        http_response.url = str(response.url)
+        http_response.reason = response.reason
+        http_response.encoding = get_encoding_from_headers(
+            http_response.headers)
+        http_response._content = body  # pylint: disable=protected-access
+        return http_response
@@ -0,0 +1,733 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Helpers for inspecting the audio formats accepted by the Speech to Text service.
+"""
+
+import io
+import struct
+import sys
+import threading
+import wave
+from array import array
+from bisect import bisect_right
+from collections import deque, namedtuple
+from itertools import accumulate
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
+
+WAV_FORMAT_PCM = 1
+WAV_FORMAT_EXTENSIBLE = 0xFFFE
+NARROWBAND_RATE = 8000
+BROADBAND_RATE = 16000
+
+
+class AudioFormat(
+        namedtuple('AudioFormat',
+                   ['mime_type', 'rate', 'channels', 'sample_width',
+                    'little_endian'],
+                   defaults=[True])):
+    """
+    Description of an audio stream.
+
+    :attr str mime_type: The media type without parameters, e.g. `audio/l16`.
+    :attr int rate: Samples per second, or `None` if unknown.
+    :attr int channels: Number of interleaved channels.
+    :attr int sample_width: Bytes per sample for uncompressed audio, or `None`
+          for compressed audio.
+    :attr bool little_endian: Byte order of uncompressed samples. The service
+          detects the byte order of `audio/l16` itself, so it is assumed to be
+          little-endian unless `endianness=big-endian` is given.
+    """
+
+    __slots__ = ()
+
+    @property
+    def is_pcm(self):
+        """`True` if the audio is uncompressed linear PCM."""
+        return self.mime_type in ('audio/l16', 'audio/wav') and \
+            self.sample_width == 2
+
+    @property
+    def frame_size(self):
+        """Bytes per sample frame (all channels), or `None` if unknown."""
+        if self.sample_width is None:
+            return None
+        return self.sample_width * self.channels
+
+    @property
+    def bytes_per_second(self):
+        """Bytes per second of audio, or `None` if it cannot be derived."""
+        if self.rate is None or self.frame_size is None:
+            return None
+        return self.rate * self.frame_size
+
+
+def parse_content_type(content_type):
+    """
+    Derives an `AudioFormat` from a Speech to Text `Content-Type` value such as
+    `audio/l16;rate=16000;channels=2` or `audio/mulaw;rate=8000`.
+
+    :param str content_type: The content type of the audio.
+    :rtype: AudioFormat
+    """
+    parts = [part.strip() for part in content_type.split(';')]
+    mime_type = parts[0].lower()
+    params = {}
+    for part in parts[1:]:
+        if '=' in part:
+            key, value = part.split('=', 1)
+            params[key.strip().lower()] = value.strip()
+
+    rate = int(params['rate']) if 'rate' in params else None
+    channels = int(params.get('channels', 1))
+    if mime_type == 'audio/l16':
+        sample_width = 2
+    elif mime_type in ('audio/mulaw', 'audio/alaw'):
+        sample_width = 1
+    elif mime_type == 'audio/basic':
+        rate, sample_width = 8000, 1
+    else:
+        sample_width = None
+    little_endian = params.get('endianness', 'little-endian') != 'big-endian'
+    return AudioFormat(mime_type, rate, channels, sample_width, little_endian)
+
+
+def read_wav_header(data):
+    """
+    Parses the RIFF header of a WAV file.
+
+    :param bytes data: The beginning of the file, including the `fmt ` chunk.
+    :return: A tuple of the `AudioFormat` and the byte offset and length of the
+             `data` chunk. The length is `None` if the `data` chunk header was
+             not found in `data`.
+    :rtype: tuple
+    """
+    if len(data) < 12 or data[0:4] != b'RIFF' or data[8:12] != b'WAVE':
+        raise ValueError('audio is not a RIFF/WAVE file')
+    offset = 12
+    audio_format = None
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        chunk_size = struct.unpack('<I', data[offset + 4:offset + 8])[0]
+        body = offset + 8
+        if chunk_id == b'fmt ':
+            format_tag, channels, rate = struct.unpack('<HHI',
+                                                       data[body:body + 8])
+            bits = struct.unpack('<H', data[body + 14:body + 16])[0]
+            sample_width = bits // 8 \
+                if format_tag in (WAV_FORMAT_PCM, WAV_FORMAT_EXTENSIBLE) else None
+            audio_format = AudioFormat('audio/wav', rate, channels, sample_width)
+        elif chunk_id == b'data':
+            if audio_format is None:
+                break
+            return audio_format, body, chunk_size
+        offset = body + chunk_size + (chunk_size & 1)
+    if audio_format is None:
+        raise ValueError('WAV header has no fmt chunk')
+    return audio_format, offset, None
+
+
+def peek_audio_format(content_type, stream=None):
+    """
+    Determines the `AudioFormat` of a stream, reading the header of a seekable
+    WAV stream without consuming it.
+
+    :param str content_type: The content type of the audio.
+    :param stream: (optional) A file-like object positioned at the start of the
+           audio.
+    :rtype: AudioFormat
+    """
+    audio_format = parse_content_type(content_type)
+    if audio_format.mime_type == 'audio/wav' and stream is not None \
+            and hasattr(stream, 'seekable') and stream.seekable():
+        position = stream.tell()
+        try:
+            audio_format = read_wav_header(stream.read(4096))[0]
+        except (ValueError, struct.error):
+            pass
+        finally:
+            stream.seek(position)
+    return audio_format
+
+
+def read_pcm(audio, content_type):
+    """
+    Returns the `AudioFormat` and raw samples of 16-bit PCM audio.
+
+    :param bytes audio: `audio/wav` or `audio/l16` audio.
+    :param str content_type: The content type of the audio.
+    :return: A tuple of the `AudioFormat` and the sample data.
+    :rtype: tuple
+    """
+    audio_format = parse_content_type(content_type)
+    if audio_format.mime_type == 'audio/wav':
+        audio_format, offset, length = read_wav_header(audio)
+        end = offset + length if length is not None else len(audio)
+        audio = audio[offset:end]
+    if not audio_format.is_pcm or audio_format.rate is None:
+        raise ValueError(
+            'only 16-bit PCM audio (audio/wav or audio/l16 with a rate) is '
+            'supported, not {0}'.format(content_type))
+    return audio_format, audio
+
+
+def pcm_to_wav(data, audio_format):
+    """
+    Wraps raw 16-bit PCM samples in a WAV header.
+
+    :param bytes data: The samples.
+    :param AudioFormat audio_format: The format of the samples.
+    :rtype: bytes
+    """
+    if not audio_format.little_endian:
+        data = _swap_bytes(data)
+    output = io.BytesIO()
+    with wave.open(output, 'wb') as wav:
+        wav.setnchannels(audio_format.channels)
+        wav.setsampwidth(audio_format.sample_width)
+        wav.setframerate(audio_format.rate)
+        wav.writeframes(data)
+    return output.getvalue()
+
+
+def _swap_bytes(data):
+    samples = array('h', data)
+    samples.byteswap()
+    return samples.tobytes()
+
+
+def pcm_samples(data, audio_format):
+    """
+    Returns 16-bit PCM data as an `array` of native integers.
+    """
+    samples = array('h', data[:len(data) - len(data) % 2])
+    if audio_format.little_endian != (sys.byteorder == 'little'):
+        samples.byteswap()
+    return samples
+
+
+def frame_energies(data, audio_format, frame_duration):
+    """
+    Returns the mean square amplitude of consecutive frames of 16-bit PCM
+    audio, across all channels. A trailing partial frame is included.
+
+    :param bytes data: The samples.
+    :param AudioFormat audio_format: The format of the samples.
+    :param float frame_duration: Length of a frame in seconds.
+    :rtype: list
+    """
+    samples = pcm_samples(data, audio_format)
+    frame_length = max(1, int(audio_format.rate * frame_duration)) * \
+        audio_format.channels
+    if numpy is not None:
+        values = numpy.frombuffer(samples.tobytes(), dtype=numpy.int16)
+        values = values.astype(numpy.float64)**2
+        whole = len(values) // frame_length * frame_length
+        energies = values[:whole].reshape(-1, frame_length).mean(axis=1)
+        energies = energies.tolist()
+        if whole < len(values):
+            energies.append(float(values[whole:].mean()))
+        return energies
+    energies = []
+    for start in range(0, len(samples), frame_length):
+        frame = samples[start:start + frame_length]
+        energies.append(sum(sample * sample for sample in frame) / len(frame))
+    return energies
+
+
+def split_pcm(data,
+              audio_format,
+              window,
+              overlap=0.0,
+              search=0.0,
+              frame_duration=0.02):
+    """
+    Plans how to split PCM audio into pieces of about `window` seconds.
+
+    Each cut is placed at the quietest frame within `search` seconds before the
+    nominal window end, and consecutive pieces overlap by `overlap` seconds
+    centred on the cut.
+
+    :param bytes data: The samples.
+    :param AudioFormat audio_format: The format of the samples.
+    :param float window: Nominal length of a piece in seconds.
+    :param float overlap: Seconds shared by consecutive pieces.
+    :param float search: Seconds before each nominal cut to search for silence.
+    :param float frame_duration: Resolution of the silence search in seconds.
+    :return: A list of `(start, end)` byte offsets into `data`.
+    :rtype: list
+    """
+    frame_size = audio_format.frame_size
+    bytes_per_second = audio_format.bytes_per_second
+
+    def to_bytes(seconds):
+        return int(seconds * bytes_per_second) // frame_size * frame_size
+
+    window_bytes = max(frame_size, to_bytes(window))
+    half_overlap = to_bytes(overlap / 2)
+    search_bytes = min(to_bytes(search), window_bytes // 2)
+    energy_frame = max(frame_size, to_bytes(frame_duration))
+
+    cuts = []
+    position = 0
+    while position + window_bytes < len(data):
+        cut = position + window_bytes
+        if search_bytes:
+            region_start = cut - search_bytes
+            energies = frame_energies(data[region_start:cut], audio_format,
+                                      frame_duration)
+            quietest = min(range(len(energies)), key=energies.__getitem__)
+            cut = region_start + quietest * energy_frame
+        cuts.append(cut)
+        position = cut
+
+    bounds = [0] + cuts + [len(data)]
+    return [(max(0, bounds[i] - half_overlap if i else 0),
+             min(len(data), bounds[i + 1] + half_overlap))
+            for i in range(len(bounds) - 1)]
+
+
+def model_sample_rate(model=None):
+    """
+    Returns the sampling rate a Speech to Text model works at: 8 kHz for
+    narrowband and telephony models, 16 kHz for the others. The service
+    default model, `en-US_BroadbandModel`, is used when `model` is `None`.
+
+    :param str model: The model name, e.g. `en-US_Telephony`.
+    :rtype: int
+    """
+    if model and ('Narrowband' in model or 'Telephony' in model):
+        return NARROWBAND_RATE
+    return BROADBAND_RATE
+
+
+def l16_content_type(rate, channels=1):
+    """Returns the content type of little-endian 16-bit PCM audio."""
+    return 'audio/l16;rate={0};channels={1};endianness=little-endian'.format(
+        rate, channels)
+
+
+class PcmConverter(object):
+    """
+    Downmixes and downsamples a stream of 16-bit PCM audio.
+
+    Each output sample is the mean of the input samples it covers, which also
+    acts as the low-pass filter needed before decimation. Audio is never
+    upsampled. Uses numpy when it is installed. The output is little-endian.
+
+    :param AudioFormat audio_format: The format of the input.
+    :param int target_rate: (optional) The sampling rate to convert to.
+    :param bool downmix: (optional) Mix all channels down to mono.
+    """
+
+    def __init__(self, audio_format, target_rate=None, downmix=True):
+        self.input_format = audio_format
+        self.channels = 1 if downmix else audio_format.channels
+        self.rate = audio_format.rate
+        if target_rate is not None and target_rate < audio_format.rate:
+            if self.channels != 1:
+                raise ValueError('only mono audio can be downsampled')
+            self.rate = target_rate
+        self._pending = b''
+        self._buffer = []
+        self._buffer_start = 0
+        self._next = 0
+
+    @property
+    def output_format(self):
+        """The `AudioFormat` of the converted audio."""
+        return AudioFormat('audio/l16', self.rate, self.channels, 2, True)
+
+    @property
+    def content_type(self):
+        """The content type of the converted audio."""
+        return l16_content_type(self.rate, self.channels)
+
+    @property
+    def is_identity(self):
+        """`True` if the conversion leaves the audio unchanged."""
+        return self.rate == self.input_format.rate and \
+            self.channels == self.input_format.channels and \
+            self.input_format.little_endian
+
+    def convert(self, data):
+        """
+        Converts the next chunk of the stream. Chunks do not need to end on a
+        sample boundary.
+
+        :param bytes data: Input audio.
+        :return: Converted audio. May be empty.
+        :rtype: bytes
+        """
+        data = self._pending + data
+        usable = len(data) - len(data) % self.input_format.frame_size
+        self._pending = data[usable:]
+        samples = pcm_samples(data[:usable], self.input_format)
+        return self._to_bytes(self._resample(self._downmix(samples)))
+
+    def flush(self):
+        """
+        Converts what remains buffered at the end of the stream.
+
+        :rtype: bytes
+        """
+        tail = self._buffer
+        self._buffer = []
+        if not len(tail):
+            return b''
+        return self._to_bytes([sum(tail) / float(len(tail))])
+
+    def _downmix(self, samples):
+        channels = self.input_format.channels
+        if self.channels == channels:
+            return samples
+        if numpy is not None:
+            return numpy.frombuffer(samples.tobytes(), dtype=numpy.int16) \
+                .reshape(-1, channels).mean(axis=1)
+        return [
+            sum(samples[i:i + channels]) / float(channels)
+            for i in range(0, len(samples), channels)
+        ]
+
+    def _resample(self, samples):
+        if self.rate == self.input_format.rate:
+            return samples
+        in_rate, out_rate = self.input_format.rate, self.rate
+        if numpy is not None:
+            buffer = numpy.concatenate(
+                (numpy.asarray(self._buffer, dtype=numpy.float64),
+                 numpy.asarray(samples, dtype=numpy.float64)))
+        else:
+            buffer = list(self._buffer) + list(samples)
+        end = self._buffer_start + len(buffer)
+        # output i averages input [i * in // out, (i + 1) * in // out)
+        last = ((end + 1) * out_rate - 1) // in_rate - 1
+        if last < self._next:
+            self._buffer = buffer
+            return []
+        if numpy is not None:
+            bounds = numpy.arange(self._next, last + 2,
+                                  dtype=numpy.int64) * in_rate // out_rate - \
+                self._buffer_start
+            sums = numpy.concatenate(([0.0], numpy.cumsum(buffer)))
+            output = (sums[bounds[1:]] - sums[bounds[:-1]]) / \
+                (bounds[1:] - bounds[:-1])
+        else:
+            bounds = [
+                i * in_rate // out_rate - self._buffer_start
+                for i in range(self._next, last + 2)
+            ]
+            sums = [0.0] + list(accumulate(buffer))
+            output = [(sums[b] - sums[a]) / (b - a)
+                      for a, b in zip(bounds, bounds[1:])]
+        consumed = bounds[-1]
+        self._buffer = buffer[consumed:]
+        self._buffer_start += int(consumed)
+        self._next = last + 1
+        return output
+
+    @staticmethod
+    def _to_bytes(samples):
+        if numpy is not None:
+            output = numpy.clip(numpy.rint(numpy.asarray(samples)), -32768,
+                                32767).astype('<i2')
+            return output.tobytes()
+        output = array('h', [
+            max(-32768, min(32767, int(round(sample)))) for sample in samples
+        ])
+        if sys.byteorder != 'little':
+            output.byteswap()
+        return output.tobytes()
+
+
+class TimeMap(object):
+    """
+    Maps times in audio from which silence was removed back to the original
+    recording. Safe to read while it is being extended from another thread.
+    """
+
+    def __init__(self):
+        self._points = [(0.0, 0.0)]
+
+    def add(self, output_time, original_time):
+        """
+        Records that audio at `output_time` in the trimmed audio was at
+        `original_time` in the original recording.
+        """
+        self._points.append((output_time, original_time))
+
+    def to_original(self, seconds):
+        """
+        Maps a time in seconds in the trimmed audio to the original recording.
+
+        :rtype: float
+        """
+        points = self._points
+        output_time, original_time = points[
+            bisect_right(points, (seconds, float('inf'))) - 1]
+        return round(original_time + seconds - output_time, 2)
+
+
+class SilenceTrimmer(object):
+    """
+    Shortens long silent spans in a stream of 16-bit PCM audio.
+
+    The audio is split into frames, and a frame is silent when its energy is
+    below `threshold`. A silent span longer than `min_silence` seconds is cut
+    down to `keep_silence` seconds, half taken from each end of the span.
+    Shorter spans are left alone. `time_map` records where the removed spans
+    were, so that times in results can be mapped back to the original audio.
+    Only silence is detected; music or noise is kept.
+
+    :param AudioFormat audio_format: The format of the audio.
+    :param float threshold: (optional) Level in dBFS below which a frame is
+           silent.
+    :param float min_silence: (optional) Shortest silent span, in seconds, that
+           is shortened.
+    :param float keep_silence: (optional) Seconds of silence left in place of a
+           removed span.
+    :param float frame_duration: (optional) Length of a frame in seconds.
+    """
+
+    def __init__(self,
+                 audio_format,
+                 threshold=-45.0,
+                 min_silence=1.0,
+                 keep_silence=0.3,
+                 frame_duration=0.02):
+        self.audio_format = audio_format
+        self.frame_duration = frame_duration
+        frame_length = max(1, int(audio_format.rate * frame_duration))
+        self._frame_bytes = frame_length * audio_format.frame_size
+        self._frame_seconds = frame_length / float(audio_format.rate)
+        self._threshold = (32768 * 10**(threshold / 20.0))**2
+        keep_frames = int(round(keep_silence / self._frame_seconds))
+        # frames kept from the start and from the end of a shortened span
+        self._head_frames = keep_frames // 2
+        self._tail_frames = keep_frames - self._head_frames
+        self._min_frames = max(keep_frames,
+                               int(round(min_silence / self._frame_seconds)))
+        self._pending = b''
+        self._held = deque()
+        self._run = 0
+        self._dropped = 0
+        self._input_frames = 0
+        self._output_frames = 0
+        self._lock = threading.Lock()
+        self.time_map = TimeMap()
+
+    def convert(self, data):
+        """
+        Trims the next chunk of the stream.
+
+        :param bytes data: Input audio.
+        :return: The audio to keep. May be empty.
+        :rtype: bytes
+        """
+        with self._lock:
+            data = self._pending + data
+            usable = len(data) - len(data) % self._frame_bytes
+            self._pending = data[usable:]
+            energies = frame_energies(data[:usable], self.audio_format,
+                                      self.frame_duration)
+            output = []
+            for i, energy in enumerate(energies):
+                frame = data[i * self._frame_bytes:(i + 1) * self._frame_bytes]
+                if energy < self._threshold:
+                    self._silent_frame(frame, output)
+                else:
+                    self._end_silence(output)
+                    self._emit(frame, output)
+                self._input_frames += 1
+            return b''.join(output)
+
+    def flush(self):
+        """
+        Returns what remains buffered at the end of the stream.
+
+        :rtype: bytes
+        """
+        with self._lock:
+            output = []
+            self._end_silence(output)
+            output.append(self._pending)
+            self._pending = b''
+            return b''.join(output)
+
+    def _emit(self, frame, output):
+        output.append(frame)
+        self._output_frames += 1
+
+    def _silent_frame(self, frame, output):
+        self._run += 1
+        if self._run <= self._head_frames:
+            self._emit(frame, output)
+            return
+        self._held.append(frame)
+        if self._run > self._min_frames:
+            # the span is long enough to shorten: only keep its last frames
+            while len(self._held) > self._tail_frames:
+                self._held.popleft()
+                self._dropped += 1
+
+    def _end_silence(self, output):
+        if self._dropped:
+            resumed_at = self._input_frames - len(self._held)
+            self.time_map.add(self._output_frames * self._frame_seconds,
+                              resumed_at * self._frame_seconds)
+        while self._held:
+            self._emit(self._held.popleft(), output)
+        self._run = 0
+        self._dropped = 0
+
+
+class AudioPipeline(object):
+    """
+    Chains streaming audio stages, such as a `PcmConverter` followed by a
+    `SilenceTrimmer`.
+
+    :attr str content_type: The content type of the output.
+    :attr TimeMap time_map: Maps output times to the input, or `None` if no
+          audio is removed.
+    """
+
+    def __init__(self, stages, content_type, time_map=None):
+        self.stages = stages
+        self.content_type = content_type
+        self.time_map = time_map
+
+    def convert(self, data):
+        """Passes the next chunk of the stream through every stage."""
+        for stage in self.stages:
+            data = stage.convert(data)
+        return data
+
+    def flush(self):
+        """Flushes every stage at the end of the stream."""
+        data = b''
+        for stage in self.stages:
+            data = stage.convert(data) + stage.flush()
+        return data
+
+
+class AudioPreprocessor(object):
+    """
+    Reduces 16-bit PCM audio to what a Speech to Text model needs before it is
+    uploaded: the model's sampling rate (8 kHz for narrowband and telephony
+    models, 16 kHz otherwise) and one channel, optionally encoded as FLAC.
+    Long silent spans can also be shortened; see `SilenceTrimmer`. Other audio
+    formats are passed through unchanged.
+
+    :param int target_rate: (optional) Sampling rate to downsample to. By
+           default it is derived from the model of the request.
+    :param bool downmix: (optional) Mix all channels down to mono.
+    :param str encoding: (optional) `flac` to encode whole recordings as FLAC,
+           which needs the `soundfile` and `numpy` packages. Streamed audio is
+           always sent as `audio/l16`.
+    :param bool trim_silence: (optional) Shorten long silent spans.
+    :param float silence_threshold: (optional) Level in dBFS below which audio
+           is silent.
+    :param float min_silence: (optional) Shortest silent span, in seconds, that
+           is shortened.
+    :param float keep_silence: (optional) Seconds of silence left in place of a
+           shortened span.
+    """
+
+    def __init__(self,
+                 target_rate=None,
+                 downmix=True,
+                 encoding=None,
+                 trim_silence=False,
+                 silence_threshold=-45.0,
+                 min_silence=1.0,
+                 keep_silence=0.3):
+        if encoding not in (None, 'flac'):
+            raise ValueError('encoding must be None or "flac"')
+        if encoding == 'flac' and (soundfile is None or numpy is None):
+            raise ImportError(
+                'FLAC encoding requires the soundfile and numpy packages')
+        self.target_rate = target_rate
+        self.downmix = downmix
+        self.encoding = encoding
+        self.trim_silence = trim_silence
+        self.silence_threshold = silence_threshold
+        self.min_silence = min_silence
+        self.keep_silence = keep_silence
+
+    def _pipeline(self, audio_format, content_type, model, convert_always):
+        stages = []
+        converter = PcmConverter(audio_format,
+                                 self.target_rate or model_sample_rate(model),
+                                 self.downmix)
+        if convert_always or not converter.is_identity:
+            stages.append(converter)
+            audio_format = converter.output_format
+            content_type = converter.content_type
+        time_map = None
+        if self.trim_silence:
+            trimmer = SilenceTrimmer(audio_format, self.silence_threshold,
+                                     self.min_silence, self.keep_silence)
+            stages.append(trimmer)
+            time_map = trimmer.time_map
+        return AudioPipeline(stages, content_type, time_map)
+
+    def converter(self, content_type, model=None):
+        """
+        Returns an `AudioPipeline` for streaming audio of `content_type`, or
+        `None` if the audio does not need to be, or cannot be, converted.
+        """
+        audio_format = parse_content_type(content_type)
+        if not audio_format.is_pcm or audio_format.rate is None:
+            return None
+        pipeline = self._pipeline(audio_format, content_type, model, False)
+        return pipeline if pipeline.stages else None
+
+    def process(self, audio, content_type, model=None):
+        """
+        Converts a whole recording.
+
+        :param bytes audio: The audio.
+        :param str content_type: The content type of the audio.
+        :param str model: (optional) The model the audio is recognized with.
+        :return: The audio to send, its content type and a `TimeMap` from the
+                 audio sent to the original, or `None` if no audio was removed.
+        :rtype: tuple
+        """
+        try:
+            audio_format, data = read_pcm(audio, content_type)
+        except ValueError:
+            return audio, content_type, None
+        pipeline = self._pipeline(audio_format, content_type, model, True)
+        converter = pipeline.stages[0]
+        if converter.is_identity and len(pipeline.stages) == 1 and \
+                self.encoding is None:
+            return audio, content_type, None
+        data = pipeline.convert(data) + pipeline.flush()
+        if self.encoding == 'flac':
+            output = io.BytesIO()
+            samples = numpy.frombuffer(data, dtype='<i2').reshape(
+                -1, converter.channels)
+            soundfile.write(output, samples, converter.rate, format='FLAC',
+                            subtype='PCM_16')
+            return output.getvalue(), 'audio/flac', pipeline.time_map
+        return data, pipeline.content_type, pipeline.time_map
@@ -0,0 +1,193 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Chunked, concurrent bulk classification shared by AssistantV1 and
+AssistantV2.
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from ibm_cloud_sdk_core import ApiException
+
+from .common import retry_delay
+
+# Maximum number of utterances the service classifies in one request
+MAX_BULK_CLASSIFY_UTTERANCES = 50
+
+
+class BulkClassifyStats(object):
+    """
+    Progress and throughput of a `bulk_classify_all` run, updated as the
+    results are yielded.
+
+    :attr int utterances: Number of utterances classified.
+    :attr int requests: Number of requests that succeeded.
+    :attr int retries: Number of requests retried after being rate limited.
+    :attr float elapsed: Seconds since the run started.
+    """
+
+    def __init__(self):
+        self.utterances = 0
+        self.requests = 0
+        self.retries = 0
+        self.started_at = None
+        self.elapsed = 0.0
+
+    @property
+    def utterances_per_second(self) -> float:
+        """Number of utterances classified per second."""
+        if not self.elapsed:
+            return 0.0
+        return self.utterances / self.elapsed
+
+    def _start(self):
+        self.started_at = time.monotonic()
+
+    def _record(self, outputs, retries):
+        self.utterances += len(outputs)
+        self.requests += 1
+        self.retries += retries
+        self.elapsed = time.monotonic() - self.started_at
+
+
+def _chunks(utterances, chunk_size):
+    iterator = iter(utterances)
+    while True:
+        chunk = [{
+            'text': utterance
+        } if isinstance(utterance, str) else utterance
+                 for utterance in islice(iterator, chunk_size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def _validate(chunk_size, max_workers):
+    if not 1 <= chunk_size <= MAX_BULK_CLASSIFY_UTTERANCES:
+        raise ValueError('chunk_size must be between 1 and {0}'.format(
+            MAX_BULK_CLASSIFY_UTTERANCES))
+    if max_workers < 1:
+        raise ValueError('max_workers must be at least 1')
+
+
+def _classify_chunk(classify, chunk, max_retries):
+    attempt = 0
+    while True:
+        try:
+            result = classify(chunk).get_result()
+            return result.get('output', []), attempt
+        except ApiException as error:
+            if error.status_code != 429 or attempt >= max_retries:
+                raise
+            time.sleep(retry_delay(error, attempt))
+            attempt += 1
+
+
+def bulk_classify_all(classify,
+                      utterances,
+                      output_class,
+                      chunk_size=MAX_BULK_CLASSIFY_UTTERANCES,
+                      max_workers=4,
+                      max_retries=5,
+                      stats=None):
+    """
+    Classifies any number of utterances with `classify`, a function that
+    sends one `bulk_classify` request for a list of utterances, and yields
+    the `output_class` objects in input order. See
+    `AssistantV2.bulk_classify_all`.
+    """
+    _validate(chunk_size, max_workers)
+    stats = stats if stats is not None else BulkClassifyStats()
+    stats._start()  # pylint: disable=protected-access
+    chunks = _chunks(utterances, chunk_size)
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            while True:
+                # Keep a bounded number of chunks in flight, so the input is
+                # read and the results are kept only as far as needed.
+                while len(pending) < 2 * max_workers:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    pending.append(
+                        executor.submit(_classify_chunk, classify, chunk,
+                                        max_retries))
+                if not pending:
+                    return
+                outputs, retries = pending.popleft().result()
+                stats._record(outputs, retries)  # pylint: disable=protected-access
+                for output in outputs:
+                    yield output_class.from_dict(output)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def _classify_chunk_async(classify, chunk, max_retries, semaphore):
+    attempt = 0
+    async with semaphore:
+        while True:
+            try:
+                result = (await classify(chunk)).get_result()
+                return result.get('output', []), attempt
+            except ApiException as error:
+                if error.status_code != 429 or attempt >= max_retries:
+                    raise
+                await asyncio.sleep(retry_delay(error, attempt))
+                attempt += 1
+
+
+async def bulk_classify_all_async(classify,
+                                  utterances,
+                                  output_class,
+                                  chunk_size=MAX_BULK_CLASSIFY_UTTERANCES,
+                                  max_workers=4,
+                                  max_retries=5,
+                                  stats=None):
+    """
+    asyncio counterpart of `bulk_classify_all` for a `classify` function
+    that returns a coroutine.
+    """
+    _validate(chunk_size, max_workers)
+    stats = stats if stats is not None else BulkClassifyStats()
+    stats._start()  # pylint: disable=protected-access
+    chunks = _chunks(utterances, chunk_size)
+    semaphore = asyncio.Semaphore(max_workers)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < 2 * max_workers:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                pending.append(
+                    asyncio.ensure_future(
+                        _classify_chunk_async(classify, chunk, max_retries,
+                                              semaphore)))
+            if not pending:
+                return
+            outputs, retries = await pending.popleft()
+            stats._record(outputs, retries)  # pylint: disable=protected-access
+            for output in outputs:
+                yield output_class.from_dict(output)
+    finally:
+        for task in pending:
+            task.cancel()
@@ -16,8 +16,18 @@
 
 import platform
 import json
+import time
+from collections import namedtuple
 from .version import __version__
-from typing import Iterator
+from typing import AsyncIterator, Callable, Iterator, List, Optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
 
 SDK_ANALYTICS_HEADER = 'X-IBMCloud-SDK-Analytics'
 USER_AGENT_HEADER = 'User-Agent'
@@ -52,20 +62,254 @@ def get_sdk_headers(service_name, service_version, operation_id):
     return headers
 
 
-def parse_sse_stream_data(response) -> Iterator[dict]:
-    event_message = None  # Can be used in the future to return the event message to the user
-    data_json = None
+def default_json_decoder() -> Callable:
+    """
+    Returns the fastest available function that decodes JSON from `bytes` or
+    `str`: `orjson.loads` or `ujson.loads` when installed, else `json.loads`.
+    """
+    if orjson is not None:
+        return orjson.loads
+    if ujson is not None:
+        return ujson.loads
+    return json.loads
 
-    for chunk in response.iter_lines():
-        decoded_chunk = chunk.decode("utf-8")
 
-        if decoded_chunk.find("event", 0, len("event")) == 0:
-            event_message = decoded_chunk[len("event") + 2:]
-        elif decoded_chunk.find("data", 0, len("data")) == 0:
-            data_json_str = decoded_chunk[len("data") + 2:]
-            data_json = json.loads(data_json_str)
+json_decoder = default_json_decoder()
 
-        if event_message and data_json is not None:
-            yield data_json
-            event_message = None
-            data_json = None
+
+def set_json_decoder(decoder: Optional[Callable] = None) -> None:
+    """
+    Sets the function used to decode the JSON messages of websocket and
+    server-sent event streams. It must accept `bytes` and `str` and raise
+    `ValueError` for invalid input. Pass `None` to restore the default.
+    """
+    global json_decoder
+    json_decoder = decoder or default_json_decoder()
+
+
+def decode_json(data):
+    """Decodes a JSON message from `bytes` or `str` with `json_decoder`."""
+    return json_decoder(data)
+
+
+# Seconds to wait before the first retry of a failed request
+RETRY_BASE_DELAY = 1
+# Maximum number of seconds to wait before retrying a failed request
+MAX_RETRY_DELAY = 30
+
+
+def retry_delay(error, attempt: int) -> float:
+    """
+    Returns the seconds to wait before retrying a failed request: the
+    `Retry-After` header of the response if it has one, else an exponential
+    backoff.
+    """
+    http_response = getattr(error, 'http_response', None)
+    if http_response is not None:
+        retry_after = http_response.headers.get('Retry-After')
+        if retry_after is not None and retry_after.strip().isdigit():
+            return min(int(retry_after), MAX_RETRY_DELAY)
+    return min(RETRY_BASE_DELAY * 2**attempt, MAX_RETRY_DELAY)
+
+
+ServerSentEvent = namedtuple('ServerSentEvent',
+                             ['event', 'data', 'id', 'retry'])
+ServerSentEvent.__doc__ = """
+A server-sent event. `data` holds the UTF-8 encoded data lines joined by
+newlines, `id` the last event ID seen in the stream and `retry` the last
+reconnection time in milliseconds, if any.
+"""
+
+
+class SSEParser(object):
+    """
+    Incremental parser for `text/event-stream` data as defined by the HTML
+    Living Standard.
+
+    Bytes are fed as they arrive, in chunks of any size, and complete events
+    are returned as soon as the blank line that ends them is received. Lines
+    may end with CRLF, LF or CR, and an event may carry several `data` lines.
+    Comments and unknown fields are ignored.
+    """
+
+    def __init__(self):
+        self.last_event_id = None
+        self.retry = None
+        self._buffer = b''
+        self._started = False
+        self._skip_lf = False
+        self._event = None
+        self._data = []
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        """
+        Parses the next chunk of the stream.
+
+        :return: The events completed by the chunk.
+        """
+        if not self._started and chunk:
+            self._started = True
+            if chunk.startswith(b'\xef\xbb\xbf'):
+                chunk = chunk[3:]
+        if self._skip_lf and chunk:
+            # the previous chunk ended with the CR of a CRLF pair
+            self._skip_lf = False
+            if chunk.startswith(b'\n'):
+                chunk = chunk[1:]
+        if chunk.endswith(b'\r'):
+            self._skip_lf = True
+        lines = (self._buffer + chunk).splitlines(True)
+        self._buffer = b''
+        if lines and not lines[-1].endswith((b'\n', b'\r')):
+            self._buffer = lines.pop()
+        events = []
+        for line in lines:
+            event = self._process_line(line.rstrip(b'\r\n'))
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _process_line(self, line):
+        if not line:
+            return self._dispatch()
+        if line.startswith(b':'):
+            return None
+        field, _, value = line.partition(b':')
+        if value.startswith(b' '):
+            value = value[1:]
+        if field == b'data':
+            self._data.append(value)
+        elif field == b'event':
+            self._event = value.decode('utf-8')
+        elif field == b'id':
+            if b'\0' not in value:
+                self.last_event_id = value.decode('utf-8')
+        elif field == b'retry':
+            if value.isdigit():
+                self.retry = int(value)
+        return None
+
+    def _dispatch(self):
+        event, data = self._event, self._data
+        self._event, self._data = None, []
+        if not data:
+            return None
+        return ServerSentEvent(event or 'message', b'\n'.join(data),
+                               self.last_event_id, self.retry)
+
+
+class StreamMetrics(object):
+    """
+    Timing of a server-sent event stream, filled in as it is parsed.
+
+    :attr float first_event_latency: Seconds from the start of parsing to the
+          first event, or `None` before it arrives.
+    :attr int events: Number of events parsed.
+    :attr int bytes_received: Number of bytes read.
+    """
+
+    def __init__(self):
+        self.started_at = None
+        self.first_event_latency = None
+        self.events = 0
+        self.bytes_received = 0
+
+
+def iter_sse_events(response,
+                    chunk_size: Optional[int] = None,
+                    metrics: Optional[StreamMetrics] = None
+                   ) -> Iterator[ServerSentEvent]:
+    """
+    Parses the server-sent events of a streamed response as they arrive.
+
+    :param response: A `requests.Response`, ideally requested with
+           `stream=True`.
+    :param int chunk_size: (optional) Number of bytes to read at a time. By
+           default data is parsed as soon as it is received.
+    :param StreamMetrics metrics: (optional) Filled in while parsing.
+    :rtype: Iterator[ServerSentEvent]
+    """
+    parser = SSEParser()
+    if metrics is not None:
+        metrics.started_at = time.monotonic()
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        events = parser.feed(chunk)
+        if metrics is not None:
+            metrics.bytes_received += len(chunk)
+            if events and metrics.first_event_latency is None:
+                metrics.first_event_latency = time.monotonic() - \
+                    metrics.started_at
+            metrics.events += len(events)
+        for event in events:
+            yield event
+
+
+def parse_sse_stream_data(response,
+                          chunk_size: Optional[int] = None,
+                          decoder: Optional[Callable] = None,
+                          metrics: Optional[StreamMetrics] = None
+                         ) -> Iterator[dict]:
+    """
+    Parses a streamed response of server-sent events with JSON data, such as
+    the response of `AssistantV2.message_stream`, and yields the decoded data
+    of each event as it arrives. Events without data are skipped.
+
+    :param response: A `requests.Response`, ideally requested with
+           `stream=True`.
+    :param int chunk_size: (optional) Number of bytes to read at a time. By
+           default data is parsed as soon as it is received.
+    :param decoder: (optional) Function that decodes JSON from `bytes`.
+           Defaults to `decode_json`.
+    :param StreamMetrics metrics: (optional) Filled in while parsing.
+    :rtype: Iterator[dict]
+    """
+    decode = decoder or decode_json
+    for event in iter_sse_events(response, chunk_size, metrics):
+        if event.data:
+            yield decode(event.data)
+
+
+async def iter_sse_events_async(response,
+                                metrics: Optional[StreamMetrics] = None
+                               ) -> AsyncIterator[ServerSentEvent]:
+    """
+    asyncio counterpart of `iter_sse_events` for an `aiohttp.ClientResponse`,
+    such as the result of `AsyncAssistantV2.message_stream`.
+
+    :param response: An `aiohttp.ClientResponse`.
+    :param StreamMetrics metrics: (optional) Filled in while parsing.
+    :rtype: AsyncIterator[ServerSentEvent]
+    """
+    parser = SSEParser()
+    if metrics is not None:
+        metrics.started_at = time.monotonic()
+    async for chunk in response.content.iter_any():
+        events = parser.feed(chunk)
+        if metrics is not None:
+            metrics.bytes_received += len(chunk)
+            if events and metrics.first_event_latency is None:
+                metrics.first_event_latency = time.monotonic() - \
+                    metrics.started_at
+            metrics.events += len(events)
+        for event in events:
+            yield event
+
+
+async def parse_sse_stream_data_async(response,
+                                      decoder: Optional[Callable] = None,
+                                      metrics: Optional[StreamMetrics] = None
+                                     ) -> AsyncIterator[dict]:
+    """
+    asyncio counterpart of `parse_sse_stream_data` for an
+    `aiohttp.ClientResponse`.
+
+    :param response: An `aiohttp.ClientResponse`.
+    :param decoder: (optional) Function that decodes JSON from `bytes`.
+           Defaults to `decode_json`.
+    :param StreamMetrics metrics: (optional) Filled in while parsing.
+    :rtype: AsyncIterator[dict]
+    """
+    decode = decoder or decode_json
+    async for event in iter_sse_events_async(response, metrics):
+        if event.data:
+            yield decode(event.data)
@@ -0,0 +1,217 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# Levels of the `skills` section that are merged rather than replaced: the
+# skills, their variable containers and the variables in them
+SKILL_VARIABLE_DEPTH = 3
+
+
+def _merge(base, changes, depth):
+    if depth == 0 or not isinstance(base, dict) or \
+            not isinstance(changes, dict):
+        return changes
+    merged = dict(base)
+    for key, value in changes.items():
+        if key in base:
+            merged[key] = _merge(base[key], value, depth - 1)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _delta(base, context, depth):
+    if depth == 0 or not isinstance(base, dict) or \
+            not isinstance(context, dict):
+        return context
+    delta = {}
+    for key, value in context.items():
+        if key not in base:
+            delta[key] = value
+        elif base[key] != value:
+            changed = _delta(base[key], value, depth - 1)
+            if changed != {}:
+                delta[key] = changed
+    return delta
+
+
+def merge_context(base: Optional[Dict], changes: Optional[Dict]) -> Dict:
+    """
+    Merges changes into a conversation context without modifying either.
+
+    In the `skills` section of an `AssistantV2` context, single skill
+    variables are merged, so changing one variable leaves the others in
+    place. Every other top-level property, such as `global` or the variables
+    of an `AssistantV1` context, is replaced as a whole. Only the dictionaries
+    on the path to a change are copied.
+
+    :param dict base: The current context, or `None`.
+    :param dict changes: The properties to change, or `None`.
+    :rtype: dict
+    """
+    merged = dict(base or {})
+    for key, value in (changes or {}).items():
+        if key == 'skills' and key in merged:
+            merged[key] = _merge(merged[key], value, SKILL_VARIABLE_DEPTH)
+        else:
+            merged[key] = value
+    return merged
+
+
+def context_delta(base: Optional[Dict], context: Dict) -> Dict:
+    """
+    Returns the part of a context that differs from the context last known
+    to the service, for the stateful `AssistantV2.message`.
+
+    A stateful session keeps its context on the service, which merges the
+    context sent with a message into it. Skill variables that are unchanged
+    can therefore be left out, as can other top-level properties that are
+    unchanged. A variable that is missing from `context` is not removed from
+    the session.
+
+    **Note:** The stateless `AssistantV2.message_stateless` and
+    `AssistantV1.message` keep no context on the service, so they must always
+    be sent the whole context.
+
+    :param dict base: The context last returned by the service, or `None`.
+    :param dict context: The context the session should have.
+    :rtype: dict
+    """
+    if not base:
+        return dict(context)
+    delta = {}
+    for key, value in context.items():
+        if key not in base:
+            delta[key] = value
+        elif base[key] != value:
+            if key == 'skills':
+                value = _delta(base[key], value, SKILL_VARIABLE_DEPTH)
+            delta[key] = value
+    return delta
+
+
+class ContextStore(object):
+    """
+    Keeps the latest context of each conversation on the client, for
+    `AssistantV2.message_stateless` and `AssistantV1.message`, which are
+    sent the whole context on every turn, and for the stateful
+    `AssistantV2.message`, which only needs the changes.
+
+    Store the context of every response with `set`. For a stateless turn,
+    `request_context` returns the stored context with the application's
+    changes merged in, without copying the unchanged parts. For a stateful
+    turn, `request_delta` returns only the skill variables and other
+    properties that differ from the stored context.
+
+    Contexts close to the 100 KB limit compress well. Enable compression of
+    request bodies for a service with `set_enable_gzip_compression(True)`.
+
+    The store is thread safe. The least recently used conversations are
+    dropped once `max_conversations` are stored. Stored contexts are shared,
+    not copied, so do not modify them in place.
+
+    :param int max_conversations: (optional) Maximum number of conversations
+           to keep, or `None` for no limit.
+    """
+
+    def __init__(self, max_conversations: Optional[int] = 10000) -> None:
+        self.max_conversations = max_conversations
+        self._contexts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._contexts)
+
+    def __contains__(self, conversation_id):
+        return conversation_id in self._contexts
+
+    def get(self, conversation_id) -> Optional[Dict]:
+        """Returns the stored context of a conversation, or `None`."""
+        with self._lock:
+            context = self._contexts.get(conversation_id)
+            if context is not None:
+                self._contexts.move_to_end(conversation_id)
+            return context
+
+    def set(self, conversation_id, context: Optional[Dict]) -> None:
+        """
+        Stores the context returned by the service for a conversation. A
+        context of `None`, as returned when the context was not requested,
+        leaves the stored context unchanged.
+
+        :param conversation_id: Any hashable value that identifies the
+               conversation.
+        :param dict context: The context, as a `dict` or model.
+        """
+        if context is None:
+            return
+        if not isinstance(context, dict):
+            context = context.to_dict()
+        with self._lock:
+            self._contexts[conversation_id] = context
+            self._contexts.move_to_end(conversation_id)
+            if self.max_conversations is not None:
+                while len(self._contexts) > self.max_conversations:
+                    self._contexts.popitem(last=False)
+
+    def merge(self, conversation_id, changes: Optional[Dict]) -> Dict:
+        """
+        Merges changes into the stored context of a conversation, as
+        `merge_context` does, and stores the result.
+
+        :rtype: dict
+        """
+        with self._lock:
+            context = merge_context(self._contexts.get(conversation_id),
+                                    changes)
+        self.set(conversation_id, context)
+        return context
+
+    def remove(self, conversation_id) -> None:
+        """Forgets the context of a conversation."""
+        with self._lock:
+            self._contexts.pop(conversation_id, None)
+
+    def request_context(self,
+                        conversation_id,
+                        changes: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Returns the whole context to send with the next stateless message of
+        a conversation: the stored context with `changes` merged in.
+
+        :return: The context, or `None` for a new conversation without
+                 changes.
+        """
+        context = self.get(conversation_id)
+        if changes:
+            return merge_context(context, changes)
+        return context
+
+    def request_delta(self, conversation_id,
+                      context: Optional[Dict]) -> Optional[Dict]:
+        """
+        Returns the context to send with the next stateful message of a
+        conversation: the part of `context` that differs from the stored
+        context, as computed by `context_delta`.
+
+        :return: The context, or `None` if nothing changed.
+        """
+        if not context:
+            return None
+        return context_delta(self.get(conversation_id), context) or None
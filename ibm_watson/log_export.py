@@ -0,0 +1,455 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Export of assistant log events to compressed files.
+"""
+
+import datetime
+import json
+import os
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Union
+
+from dateutil import parser as date_parser
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from .pagination import CursorPager
+
+# Seconds a cursor stays usable after its page was received
+CURSOR_LIFETIME = 300
+# Top-level properties of the v1 and v2 `Log` models written to Parquet
+PARQUET_COLUMNS = [
+    'log_id', 'request_timestamp', 'response_timestamp', 'language',
+    'workspace_id', 'assistant_id', 'session_id', 'skill_id', 'snapshot',
+    'customer_id', 'request', 'response'
+]
+
+
+def _dumps(log) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(log)
+    return json.dumps(log, separators=(',', ':')).encode('utf-8')
+
+
+def _timestamp(value) -> str:
+    if isinstance(value, str):
+        value = date_parser.isoparse(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec='milliseconds') + 'Z'
+
+
+def time_slices(start: Union[str, datetime.datetime],
+                end: Union[str, datetime.datetime],
+                slices: int) -> List[tuple]:
+    """
+    Splits the time from `start` to `end` into `slices` ranges of equal
+    length.
+
+    :return: `(start, end)` pairs of timestamps in the format of the
+             `request_timestamp` filter, each range including its start and
+             excluding its end.
+    :rtype: list
+    """
+    if slices < 1:
+        raise ValueError('slices must be at least 1')
+    start = date_parser.isoparse(_timestamp(start)).replace(tzinfo=None)
+    end = date_parser.isoparse(_timestamp(end)).replace(tzinfo=None)
+    if end <= start:
+        raise ValueError('end must be after start')
+    step = (end - start) / slices
+    bounds = [start + step * i for i in range(slices)] + [end]
+    return [(_timestamp(bounds[i]), _timestamp(bounds[i + 1]))
+            for i in range(slices)]
+
+
+class NDJSONSink(object):
+    """
+    Writes log events to a gzip-compressed file with one JSON object per
+    line.
+
+    Each page is compressed into a gzip member of its own and appended to the
+    file, so no more than one page is held in memory and the file stays
+    readable by `gzip` tools after every page. On resume, the file is cut
+    back to the size recorded in the checkpoint, dropping the events written
+    after it.
+
+    :param str path: The file to write.
+    :param int compresslevel: (optional) The zlib compression level.
+    """
+
+    def __init__(self, path: str, compresslevel: int = 6) -> None:
+        self.path = path
+        self.compresslevel = compresslevel
+        self._file = open(path, 'ab')
+
+    def write(self, logs: List[Dict]) -> None:
+        """Appends log events to the file."""
+        if not logs:
+            return
+        compressor = zlib.compressobj(self.compresslevel, zlib.DEFLATED, 31)
+        data = compressor.compress(b'\n'.join(_dumps(log) for log in logs))
+        self._file.write(data + compressor.compress(b'\n') +
+                         compressor.flush())
+
+    def commit(self) -> Dict:
+        """Makes the events written so far durable and returns the state to
+        resume from."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return {'size': self._file.tell()}
+
+    def restore(self, state: Optional[Dict]) -> None:
+        """Drops the events written after `state` was committed, or all
+        events if `state` is `None`."""
+        size = state['size'] if state else 0
+        self._file.truncate(size)
+        self._file.seek(size)
+
+    def close(self) -> None:
+        """Closes the file."""
+        self._file.close()
+
+
+class ParquetSink(object):
+    """
+    Writes log events to Parquet files, in the columns listed in
+    `PARQUET_COLUMNS`. The `request` and `response` objects are stored as JSON
+    strings, so events of different shapes share one schema.
+
+    Events are buffered until `batch_size` are collected and written as one
+    row group. A file is complete only once it is closed, which happens on
+    every checkpoint: the files are named `<prefix>-<number>.parquet`, and on
+    resume files that were not complete at the checkpoint are deleted.
+
+    Requires `pyarrow`, which is installed with the `parquet` extra.
+
+    :param str prefix: The path of the files without the suffix.
+    :param int batch_size: (optional) Number of events in a row group.
+    """
+
+    def __init__(self, prefix: str, batch_size: int = 10000) -> None:
+        if pyarrow is None:
+            raise ImportError(
+                'Writing Parquet files requires pyarrow. Install it with '
+                '`pip install "ibm-watson[parquet]"`.')
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.files = []
+        self._schema = pyarrow.schema([(column, pyarrow.string())
+                                       for column in PARQUET_COLUMNS])
+        self._rows = []
+        self._writer = None
+
+    def write(self, logs: List[Dict]) -> None:
+        """Adds log events to the current file."""
+        for log in logs:
+            self._rows.append([
+                value if value is None or isinstance(value, str) else
+                _dumps(value).decode('utf-8')
+                for value in (log.get(column) for column in PARQUET_COLUMNS)
+            ])
+            if len(self._rows) >= self.batch_size:
+                self._flush()
+
+    def commit(self) -> Dict:
+        """Completes the current file and returns the state to resume
+        from."""
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        return {'files': list(self.files)}
+
+    def restore(self, state: Optional[Dict]) -> None:
+        """Deletes the files that were not complete when `state` was
+        committed, or all files if `state` is `None`."""
+        self.files = list(state['files']) if state else []
+        directory, name = os.path.split(self.prefix)
+        for entry in os.listdir(directory or '.'):
+            path = os.path.join(directory, entry)
+            if entry.startswith(name + '-') and entry.endswith('.parquet') \
+                    and path not in self.files:
+                os.remove(path)
+
+    def close(self) -> None:
+        """Completes the current file."""
+        self.commit()
+
+    def _flush(self):
+        if not self._rows:
+            return
+        if self._writer is None:
+            path = '{0}-{1:05d}.parquet'.format(self.prefix, len(self.files))
+            self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+            self.files.append(path)
+        columns = [list(column) for column in zip(*self._rows)]
+        self._writer.write_table(
+            pyarrow.Table.from_arrays(columns, schema=self._schema))
+        self._rows = []
+
+
+class LogExporter(object):
+    """
+    Exports the log events of a list method to gzip-compressed NDJSON or
+    Parquet files, without keeping more than a few pages in memory.
+
+    Pages are fetched with a `CursorPager`, sorted by `request_timestamp`,
+    and written as they arrive. The events are written as returned by the
+    service, without converting them to `Log` models. Each run writes its
+    files and a checkpoint to `directory`; a new exporter started on the same
+    directory resumes where the last one stopped. The checkpoint records the
+    cursor of the next page, which is followed while it is still valid, and
+    the `request_timestamp` of the last event written, which the export
+    otherwise restarts from.
+
+    With `slices` greater than one, the time from `start` to `end` is split
+    into ranges that are exported concurrently, each into its own files.
+
+        exporter = LogExporter(assistant.list_all_logs,
+                               'language::en,workspace_id::{0}'.format(id),
+                               'logs/')
+        exporter.export(start='2026-01-01', end='2026-02-01', slices=8)
+
+    :param list_logs: A list method that takes `filter`, `sort`, `page_limit`
+           and `cursor` keyword arguments, such as `AssistantV1.list_all_logs`,
+           or `functools.partial(assistant.list_logs, assistant_id)`.
+    :param str filter: (optional) The filter query of the events to export.
+    :param str directory: The directory the files and the checkpoint are
+           written to.
+    :param str format: (optional) `ndjson` or `parquet`.
+    :param int page_limit: (optional) The number of events in each page.
+    :param int checkpoint_interval: (optional) Number of events written
+           between checkpoints. A Parquet file is completed on each
+           checkpoint.
+    :param int max_retries: (optional) Number of times a failed request is
+           sent again.
+    :attr int exported: Number of events exported by all runs, as of the
+          last checkpoint.
+    """
+
+    CHECKPOINT_FILE = 'checkpoint.json'
+
+    def __init__(self,
+                 list_logs: Callable[..., DetailedResponse],
+                 filter: Optional[str],
+                 directory: str,
+                 *,
+                 format: str = 'ndjson',
+                 page_limit: int = 500,
+                 checkpoint_interval: int = 10000,
+                 max_retries: int = 5) -> None:
+        if format not in ('ndjson', 'parquet'):
+            raise ValueError('format must be ndjson or parquet')
+        if format == 'parquet' and pyarrow is None:
+            raise ImportError(
+                'Writing Parquet files requires pyarrow. Install it with '
+                '`pip install "ibm-watson[parquet]"`.')
+        self.list_logs = list_logs
+        self.filter = filter
+        self.directory = directory
+        self.format = format
+        self.page_limit = page_limit
+        self.checkpoint_interval = checkpoint_interval
+        self.max_retries = max_retries
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._checkpoint = self._load_checkpoint()
+
+    @property
+    def exported(self) -> int:
+        """Number of events exported, as of the last checkpoint."""
+        with self._lock:
+            return sum(state['exported']
+                       for state in self._checkpoint['slices'].values())
+
+    def export(self,
+               start: Optional[Union[str, datetime.datetime]] = None,
+               end: Optional[Union[str, datetime.datetime]] = None,
+               *,
+               slices: int = 1,
+               max_workers: Optional[int] = None) -> int:
+        """
+        Exports the events with a `request_timestamp` from `start` up to
+        `end`, or resumes the export started on the same directory.
+
+        :param start: (optional) The earliest `request_timestamp`, as a
+               `datetime` or ISO 8601 string.
+        :param end: (optional) The `request_timestamp` the events must be
+               earlier than.
+        :param int slices: (optional) Number of time ranges exported
+               concurrently. Requires `start` and `end`.
+        :param int max_workers: (optional) Number of time ranges exported at
+               the same time; by default all of them.
+        :return: The number of events exported by this call.
+        :rtype: int
+        """
+        if slices > 1:
+            if start is None or end is None:
+                raise ValueError('start and end must be provided with slices')
+            ranges = time_slices(start, end, slices)
+        else:
+            ranges = [(None if start is None else _timestamp(start),
+                       None if end is None else _timestamp(end))]
+        with self._lock:
+            plan = self._checkpoint.get('ranges')
+            if plan is None:
+                self._checkpoint['ranges'] = [list(r) for r in ranges]
+            elif plan != [list(r) for r in ranges]:
+                raise ValueError(
+                    'The directory holds an export of different time ranges')
+        before = self.exported
+        if len(ranges) == 1:
+            self._export_slice(0, ranges[0])
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers or
+                                    len(ranges)) as executor:
+                list(
+                    executor.map(self._export_slice, range(len(ranges)),
+                                 ranges))
+        return self.exported - before
+
+    def _slice_filter(self, time_range, since=None):
+        parts = [self.filter] if self.filter else []
+        start, end = time_range
+        if since is not None:
+            start = since if start is None else max(start, since)
+        if start is not None:
+            parts.append('request_timestamp>=' + start)
+        if end is not None:
+            parts.append('request_timestamp<' + end)
+        return ','.join(parts) or None
+
+    def _open_sink(self, index):
+        prefix = os.path.join(self.directory, 'logs-{0:03d}'.format(index))
+        if self.format == 'parquet':
+            return ParquetSink(prefix)
+        return NDJSONSink(prefix + '.ndjson.gz')
+
+    def _export_slice(self, index, time_range):
+        with self._lock:
+            state = self._checkpoint['slices'].get(str(index))
+        if state is not None and state['done']:
+            return
+        sink = self._open_sink(index)
+        try:
+            sink.restore(state['sink'] if state is not None else None)
+            if state is None:
+                state = {
+                    'filter': None,
+                    'cursor': None,
+                    'cursor_time': None,
+                    'request_timestamp': None,
+                    'boundary_ids': [],
+                    'exported': 0,
+                    'done': False,
+                    'sink': sink.commit()
+                }
+                self._save(index, state)
+            try:
+                self._write_pages(index, time_range, state, sink,
+                                  state['cursor'] is not None and
+                                  time.time() - state['cursor_time'] <
+                                  CURSOR_LIFETIME)
+            except ApiException as error:
+                # The cursor expired or was rejected, so start over from the
+                # last timestamp written.
+                if error.status_code != 400 or state['cursor'] is None:
+                    raise
+                self._write_pages(index, time_range, state, sink, False)
+        finally:
+            sink.close()
+
+    def _write_pages(self, index, time_range, state, sink, use_cursor):
+        # A cursor is only valid with the filter of the request it came from.
+        since = state['request_timestamp']
+        if use_cursor:
+            query = state['filter']
+        else:
+            query = self._slice_filter(time_range, since)
+            state['filter'] = query
+
+        def fetch(cursor):
+            return self.list_logs(filter=query,
+                                  sort='request_timestamp',
+                                  page_limit=self.page_limit,
+                                  cursor=cursor)
+
+        pager = CursorPager(fetch,
+                            'logs',
+                            cursor=state['cursor'] if use_cursor else None,
+                            max_retries=self.max_retries)
+        # Events at the timestamp restarted from were partly written already.
+        skip = set() if use_cursor else set(state['boundary_ids'])
+        unsaved = 0
+        for page in pager.iter_pages():
+            logs = [
+                log for log in page.get('logs', [])
+                if log.get('log_id') not in skip or
+                log.get('request_timestamp') != since
+            ]
+            sink.write(logs)
+            for log in logs:
+                timestamp = log.get('request_timestamp')
+                if timestamp != state['request_timestamp']:
+                    state['request_timestamp'] = timestamp
+                    state['boundary_ids'] = []
+                state['boundary_ids'].append(log.get('log_id'))
+            state['exported'] += len(logs)
+            unsaved += len(logs)
+            state['cursor'] = CursorPager._next_cursor(page)  # pylint: disable=protected-access
+            state['cursor_time'] = time.time()
+            if state['cursor'] is None or unsaved >= self.checkpoint_interval:
+                state['done'] = state['cursor'] is None
+                state['sink'] = sink.commit()
+                self._save(index, state)
+                unsaved = 0
+
+    def _load_checkpoint(self):
+        path = os.path.join(self.directory, self.CHECKPOINT_FILE)
+        if not os.path.exists(path):
+            return {'format': self.format, 'filter': self.filter, 'slices': {}}
+        with open(path, 'r', encoding='utf-8') as file:
+            checkpoint = json.load(file)
+        if checkpoint.get('format') != self.format or \
+                checkpoint.get('filter') != self.filter:
+            raise ValueError(
+                'The directory holds an export with a different format or '
+                'filter')
+        return checkpoint
+
+    def _save(self, index, state):
+        path = os.path.join(self.directory, self.CHECKPOINT_FILE)
+        with self._lock:
+            self._checkpoint['slices'][str(index)] = dict(state)
+            data = json.dumps(self._checkpoint, indent=2)
+            with open(path + '.tmp', 'w', encoding='utf-8') as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(path + '.tmp', path)
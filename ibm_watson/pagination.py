@@ -0,0 +1,238 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Iteration over the results of cursor-paginated list methods.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional
+
+import requests
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .common import retry_delay
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Whether a failed request can be sent again unchanged: it was rate limited
+    (HTTP 429), failed with a server error (HTTP 5xx) or lost its connection.
+    """
+    if isinstance(error, ApiException):
+        return error.status_code == 429 or error.status_code >= 500
+    if aiohttp is not None and isinstance(error, aiohttp.ClientError):
+        return True
+    return isinstance(error, (requests.exceptions.ConnectionError,
+                              requests.exceptions.Timeout,
+                              asyncio.TimeoutError))
+
+
+class CursorPager(object):
+    """
+    Iterates over the items of a cursor-paginated list method, following
+    `pagination.next_cursor` from page to page.
+
+    While the items of one page are consumed, the next page is fetched in a
+    background thread, so the wait for each request overlaps with the work
+    on the previous page and no cursor is left idle until it expires. Only
+    the current and the next page are held in memory. A request that fails
+    with HTTP 429 or 5xx, or loses its connection, is sent again with the
+    same cursor after the time given by its `Retry-After` header or an
+    exponential backoff. If it still fails, `cursor` holds the cursor of the
+    page that could not be fetched, and a new pager started from it resumes
+    the iteration within the cursor's lifetime.
+
+    :param fetch: A function that takes a cursor, `None` for the first page,
+           and returns the `DetailedResponse` of the list method.
+    :param str items_key: The property of the result that holds the items of
+           a page, such as `logs`.
+    :param item_class: (optional) A model class whose `from_dict` the items
+           are converted with. By default items are yielded as `dict`.
+    :param str cursor: (optional) The cursor of the page to start from.
+    :param bool prefetch: (optional) Whether to fetch the next page while the
+           current one is consumed.
+    :param int max_retries: (optional) Number of times a failed request is
+           sent again.
+    :attr str cursor: The cursor of the page being consumed or, after a
+          failure, of the page that could not be fetched. `None` stands for
+          the first page.
+    :attr int pages: Number of pages received.
+    :attr int retries: Number of requests sent again.
+    """
+
+    def __init__(self,
+                 fetch: Callable[[Optional[str]], DetailedResponse],
+                 items_key: str,
+                 item_class=None,
+                 cursor: Optional[str] = None,
+                 prefetch: bool = True,
+                 max_retries: int = 5) -> None:
+        self.items_key = items_key
+        self.item_class = item_class
+        self.cursor = cursor
+        self.prefetch = prefetch
+        self.max_retries = max_retries
+        self.pages = 0
+        self.retries = 0
+        self._fetch = fetch
+
+    def __iter__(self) -> Iterator:
+        for page in self.iter_pages():
+            for item in page.get(self.items_key, []):
+                if self.item_class is not None:
+                    item = self.item_class.from_dict(item)
+                yield item
+
+    def iter_pages(self) -> Iterator[Dict]:
+        """Yields the result of each page, as a `dict`."""
+        if not self.prefetch:
+            cursor = self.cursor
+            while True:
+                self.cursor = cursor
+                page = self._fetch_page(cursor)
+                yield page
+                cursor = self._next_cursor(page)
+                if cursor is None:
+                    return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            cursor = self.cursor
+            future = executor.submit(self._fetch_page, cursor)
+            try:
+                while future is not None:
+                    self.cursor = cursor
+                    page = future.result()
+                    cursor = self._next_cursor(page)
+                    future = None
+                    if cursor is not None:
+                        future = executor.submit(self._fetch_page, cursor)
+                    yield page
+            finally:
+                if future is not None:
+                    future.cancel()
+
+    def _fetch_page(self, cursor):
+        attempt = 0
+        while True:
+            try:
+                page = self._fetch(cursor).get_result()
+                self.pages += 1
+                return page
+            except Exception as error:  # pylint: disable=broad-except
+                if not is_retryable(error) or attempt >= self.max_retries:
+                    raise
+                time.sleep(retry_delay(error, attempt))
+                attempt += 1
+                self.retries += 1
+
+    @staticmethod
+    def _next_cursor(page):
+        pagination = page.get('pagination') or {}
+        return pagination.get('next_cursor') or None
+
+
+class AsyncCursorPager(CursorPager):
+    """
+    asyncio counterpart of `CursorPager`, for a `fetch` function that
+    returns a coroutine. Iterate over it with `async for`; the next page is
+    fetched in a task while the current one is consumed.
+    """
+
+    def __iter__(self):
+        raise TypeError('Iterate over an AsyncCursorPager with `async for`')
+
+    async def __aiter__(self) -> AsyncIterator:
+        async for page in self.iter_pages():
+            for item in page.get(self.items_key, []):
+                if self.item_class is not None:
+                    item = self.item_class.from_dict(item)
+                yield item
+
+    async def iter_pages(self) -> AsyncIterator[Dict]:
+        """Yields the result of each page, as a `dict`."""
+        cursor = self.cursor
+        task = asyncio.ensure_future(self._fetch_page(cursor))
+        try:
+            while task is not None:
+                self.cursor = cursor
+                page = await task
+                cursor = self._next_cursor(page)
+                task = None
+                if cursor is not None:
+                    fetch = self._fetch_page(cursor)
+                    if self.prefetch:
+                        task = asyncio.ensure_future(fetch)
+                    else:
+                        task = fetch
+                yield page
+        finally:
+            if isinstance(task, asyncio.Future):
+                task.cancel()
+            elif task is not None:
+                task.close()
+
+    async def _fetch_page(self, cursor):
+        attempt = 0
+        while True:
+            try:
+                page = (await self._fetch(cursor)).get_result()
+                self.pages += 1
+                return page
+            except Exception as error:  # pylint: disable=broad-except
+                if not is_retryable(error) or attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(retry_delay(error, attempt))
+                attempt += 1
+                self.retries += 1
+
+
+def paginate(list_method: Callable[..., DetailedResponse],
+             *args,
+             items_key: str,
+             item_class=None,
+             cursor: Optional[str] = None,
+             prefetch: bool = True,
+             max_retries: int = 5,
+             pager_class=CursorPager,
+             **kwargs) -> CursorPager:
+    """
+    Returns a pager that calls `list_method` with the given arguments and the
+    cursor of each page. Used by the `paginate` methods of the clients.
+
+    :param list_method: A list method that takes a `cursor`.
+    :param str items_key: The property of the result that holds the items of
+           a page.
+    :param pager_class: (optional) `CursorPager`, or `AsyncCursorPager` for a
+           list method that returns a coroutine.
+    :return: A pager that yields the items.
+    :rtype: CursorPager
+    """
+
+    def fetch(page_cursor):
+        return list_method(*args, cursor=page_cursor, **kwargs)
+
+    return pager_class(fetch,
+                       items_key,
+                       item_class,
+                       cursor=cursor,
+                       prefetch=prefetch,
+                       max_retries=max_retries)
@@ -0,0 +1,202 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from .common import decode_json
+
+SIGNATURE_HEADER = 'X-Callback-Signature'
+# Default limit on the size of a notification body
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+def callback_signature(user_secret, payload):
+    """
+    Computes the `X-Callback-Signature` value the service sends for a payload:
+    the base64-encoded HMAC-SHA1 of the payload keyed with the user secret.
+
+    :param str user_secret: The secret given to `register_callback`.
+    :param bytes payload: The challenge string or notification body.
+    :rtype: str
+    """
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
+    digest = hmac.new(user_secret.encode('utf-8'), payload,
+                      hashlib.sha1).digest()
+    return base64.b64encode(digest).decode('ascii')
+
+
+class RecognitionCallbackServer(object):
+    """
+    A small HTTP server that receives callback notifications for asynchronous
+    recognition jobs.
+
+    It answers the `challenge_string` request the service sends when the URL is
+    registered with `register_callback`, checks the `X-Callback-Signature` of
+    every request when a `user_secret` is given, and puts each notification
+    (for example a `recognitions.completed_with_results` event) on the
+    `notifications` queue. The server runs on a daemon thread; start it before
+    calling `register_callback` with a URL that reaches it.
+
+    :param str host: (optional) The interface to listen on. Only local
+           connections are accepted by default; pass `0.0.0.0` to listen on
+           all interfaces.
+    :param int port: (optional) The port to listen on. `0` picks a free port.
+    :param str user_secret: (optional) The `user_secret` used to register the
+           callback URL. Requests without a valid signature are rejected.
+    :param str path: (optional) Only requests to this path are handled.
+    :param int max_body_size: (optional) Notifications with a larger body, in
+           bytes, are rejected.
+    """
+
+    def __init__(self,
+                 host='127.0.0.1',
+                 port=0,
+                 user_secret=None,
+                 path='/',
+                 max_body_size=MAX_BODY_SIZE):
+        self.user_secret = user_secret
+        self.path = path
+        self.max_body_size = max_body_size
+        self.notifications = queue.Queue()
+        self._async_queues = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self._httpd = ThreadingHTTPServer((host, port),
+                                          self._make_handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def server_address(self):
+        """The `(host, port)` the server is bound to."""
+        return self._httpd.server_address
+
+    def start(self):
+        """Starts serving on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the server and closes its socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def async_queue(self):
+        """
+        Returns an `asyncio.Queue` on the running event loop that receives every
+        notification from now on, in addition to `notifications`.
+
+        :rtype: asyncio.Queue
+        """
+        loop = asyncio.get_running_loop()
+        async_queue = asyncio.Queue()
+        with self._lock:
+            self._async_queues.append((loop, async_queue))
+        return async_queue
+
+    def verify(self, payload, signature):
+        """
+        Checks the signature of a request. Always `True` without a user secret.
+        """
+        if self.user_secret is None:
+            return True
+        if signature is None:
+            return False
+        return hmac.compare_digest(
+            callback_signature(self.user_secret, payload), signature)
+
+    def dispatch(self, notification):
+        """Delivers a notification to the queues."""
+        self.notifications.put(notification)
+        with self._lock:
+            subscribers = list(self._async_queues)
+        for loop, async_queue in subscribers:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(async_queue.put_nowait, notification)
+
+    def _make_handler(self):
+        server = self
+
+        class CallbackHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != server.path:
+                    return self._reply(404)
+                challenge = parse_qs(url.query).get('challenge_string')
+                if not challenge:
+                    return self._reply(400)
+                if not server.verify(challenge[0],
+                                     self.headers.get(SIGNATURE_HEADER)):
+                    return self._reply(401)
+                return self._reply(200, challenge[0].encode('utf-8'))
+
+            def do_POST(self):
+                if urlparse(self.path).path != server.path:
+                    return self._reply(404)
+                try:
+                    length = int(self.headers['Content-Length'])
+                except (TypeError, ValueError):
+                    return self._reply(400)
+                if length < 0:
+                    return self._reply(400)
+                if length > server.max_body_size:
+                    self.close_connection = True
+                    return self._reply(413)
+                body = self.rfile.read(length)
+                if not server.verify(body, self.headers.get(SIGNATURE_HEADER)):
+                    return self._reply(401)
+                try:
+                    notification = decode_json(body)
+                except ValueError:
+                    return self._reply(400)
+                self._reply(200)
+                server.dispatch(notification)
+                return None
+
+            def _reply(self, status, body=b''):
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/plain')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format, *args)
+
+        return CallbackHandler
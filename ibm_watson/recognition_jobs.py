@@ -0,0 +1,164 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import Iterable, Iterator, Tuple
+
+from .common import retry_delay
+from .pagination import is_retryable
+from .speech_to_text_v1 import RecognitionJob
+
+# `check_jobs` reports on the latest 100 outstanding jobs only
+CHECK_JOBS_LIMIT = 100
+FINISHED_STATUSES = (RecognitionJob.StatusEnum.COMPLETED,
+                     RecognitionJob.StatusEnum.FAILED)
+
+
+class RecognitionJobManager(object):
+    """
+    Runs many asynchronous recognition jobs, keeping a bounded number of them
+    in flight.
+
+    All in-flight jobs are polled with a single `check_jobs` call per interval;
+    `check_job` is only called to fetch the results of jobs that have finished.
+    The interval starts at `min_interval`, is reset whenever a job finishes and
+    otherwise grows by `backoff` up to `max_interval`. Requests that are rate
+    limited, fail with HTTP 5xx or lose their connection are sent again after
+    the time given by their `Retry-After` header or an exponential backoff.
+
+    :param SpeechToTextV1 speech_to_text: The service client to use.
+    :param int max_in_flight: (optional) Maximum number of jobs created but not
+           yet finished. At most 100, the number of jobs `check_jobs` reports.
+    :param float min_interval: (optional) Shortest time between polls, in
+           seconds.
+    :param float max_interval: (optional) Longest time between polls, in
+           seconds.
+    :param float backoff: (optional) Factor by which the interval grows while no
+           job finishes.
+    :param int results_ttl: (optional) Minutes the service keeps the results of
+           a finished job, passed to `create_job` unless a request sets its
+           own. Polling is kept frequent enough to fetch results well before
+           they expire.
+    :param bool delete_finished: (optional) Delete each job once its results
+           have been fetched.
+    :param int max_retries: (optional) Number of times a failed request is
+           sent again.
+    :attr int retries: Number of requests sent again.
+    """
+
+    def __init__(self,
+                 speech_to_text,
+                 max_in_flight=10,
+                 min_interval=1.0,
+                 max_interval=30.0,
+                 backoff=1.5,
+                 results_ttl=None,
+                 delete_finished=False,
+                 max_retries=5):
+        if not 0 < max_in_flight <= CHECK_JOBS_LIMIT:
+            raise ValueError('max_in_flight must be between 1 and {0}'.format(
+                CHECK_JOBS_LIMIT))
+        self.speech_to_text = speech_to_text
+        self.max_in_flight = max_in_flight
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        if results_ttl is not None:
+            self.max_interval = max(min_interval,
+                                    min(max_interval, results_ttl * 60 / 4.0))
+        self.backoff = backoff
+        self.results_ttl = results_ttl
+        self.delete_finished = delete_finished
+        self.max_retries = max_retries
+        self.retries = 0
+
+    def run(self, requests: Iterable[dict]) -> Iterator[Tuple[dict, RecognitionJob]]:
+        """
+        Creates a job for each request and yields the jobs as they finish.
+
+        Requests are read lazily, so `requests` can be a generator over a large
+        backlog.
+
+        :param requests: `dict`s of `create_job` arguments, such as `audio`,
+               `content_type` and `model`.
+        :return: An iterator of `(request, job)` tuples, where `job` is the
+                 finished `RecognitionJob` including its results. Jobs are
+                 yielded in the order they finish, with status `completed` or
+                 `failed`.
+        """
+        pending = iter(requests)
+        in_flight = {}
+        exhausted = False
+        interval = self.min_interval
+        while True:
+            while not exhausted and len(in_flight) < self.max_in_flight:
+                request = next(pending, None)
+                if request is None:
+                    exhausted = True
+                    break
+                in_flight[self._create(request)] = request
+            if not in_flight:
+                return
+
+            time.sleep(interval)
+            finished = []
+            for job_id in self._finished_ids(in_flight):
+                job = RecognitionJob.from_dict(
+                    self._call(self.speech_to_text.check_job,
+                               job_id).get_result())
+                if job.status in FINISHED_STATUSES:
+                    finished.append(job)
+            for job in finished:
+                if self.delete_finished:
+                    self._call(self.speech_to_text.delete_job, job.id)
+                yield in_flight.pop(job.id), job
+
+            if finished:
+                interval = self.min_interval
+            else:
+                interval = min(interval * self.backoff, self.max_interval)
+
+    def _create(self, request):
+        kwargs = dict(request)
+        if self.results_ttl is not None:
+            kwargs.setdefault('results_ttl', self.results_ttl)
+        return self._call(self.speech_to_text.create_job,
+                          **kwargs).get_result()['id']
+
+    def _call(self, method, *args, **kwargs):
+        attempt = 0
+        while True:
+            try:
+                return method(*args, **kwargs)
+            except Exception as error:  # pylint: disable=broad-except
+                if not is_retryable(error) or attempt >= self.max_retries:
+                    raise
+                time.sleep(retry_delay(error, attempt))
+                attempt += 1
+                self.retries += 1
+
+    def _finished_ids(self, in_flight):
+        """
+        Returns the ids of in-flight jobs that have finished, or that
+        `check_jobs` did not report and so must be checked one by one.
+        """
+        recognitions = self._call(
+            self.speech_to_text.check_jobs).get_result().get(
+                'recognitions', [])
+        statuses = {job['id']: job['status'] for job in recognitions}
+        return [
+            job_id for job_id in in_flight
+            if job_id not in statuses or statuses[job_id] in FINISHED_STATUSES
+        ]
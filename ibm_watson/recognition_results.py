@@ -0,0 +1,185 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Helpers for moving `SpeechRecognitionResults` onto a different audio timeline.
+
+The functions operate on the `dict` form of the results returned by the
+service and never modify their input.
+"""
+
+import copy
+
+
+def remap_results(results, remap):
+    """
+    Returns a copy of `results` with every time value passed through `remap`.
+
+    Covers word `timestamps`, `keywords_result`, `word_alternatives` and
+    `speaker_labels`.
+
+    :param dict results: A `SpeechRecognitionResults` dict.
+    :param remap: A function that maps a time in seconds to a new time.
+    :rtype: dict
+    """
+    results = copy.deepcopy(results)
+    for result in results.get('results', []):
+        for alternative in result.get('alternatives', []):
+            for timestamp in alternative.get('timestamps', []):
+                timestamp[1] = remap(timestamp[1])
+                timestamp[2] = remap(timestamp[2])
+        for matches in result.get('keywords_result', {}).values():
+            for match in matches:
+                match['start_time'] = remap(match['start_time'])
+                match['end_time'] = remap(match['end_time'])
+        for word_alternative in result.get('word_alternatives', []):
+            word_alternative['start_time'] = remap(
+                word_alternative['start_time'])
+            word_alternative['end_time'] = remap(word_alternative['end_time'])
+    for label in results.get('speaker_labels', []):
+        label['from'] = remap(label['from'])
+        label['to'] = remap(label['to'])
+    return results
+
+
+def offset_results(results, time_offset, index_offset=0):
+    """
+    Returns a copy of `results` shifted by `time_offset` seconds, with its
+    `result_index` shifted by `index_offset`.
+
+    :param dict results: A `SpeechRecognitionResults` dict.
+    :param float time_offset: Seconds to add to every time value.
+    :param int index_offset: Number to add to `result_index`.
+    :rtype: dict
+    """
+    results = remap_results(results,
+                            lambda seconds: round(seconds + time_offset, 2))
+    if 'result_index' in results:
+        results['result_index'] += index_offset
+    return results
+
+
+def _start_time(result):
+    timestamps = result['alternatives'][0].get('timestamps') \
+        if result.get('alternatives') else None
+    return timestamps[0][1] if timestamps else None
+
+
+def clip_results(results, start, end):
+    """
+    Returns a copy of `results` that keeps only the words that start within
+    `[start, end)` seconds.
+
+    A result whose words are only partly kept is trimmed: its best alternative
+    keeps the matching `timestamps` and `word_confidence` entries and its
+    transcript is rebuilt from them, and the other alternatives are dropped.
+    Results without timestamps are kept whole. `speaker_labels`,
+    `keywords_result` and `word_alternatives` are filtered by start time.
+
+    :param dict results: A `SpeechRecognitionResults` dict.
+    :param float start: Start of the kept range in seconds.
+    :param float end: End of the kept range in seconds, or `None`.
+    :rtype: dict
+    """
+
+    def in_range(seconds):
+        return seconds >= start and (end is None or seconds < end)
+
+    results = copy.deepcopy(results)
+    kept = []
+    for result in results.get('results', []):
+        if _start_time(result) is None:
+            kept.append(result)
+            continue
+        best = result['alternatives'][0]
+        indexes = [
+            i for i, timestamp in enumerate(best['timestamps'])
+            if in_range(timestamp[1])
+        ]
+        if not indexes:
+            continue
+        if len(indexes) < len(best['timestamps']):
+            best['timestamps'] = [best['timestamps'][i] for i in indexes]
+            if 'word_confidence' in best:
+                best['word_confidence'] = [
+                    best['word_confidence'][i] for i in indexes
+                ]
+            best['transcript'] = ' '.join(
+                timestamp[0] for timestamp in best['timestamps']) + ' '
+            result['alternatives'] = [best]
+        if 'keywords_result' in result:
+            keywords_result = {}
+            for keyword, matches in result['keywords_result'].items():
+                matches = [m for m in matches if in_range(m['start_time'])]
+                if matches:
+                    keywords_result[keyword] = matches
+            result['keywords_result'] = keywords_result
+        if 'word_alternatives' in result:
+            result['word_alternatives'] = [
+                w for w in result['word_alternatives']
+                if in_range(w['start_time'])
+            ]
+        kept.append(result)
+    results['results'] = kept
+    if 'speaker_labels' in results:
+        results['speaker_labels'] = [
+            label for label in results['speaker_labels']
+            if in_range(label['from'])
+        ]
+    return results
+
+
+def merge_results(pieces):
+    """
+    Merges the results of recognizing consecutive, possibly overlapping pieces
+    of one recording into a single `SpeechRecognitionResults` dict.
+
+    Each piece is moved onto the timeline of the whole recording. Where two
+    pieces overlap, words are taken from the earlier piece up to the middle of
+    the overlap and from the later piece after it, so that words in the overlap
+    appear once.
+
+    :param list pieces: A list of `(start, end, results)` tuples ordered by
+           `start`, where `start` and `end` are the bounds of the piece in
+           seconds on the timeline of the whole recording.
+    :rtype: dict
+    """
+    merged = {'result_index': 0, 'results': []}
+    warnings = []
+    for i, (start, end, results) in enumerate(pieces):
+        keep_from = None
+        keep_to = None
+        if i > 0:
+            previous_end = pieces[i - 1][1]
+            keep_from = (start + min(previous_end, end)) / 2 \
+                if previous_end > start else start
+        if i + 1 < len(pieces):
+            next_start = pieces[i + 1][0]
+            keep_to = (next_start + min(end, pieces[i + 1][1])) / 2 \
+                if end > next_start else end
+        results = offset_results(results, start)
+        if keep_from is not None or keep_to is not None:
+            results = clip_results(
+                results, keep_from if keep_from is not None else 0, keep_to)
+        merged['results'].extend(results.get('results', []))
+        if 'speaker_labels' in results:
+            merged.setdefault('speaker_labels',
+                              []).extend(results['speaker_labels'])
+        for warning in results.get('warnings', []):
+            if warning not in warnings:
+                warnings.append(warning)
+    if warnings:
+        merged['warnings'] = warnings
+    return merged
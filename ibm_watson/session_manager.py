@@ -0,0 +1,252 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+# Seconds to wait before retrying after a session could not be created
+RETRY_DELAY = 1
+
+logger = logging.getLogger(__name__)
+
+
+class SessionManager(object):
+    """
+    Manages the stateful sessions of an `AssistantV2` assistant, one per
+    conversation.
+
+    A background thread keeps `pool_size` new sessions ready, so the first
+    message of a conversation does not wait for `create_session`. The time
+    each session was last used is tracked against the inactivity timeout of
+    the assistant: a pooled session is replaced before it expires, and a
+    conversation whose session has expired gets a new one before its next
+    message. If the service still reports the session as not found, the
+    message is sent once more with a new session. The context stored in an
+    expired session is lost either way.
+
+    `close` deletes all sessions concurrently. Use the manager as a context
+    manager to close it automatically.
+
+    :param AssistantV2 assistant: The client used to call the service.
+    :param str assistant_id: The assistant ID or the environment ID of the
+           environment where the assistant is deployed, as passed to
+           `create_session`.
+    :param str environment_id: Unique identifier of the environment, as passed
+           to `message`.
+    :param int pool_size: (optional) Number of new sessions to keep ready.
+    :param float inactivity_timeout: (optional) Seconds after which the
+           assistant ends an inactive session, as configured in the assistant
+           settings.
+    :param float expiry_margin: (optional) Seconds before the inactivity
+           timeout at which a session is treated as expired.
+    :param int max_workers: (optional) Number of sessions deleted at the same
+           time by `close`.
+    :attr int hits: Number of conversations given a pooled session.
+    :attr int misses: Number of sessions created because none was ready.
+    :attr int recreated: Number of sessions replaced because they expired.
+    """
+
+    def __init__(self,
+                 assistant,
+                 assistant_id: str,
+                 environment_id: str,
+                 pool_size: int = 1,
+                 inactivity_timeout: float = 300,
+                 expiry_margin: float = 10,
+                 max_workers: int = 8) -> None:
+        if pool_size < 0:
+            raise ValueError('pool_size must not be negative')
+        if expiry_margin >= inactivity_timeout:
+            raise ValueError(
+                'expiry_margin must be less than inactivity_timeout')
+        self.assistant = assistant
+        self.assistant_id = assistant_id
+        self.environment_id = environment_id
+        self.pool_size = pool_size
+        self.inactivity_timeout = inactivity_timeout
+        self.expiry_margin = expiry_margin
+        self.max_workers = max_workers
+        self.hits = 0
+        self.misses = 0
+        self.recreated = 0
+        # (session_id, last_used) pairs
+        self._idle = deque()
+        self._sessions = {}
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = None
+        if pool_size:
+            self._thread = threading.Thread(target=self._maintain,
+                                            daemon=True)
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def session(self, conversation_id) -> str:
+        """
+        Returns the session of a conversation, for use with methods that take
+        a `session_id`. A new session is assigned if the conversation has none
+        or its session has expired. The session counts as used.
+
+        :param conversation_id: Any hashable value that identifies the
+               conversation.
+        :rtype: str
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('The session manager is closed')
+            now = time.time()
+            entry = self._sessions.get(conversation_id)
+            if entry is not None:
+                if not self._expired(entry[1], now):
+                    entry[1] = now
+                    return entry[0]
+                self.recreated += 1
+            session_id = self._take_idle(now)
+        if session_id is None:
+            session_id = self._create()
+        with self._condition:
+            self._sessions[conversation_id] = [session_id, time.time()]
+        return session_id
+
+    def message(self, conversation_id, **kwargs) -> DetailedResponse:
+        """
+        Sends user input to the assistant in the session of a conversation.
+
+        Accepts the keyword arguments of `AssistantV2.message`. If the service
+        reports that the session does not exist, the message is sent once more
+        in a new session.
+
+        :param conversation_id: Any hashable value that identifies the
+               conversation.
+        :return: A `DetailedResponse` containing the result, headers and HTTP
+                 status code.
+        :rtype: DetailedResponse with `dict` result representing a
+                `StatefulMessageResponse` object
+        """
+        session_id = self.session(conversation_id)
+        try:
+            return self.assistant.message(self.assistant_id,
+                                          self.environment_id, session_id,
+                                          **kwargs)
+        except ApiException as error:
+            if error.status_code != 404:
+                raise
+        with self._condition:
+            entry = self._sessions.get(conversation_id)
+            if entry is not None and entry[0] == session_id:
+                del self._sessions[conversation_id]
+                self.recreated += 1
+        session_id = self.session(conversation_id)
+        return self.assistant.message(self.assistant_id, self.environment_id,
+                                      session_id, **kwargs)
+
+    def end(self, conversation_id) -> None:
+        """Deletes the session of a conversation, if it has one."""
+        with self._condition:
+            entry = self._sessions.pop(conversation_id, None)
+        if entry is not None:
+            self._delete_all([entry[0]])
+
+    def close(self) -> None:
+        """
+        Stops creating sessions and deletes the pooled sessions and the
+        sessions of all conversations.
+        """
+        with self._condition:
+            self._closed = True
+            session_ids = [session_id for session_id, _ in self._idle]
+            session_ids.extend(entry[0] for entry in self._sessions.values())
+            self._idle.clear()
+            self._sessions.clear()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        self._delete_all(session_ids)
+
+    def _expired(self, last_used, now):
+        return now >= last_used + self.inactivity_timeout - self.expiry_margin
+
+    def _take_idle(self, now):
+        while self._idle:
+            session_id, created = self._idle.popleft()
+            if not self._expired(created, now):
+                self.hits += 1
+                self._condition.notify_all()
+                return session_id
+        self.misses += 1
+        self._condition.notify_all()
+        return None
+
+    def _create(self) -> str:
+        response = self.assistant.create_session(self.assistant_id)
+        return response.get_result()['session_id']
+
+    def _maintain(self):
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+                now = time.time()
+                self._idle = deque(entry for entry in self._idle
+                                   if not self._expired(entry[1], now))
+                missing = self.pool_size - len(self._idle)
+
+            if missing > 0:
+                try:
+                    session_id = self._create()
+                except Exception as error:  # pylint: disable=broad-except
+                    logger.debug('Could not create a pooled session: %s',
+                                 error)
+                    with self._condition:
+                        self._condition.wait(RETRY_DELAY)
+                    continue
+                with self._condition:
+                    if not self._closed:
+                        self._idle.append((session_id, time.time()))
+                        continue
+                self._delete_all([session_id])
+                return
+
+            with self._condition:
+                if self._closed:
+                    return
+                next_expiry = min(created for _, created in self._idle) + \
+                    self.inactivity_timeout - self.expiry_margin
+                self._condition.wait(max(0, next_expiry - time.time()))
+
+    def _delete_all(self, session_ids):
+        def delete(session_id):
+            try:
+                self.assistant.delete_session(self.assistant_id, session_id)
+            except Exception as error:  # pylint: disable=broad-except
+                logger.debug('Could not delete session %s: %s', session_id,
+                             error)
+
+        if len(session_ids) == 1:
+            delete(session_ids[0])
+        elif session_ids:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(delete, session_ids))
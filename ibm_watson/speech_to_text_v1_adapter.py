@@ -14,7 +14,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from ibm_watson.websocket import RecognizeCallback, RecognizeListener, AudioSource
+import copy
+import io
+import ssl
+import threading
+import websocket
+from concurrent.futures import ThreadPoolExecutor
+from ibm_cloud_sdk_core import DetailedResponse
+from ibm_watson.websocket import RecognizeCallback, RecognizeListener, AudioSource, AsyncRecognizeListener, RecognizeConnectionPool, RecognizeSession
+from ibm_watson.websocket.recognize_stream import RecognizeStream, AsyncRecognizeStream, BLOCK
+from .audio_utils import read_pcm, pcm_to_wav, split_pcm
+from .recognition_results import merge_results, remap_results
 from .speech_to_text_v1 import SpeechToTextV1
 from urllib.parse import urlencode
 
@@ -23,6 +33,46 @@ BEARER = 'Bearer'
 
 class SpeechToTextV1Adapter(SpeechToTextV1):
 
+    audio_preprocessor = None
+
+    def set_audio_preprocessor(self, audio_preprocessor=None):
+        """
+        Set an `AudioPreprocessor` that reduces PCM audio to the sampling rate
+        and channels the model needs before it is sent by `recognize`,
+        `create_job` and `recognize_using_websocket`. The `Content-Type` of the
+        request is rewritten to match. Pass `None` to send audio unchanged.
+
+        When the preprocessor shortens silent spans, the times in the results
+        of `recognize` and `recognize_using_websocket` are mapped back to the
+        original audio. `create_job` never trims silence, since its results
+        are not returned through this client.
+
+        :param AudioPreprocessor audio_preprocessor: The preprocessor to use.
+        """
+        self.audio_preprocessor = audio_preprocessor
+
+    def recognize(self, audio, **kwargs):
+        audio, kwargs['content_type'], time_map = self._preprocess_audio(
+            audio, kwargs.get('content_type'), kwargs.get('model'))
+        response = super(SpeechToTextV1Adapter,
+                         self).recognize(audio, **kwargs)
+        if time_map is None:
+            return response
+        result = remap_results(response.get_result(), time_map.to_original)
+        return DetailedResponse(response=result,
+                                headers=response.get_headers(),
+                                status_code=response.get_status_code())
+
+    recognize.__doc__ = SpeechToTextV1.recognize.__doc__
+
+    def create_job(self, audio, **kwargs):
+        audio, kwargs['content_type'], _ = self._preprocess_audio(
+            audio, kwargs.get('content_type'), kwargs.get('model'),
+            trim_silence=False)
+        return super(SpeechToTextV1Adapter, self).create_job(audio, **kwargs)
+
+    create_job.__doc__ = SpeechToTextV1.create_job.__doc__
+
     def recognize_using_websocket(self,
                                   audio,
                                   content_type,
@@ -57,6 +107,11 @@ class SpeechToTextV1Adapter(SpeechToTextV1):
                                   background_audio_suppression=None,
                                   low_latency=None,
                                   character_insertion_bias=None,
+                                  pacing=None,
+                                  max_reconnects=None,
+                                  replay_buffer_seconds=None,
+                                  connection_pool=None,
+                                  hypothesis_throttle=None,
                                   **kwargs):
         """
         Sends audio for speech recognition using web sockets.
@@ -309,37 +364,165 @@ class SpeechToTextV1Adapter(SpeechToTextV1):
                `Narrowband` models.
                See [Character insertion
                bias](https://cloud.ibm.com/docs/speech-to-text?topic=speech-to-text-parsing#insertion-bias).
+        :param str pacing: (optional) How audio read from a file-like `AudioSource`
+               is paced. By default it is sent in 1 KB chunks every 10 ms. `fast`
+               sends it as fast as the connection allows, which suits stored
+               recordings. `realtime` sends it at playback speed, which suits
+               replaying a recording as a live stream and requires the byte rate
+               to be known from `content_type` (e.g. `audio/l16;rate=16000`) or
+               the WAV header. In both modes the chunk size is derived from the
+               audio format.
+        :param int max_reconnects: (optional) How many times to reconnect and
+               resume the session after the connection fails, instead of ending
+               it with an error, before a connection returns a new final
+               result. The audio sent since the end
+               of the last final result is replayed, and the results continue
+               the timestamps and `result_index` of the earlier connections.
+               Requires `audio/l16`, `audio/mulaw`, `audio/alaw` or
+               `audio/basic` audio, and turns on `timestamps`. Speaker labels
+               are not kept consistent across connections.
+        :param float replay_buffer_seconds: (optional) Seconds of sent audio kept
+               for replay when resuming. Defaults to 60.
+        :param RecognizeConnectionPool connection_pool: (optional) A pool from
+               `create_websocket_pool` to take an open connection from, so
+               that recognition starts without a handshake. The pool must have
+               been created with the same `model` and customization arguments.
+        :param HypothesisThrottle hypothesis_throttle: (optional) Limits how
+               often interim results are delivered with `interim_results`, and
+               can deliver hypotheses as diffs to `on_hypothesis_diff`.
         :param dict headers: A `dict` containing the request headers
         :return: A `dict` containing the `SpeechRecognitionResults` response.
         :rtype: dict
         """
-        if audio is None:
-            raise ValueError('audio must be provided')
-        if not isinstance(audio, AudioSource):
-            raise Exception(
-                'audio is not of type AudioSource. Import the class from ibm_watson.websocket'
-            )
-        if content_type is None:
-            raise ValueError('content_type must be provided')
-        if recognize_callback is None:
-            raise ValueError('recognize_callback must be provided')
-        if not isinstance(recognize_callback, RecognizeCallback):
-            raise Exception(
-                'Callback is not a derived class of RecognizeCallback')
+        self._validate_websocket_arguments(audio, content_type,
+                                           recognize_callback)
+        audio, content_type, converter, time_map = \
+            self._preprocess_audio_source(audio, content_type, model)
 
-        request = {}
+        params = {
+            'model': model,
+            'acoustic_customization_id': acoustic_customization_id,
+            'base_model_version': base_model_version,
+            'language_customization_id': language_customization_id
+        }
 
-        headers = {}
-        if self.default_headers is not None:
-            headers = self.default_headers.copy()
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        request['headers'] = headers
+        options = {
+            'customization_weight': customization_weight,
+            'content_type': content_type,
+            'inactivity_timeout': inactivity_timeout,
+            'interim_results': interim_results,
+            'keywords': keywords,
+            'keywords_threshold': keywords_threshold,
+            'max_alternatives': max_alternatives,
+            'word_alternatives_threshold': word_alternatives_threshold,
+            'word_confidence': word_confidence,
+            'timestamps': timestamps,
+            'profanity_filter': profanity_filter,
+            'smart_formatting': smart_formatting,
+            'smart_formatting_version': smart_formatting_version,
+            'speaker_labels': speaker_labels,
+            'grammar_name': grammar_name,
+            'redaction': redaction,
+            'processing_metrics': processing_metrics,
+            'processing_metrics_interval': processing_metrics_interval,
+            'audio_metrics': audio_metrics,
+            'end_of_phrase_silence_time': end_of_phrase_silence_time,
+            'split_transcript_at_phrase_end': split_transcript_at_phrase_end,
+            'speech_detector_sensitivity': speech_detector_sensitivity,
+            'background_audio_suppression': background_audio_suppression,
+            'character_insertion_bias': character_insertion_bias,
+            'low_latency': low_latency,
+        }
+        request = self._build_websocket_request(params, options, **kwargs)
+        headers = request.get('headers')
+        if max_reconnects:
+            # authenticate each connection, since tokens expire during long
+            # sessions
+            def headers():
+                return self._build_websocket_request(params, options,
+                                                     **kwargs).get('headers')
 
-        if self.authenticator:
-            self.authenticator.authenticate(request)
+        connection = None
+        if connection_pool is not None:
+            if connection_pool.url != request.get('url'):
+                raise ValueError(
+                    'connection_pool was created for a different model or '
+                    'customization')
+            connection = connection_pool.acquire()
 
-        url = self.service_url.replace('https:', 'wss:')
+        RecognizeListener(audio, request.get('options'), recognize_callback,
+                          request.get('url'), headers, http_proxy_host,
+                          http_proxy_port, self.disable_ssl_verification,
+                          pacing, converter, time_map, max_reconnects or 0,
+                          replay_buffer_seconds or 60, connection,
+                          hypothesis_throttle=hypothesis_throttle)
+
+    async def recognize_using_websocket_async(self,
+                                              audio,
+                                              content_type,
+                                              recognize_callback,
+                                              model=None,
+                                              language_customization_id=None,
+                                              acoustic_customization_id=None,
+                                              customization_weight=None,
+                                              base_model_version=None,
+                                              inactivity_timeout=None,
+                                              interim_results=None,
+                                              keywords=None,
+                                              keywords_threshold=None,
+                                              max_alternatives=None,
+                                              word_alternatives_threshold=None,
+                                              word_confidence=None,
+                                              timestamps=None,
+                                              profanity_filter=None,
+                                              smart_formatting=None,
+                                              smart_formatting_version=None,
+                                              speaker_labels=None,
+                                              http_proxy_host=None,
+                                              http_proxy_port=None,
+                                              grammar_name=None,
+                                              redaction=None,
+                                              processing_metrics=None,
+                                              processing_metrics_interval=None,
+                                              audio_metrics=None,
+                                              end_of_phrase_silence_time=None,
+                                              split_transcript_at_phrase_end=None,
+                                              speech_detector_sensitivity=None,
+                                              background_audio_suppression=None,
+                                              low_latency=None,
+                                              character_insertion_bias=None,
+                                              pacing=None,
+                                              http_session=None,
+                                              hypothesis_throttle=None,
+                                              **kwargs):
+        """
+        Sends audio for speech recognition using web sockets on the running
+        asyncio event loop.
+
+        Accepts the same arguments as `recognize_using_websocket` and emits the
+        same `RecognizeCallback` events, but returns a coroutine that completes
+        when the recognize session is closed. Many sessions can run
+        concurrently on one event loop, e.g. with `asyncio.gather`. Requires
+        the optional `aiohttp` package.
+
+        For a buffered `AudioSource`, `input` may be an `asyncio.Queue` or a
+        thread-safe `queue.Queue`; either is waited on without blocking the
+        loop or occupying a thread.
+
+        :param str pacing: (optional) How audio read from a file-like
+               `AudioSource` is paced; see `recognize_using_websocket`.
+        :param aiohttp.ClientSession http_session: (optional) A client session
+               to open the websocket with. By default a session is created for
+               the call and closed when it completes.
+        :param HypothesisThrottle hypothesis_throttle: (optional) Limits how
+               often interim results are delivered; see
+               `recognize_using_websocket`.
+        :param dict headers: A `dict` containing the request headers
+        """
+        self._validate_websocket_arguments(audio, content_type,
+                                           recognize_callback)
+        audio, content_type, converter, time_map = \
+            self._preprocess_audio_source(audio, content_type, model)
 
         params = {
             'model': model,
@@ -347,9 +530,6 @@ class SpeechToTextV1Adapter(SpeechToTextV1):
             'base_model_version': base_model_version,
             'language_customization_id': language_customization_id
         }
-        params = {k: v for k, v in params.items() if v is not None}
-        url += '/v1/recognize?{0}'.format(urlencode(params))
-        request['url'] = url
 
         options = {
             'customization_weight': customization_weight,
@@ -378,10 +558,386 @@ class SpeechToTextV1Adapter(SpeechToTextV1):
             'character_insertion_bias': character_insertion_bias,
             'low_latency': low_latency,
         }
+        request = self._build_websocket_request(params, options, **kwargs)
+
+        listener = AsyncRecognizeListener(audio, request.get('options'),
+                                          recognize_callback,
+                                          request.get('url'),
+                                          request.get('headers'),
+                                          http_proxy_host, http_proxy_port,
+                                          self.disable_ssl_verification,
+                                          http_session, pacing, converter,
+                                          time_map, hypothesis_throttle)
+        await listener.run()
+
+    def create_websocket_pool(self,
+                              size=1,
+                              idle_timeout=20.0,
+                              model=None,
+                              language_customization_id=None,
+                              acoustic_customization_id=None,
+                              base_model_version=None,
+                              http_proxy_host=None,
+                              http_proxy_port=None,
+                              **kwargs):
+        """
+        Creates a pool of open, authenticated websocket connections for
+        `recognize_using_websocket(connection_pool=...)`, which then starts
+        recognizing without waiting for the TLS and websocket handshakes.
+
+        A connection is opened for a specific model and customization, so the
+        recognize calls that use the pool must pass the same values. Close the
+        pool when it is no longer needed.
+
+        :param int size: (optional) Number of idle connections to keep open.
+        :param float idle_timeout: (optional) Seconds after which an unused
+               connection is replaced, before the service closes it. Connections
+               are also replaced before their access token expires.
+        :param str model: (optional) The model to use for speech recognition.
+        :param str language_customization_id: (optional) The customization ID
+               (GUID) of a custom language model.
+        :param str acoustic_customization_id: (optional) The customization ID
+               (GUID) of a custom acoustic model.
+        :param str base_model_version: (optional) The version of the specified
+               base model.
+        :param str http_proxy_host: (optional) http proxy host name.
+        :param str http_proxy_port: (optional) http proxy port.
+        :param dict headers: A `dict` containing the request headers
+        :rtype: RecognizeConnectionPool
+        """
+        params = {
+            'model': model,
+            'acoustic_customization_id': acoustic_customization_id,
+            'base_model_version': base_model_version,
+            'language_customization_id': language_customization_id
+        }
+
+        connect = self._websocket_connector(params, http_proxy_host,
+                                            http_proxy_port, **kwargs)
+
+        def connect_with_expiry():
+            token_manager = getattr(self.authenticator, 'token_manager', None)
+            connection = connect()
+            return connection, getattr(token_manager, 'expire_time', None)
+
+        return RecognizeConnectionPool(connect_with_expiry,
+                                       self._websocket_url(params), size,
+                                       idle_timeout)
+
+    def recognize_session(self,
+                          content_type,
+                          model=None,
+                          language_customization_id=None,
+                          acoustic_customization_id=None,
+                          base_model_version=None,
+                          http_proxy_host=None,
+                          http_proxy_port=None,
+                          pacing=None,
+                          connection_pool=None,
+                          headers=None,
+                          **options):
+        """
+        Opens a `RecognizeSession` that recognizes a series of utterances over
+        one websocket connection, saving the TLS and authentication handshakes
+        of a new connection per utterance:
+
+            with speech_to_text.recognize_session('audio/l16;rate=8000',
+                    model='en-US_Telephony') as session:
+                results = session.recognize_utterance(audio)
+
+        :param str content_type: The format (MIME type) of the audio.
+        :param str model: (optional) The model to use for speech recognition.
+        :param str language_customization_id: (optional) The customization ID
+               (GUID) of a custom language model.
+        :param str acoustic_customization_id: (optional) The customization ID
+               (GUID) of a custom acoustic model.
+        :param str base_model_version: (optional) The version of the specified
+               base model.
+        :param str http_proxy_host: (optional) http proxy host name.
+        :param str http_proxy_port: (optional) http proxy port.
+        :param str pacing: (optional) How audio read from a file-like
+               `AudioSource` is paced; see `recognize_using_websocket`.
+        :param RecognizeConnectionPool connection_pool: (optional) A pool to
+               take the connection from, created with the same `model` and
+               customization arguments.
+        :param dict headers: A `dict` containing the request headers
+        :param options: Recognition options of `recognize_using_websocket`,
+               such as `interim_results` or `timestamps`, sent for every
+               utterance.
+        :rtype: RecognizeSession
+        """
+        if content_type is None:
+            raise ValueError('content_type must be provided')
+        params = {
+            'model': model,
+            'acoustic_customization_id': acoustic_customization_id,
+            'base_model_version': base_model_version,
+            'language_customization_id': language_customization_id
+        }
+        kwargs = {'headers': headers} if headers is not None else {}
+        url = self._websocket_url(params)
+        connect = self._websocket_connector(params, http_proxy_host,
+                                            http_proxy_port, **kwargs)
+        if connection_pool is not None:
+            if connection_pool.url != url:
+                raise ValueError(
+                    'connection_pool was created for a different model or '
+                    'customization')
+            connect = connection_pool.acquire
+
+        def preprocess(audio, content_type):
+            return self._preprocess_audio_source(audio, content_type, model)
+
+        options = {k: v for k, v in options.items() if v is not None}
+        return RecognizeSession(connect, url, content_type, options, pacing,
+                                preprocess)
+
+    def recognize_stream(self,
+                         audio,
+                         content_type,
+                         buffer_size=100,
+                         interim_policy=BLOCK,
+                         **kwargs):
+        """
+        Recognizes audio using web sockets and returns an iterator over the
+        `SpeechRecognitionResults` messages the service sends.
+
+        The session runs on a background thread, so the caller consumes
+        results at its own pace without holding up the websocket. See
+        `RecognizeStream` for how a slow consumer is handled. Close the
+        stream, or use it as a context manager, if iteration may stop early.
+
+        :param AudioSource audio: The audio to transcribe in the format
+               specified by `content_type`.
+        :param str content_type: The format (MIME type) of the audio.
+        :param int buffer_size: (optional) Maximum number of messages held for
+               the consumer.
+        :param str interim_policy: (optional) `block` to stop reading from the
+               websocket while the buffer is full, or `drop_interim` to discard
+               interim hypotheses instead.
+        :param kwargs: Other arguments of `recognize_using_websocket`.
+        :return: An iterator of `SpeechRecognitionResults` dicts.
+        :rtype: RecognizeStream
+        """
+        stream = RecognizeStream(buffer_size, interim_policy)
+        # The thread holds only the callback, so that an abandoned stream
+        # can be garbage collected and closed.
+        callback = stream.callback
+        self._validate_websocket_arguments(audio, content_type, callback)
+
+        def run():
+            try:
+                self.recognize_using_websocket(audio, content_type, callback,
+                                               **kwargs)
+            except Exception as error:  # pylint: disable=broad-except
+                callback.on_error(error)
+            finally:
+                callback.on_close()
+
+        threading.Thread(target=run, daemon=True).start()
+        return stream
+
+    def recognize_stream_async(self,
+                               audio,
+                               content_type,
+                               buffer_size=100,
+                               interim_policy=BLOCK,
+                               **kwargs):
+        """
+        asyncio counterpart of `recognize_stream`. The session runs on the
+        event loop once iteration starts:
+
+            async for results in speech_to_text.recognize_stream_async(...):
+                ...
+
+        :param AudioSource audio: The audio to transcribe in the format
+               specified by `content_type`.
+        :param str content_type: The format (MIME type) of the audio.
+        :param int buffer_size: (optional) Maximum number of messages held for
+               the consumer.
+        :param str interim_policy: (optional) `block` or `drop_interim`.
+        :param kwargs: Other arguments of `recognize_using_websocket_async`.
+        :return: An asynchronous iterator of `SpeechRecognitionResults` dicts.
+        :rtype: AsyncRecognizeStream
+        """
+        self._validate_websocket_arguments(audio, content_type,
+                                           RecognizeCallback())
+
+        def session(stream):
+            return self.recognize_using_websocket_async(
+                audio, content_type, stream, **kwargs)
+
+        return AsyncRecognizeStream(session, buffer_size, interim_policy)
+
+    def recognize_parallel(self,
+                           audio,
+                           content_type,
+                           window=300,
+                           overlap=2.0,
+                           silence_search=10.0,
+                           max_workers=4,
+                           **kwargs):
+        """
+        Recognizes long audio by splitting it into pieces that are recognized
+        concurrently, then merging the results.
+
+        The audio is cut about every `window` seconds at the quietest point
+        within the preceding `silence_search` seconds. Consecutive pieces
+        overlap by `overlap` seconds around each cut, and words in an overlap
+        are taken from one piece only. Word timestamps, keyword and word
+        alternative times and speaker labels in the merged results refer to the
+        whole recording. Speaker labels are assigned per piece, so the same
+        speaker can have different labels in different pieces.
+
+        Only 16-bit PCM audio is supported: `audio/wav`, or `audio/l16` with a
+        `rate` parameter.
+
+        :param bytes audio: The audio to transcribe, as bytes or a file-like
+               object.
+        :param str content_type: The format (MIME type) of the audio.
+        :param float window: (optional) Nominal length of a piece in seconds.
+        :param float overlap: (optional) Seconds shared by consecutive pieces.
+               Trimming words in the overlap needs word timestamps, so
+               `timestamps` is enabled when the overlap is not zero.
+        :param float silence_search: (optional) Seconds before each nominal cut
+               to search for silence. Use `0` to cut at fixed windows.
+        :param int max_workers: (optional) Maximum number of pieces recognized
+               at the same time.
+        :param kwargs: Other arguments of `recognize`, such as `model`.
+        :return: A `DetailedResponse` containing the merged
+                 `SpeechRecognitionResults` result.
+        :rtype: DetailedResponse
+        """
+        if audio is None:
+            raise ValueError('audio must be provided')
+        if content_type is None:
+            raise ValueError('content_type must be provided')
+        if hasattr(audio, 'read'):
+            audio = audio.read()
+        audio_format, data = read_pcm(audio, content_type)
+        if overlap:
+            kwargs['timestamps'] = True
+
+        bounds = split_pcm(data, audio_format, window, overlap, silence_search)
+
+        def recognize_piece(bound):
+            piece = data[bound[0]:bound[1]]
+            if audio_format.mime_type == 'audio/wav':
+                piece_audio, piece_type = pcm_to_wav(piece,
+                                                     audio_format), 'audio/wav'
+            else:
+                piece_audio, piece_type = piece, content_type
+            return self.recognize(piece_audio,
+                                  content_type=piece_type,
+                                  **kwargs).get_result()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(recognize_piece, bounds))
+
+        bytes_per_second = float(audio_format.bytes_per_second)
+        merged = merge_results([
+            (start / bytes_per_second, end / bytes_per_second, result)
+            for (start, end), result in zip(bounds, results)
+        ])
+        return DetailedResponse(response=merged, status_code=200)
+
+    def _preprocess_audio(self, audio, content_type, model, trim_silence=True):
+        """
+        Applies the audio preprocessor to a whole recording.
+
+        :return: The audio to send, its content type and a `TimeMap` if
+                 silence was removed.
+        """
+        if self.audio_preprocessor is None or content_type is None:
+            return audio, content_type, None
+        if hasattr(audio, 'read'):
+            audio = audio.read()
+        if not trim_silence and self.audio_preprocessor.trim_silence:
+            audio_preprocessor = copy.copy(self.audio_preprocessor)
+            audio_preprocessor.trim_silence = False
+            return audio_preprocessor.process(audio, content_type, model)
+        return self.audio_preprocessor.process(audio, content_type, model)
+
+    def _preprocess_audio_source(self, audio, content_type, model):
+        """
+        Applies the audio preprocessor to an `AudioSource`. File input is
+        converted up front; buffered input is converted as it is streamed.
+
+        :return: The `AudioSource` to send, its content type, the converter
+                 for buffered input and a `TimeMap` if silence is removed.
+        """
+        if self.audio_preprocessor is None:
+            return audio, content_type, None, None
+        if audio.is_buffer:
+            converter = self.audio_preprocessor.converter(content_type, model)
+            if converter is None:
+                return audio, content_type, None, None
+            return audio, converter.content_type, converter, converter.time_map
+        data = audio.input.read()
+        audio.input.close()
+        data, content_type, time_map = self.audio_preprocessor.process(
+            data, content_type, model)
+        return AudioSource(io.BytesIO(data)), content_type, None, time_map
+
+    @staticmethod
+    def _validate_websocket_arguments(audio, content_type, recognize_callback):
+        if audio is None:
+            raise ValueError('audio must be provided')
+        if not isinstance(audio, AudioSource):
+            raise Exception(
+                'audio is not of type AudioSource. Import the class from ibm_watson.websocket'
+            )
+        if content_type is None:
+            raise ValueError('content_type must be provided')
+        if recognize_callback is None:
+            raise ValueError('recognize_callback must be provided')
+        if not isinstance(recognize_callback, RecognizeCallback):
+            raise Exception(
+                'Callback is not a derived class of RecognizeCallback')
+
+    def _build_websocket_request(self, params, options, **kwargs):
+        """
+        Builds the url, authenticated headers and start message options for a
+        websocket recognize request.
+        """
+        request = {}
+
+        headers = {}
+        if self.default_headers is not None:
+            headers = self.default_headers.copy()
+        if 'headers' in kwargs:
+            headers.update(kwargs.get('headers'))
+        request['headers'] = headers
+
+        if self.authenticator:
+            self.authenticator.authenticate(request)
+
+        request['url'] = self._websocket_url(params)
+
         options = {k: v for k, v in options.items() if v is not None}
         request['options'] = options
+        return request
 
-        RecognizeListener(audio, request.get('options'), recognize_callback,
-                          request.get('url'), request.get('headers'),
-                          http_proxy_host, http_proxy_port,
-                          self.disable_ssl_verification)
+    def _websocket_url(self, params):
+        url = self.service_url.replace('https:', 'wss:')
+        params = {k: v for k, v in params.items() if v is not None}
+        return url + '/v1/recognize?{0}'.format(urlencode(params))
+
+    def _websocket_connector(self, params, http_proxy_host, http_proxy_port,
+                             **kwargs):
+        """
+        Returns a function that opens an authenticated websocket connection.
+        """
+
+        def connect():
+            request = self._build_websocket_request(params, {}, **kwargs)
+            return websocket.create_connection(
+                request.get('url'),
+                header=request.get('headers'),
+                http_proxy_host=http_proxy_host,
+                http_proxy_port=http_proxy_port,
+                sslopt={'cert_reqs': ssl.CERT_NONE}
+                if self.disable_ssl_verification else None,
+                enable_multithread=True)
+
+        return connect
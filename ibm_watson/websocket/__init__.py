@@ -15,7 +15,11 @@
 # limitations under the License.
 
 from .recognize_abstract_callback import RecognizeCallback
-from .recognize_listener import RecognizeListener
+from .recognize_listener import RecognizeListener, HypothesisThrottle
 from .audio_source import AudioSource
 from .synthesize_callback import SynthesizeCallback
 from .synthesize_listener import SynthesizeListener
+from .async_recognize_listener import AsyncRecognizeListener
+from .recognize_stream import RecognizeStream, AsyncRecognizeStream
+from .connection_pool import RecognizeConnectionPool
+from .recognize_session import RecognizeSession
@@ -0,0 +1,277 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import queue
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from ..common import decode_json
+from ..recognition_results import remap_results
+from .recognize_listener import (RecognizeListener, AudioPacer,
+                                 TIMEOUT_PREFIX, TEN_MILLISECONDS,
+                                 MAX_COALESCED_SIZE, QUEUE_TIMEOUT)
+
+
+class AsyncRecognizeListener(object):
+    """
+    asyncio counterpart of `RecognizeListener`.
+
+    Runs a single recognize session on the current event loop, so any number
+    of sessions can be multiplexed on one loop without dedicated threads.
+    Requires the optional `aiohttp` package.
+    """
+
+    def __init__(self,
+                 audio_source,
+                 options,
+                 callback,
+                 url,
+                 headers,
+                 http_proxy_host=None,
+                 http_proxy_port=None,
+                 verify=None,
+                 http_session=None,
+                 pacing=None,
+                 converter=None,
+                 time_map=None,
+                 hypothesis_throttle=None):
+        if aiohttp is None:
+            raise ImportError(
+                'aiohttp is required for asyncio websocket support. '
+                'Install it with `pip install ibm-watson[async]`')
+        self.audio_source = audio_source
+        self.options = options
+        self.callback = callback
+        self.url = url
+        self.headers = headers
+        self.http_proxy_host = http_proxy_host
+        self.http_proxy_port = http_proxy_port
+        self.isListening = False
+        self.verify = verify
+        self.http_session = http_session
+        self.pacer = AudioPacer.for_source(pacing, options.get('content_type'),
+                                           audio_source)
+        self.converter = converter
+        self.time_map = time_map
+        self.hypothesis_throttle = hypothesis_throttle
+        if hypothesis_throttle is not None:
+            hypothesis_throttle.reset()
+        self.ws_client = None
+        self._send_task = None
+
+    async def run(self):
+        """
+        Connects to the service and runs the recognize session until the
+        connection is closed.
+        """
+        proxy = None
+        if self.http_proxy_host is not None:
+            proxy = 'http://{0}:{1}'.format(self.http_proxy_host,
+                                            self.http_proxy_port or 80)
+        session = self.http_session
+        owns_session = session is None
+        if owns_session:
+            session = aiohttp.ClientSession()
+        try:
+            async with session.ws_connect(
+                    self.url,
+                    headers=self.headers,
+                    proxy=proxy,
+                    ssl=not self.verify,
+                    autoclose=False) as ws:
+                self.ws_client = ws
+                await self.on_open()
+                async for message in ws:
+                    if message.type in (aiohttp.WSMsgType.TEXT,
+                                        aiohttp.WSMsgType.BINARY):
+                        await self.on_data(message.data)
+                    elif message.type == aiohttp.WSMsgType.ERROR:
+                        self.on_error(ws.exception())
+                        break
+                    if ws.closed:
+                        break
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            self.on_error(error)
+        finally:
+            if self._send_task is not None and not self._send_task.done():
+                self._send_task.cancel()
+            if owns_session:
+                await session.close()
+            self.on_close()
+
+    async def send_audio(self):
+        """
+        Stream audio to server
+        """
+        ws = self.ws_client
+        if not self.audio_source.is_buffer:
+            loop = asyncio.get_running_loop()
+            while True:
+                # Read in the default executor, so that a slow file or pipe
+                # does not hold up the other sessions on the loop.
+                chunk = await loop.run_in_executor(
+                    None, self.audio_source.input.read, self.pacer.chunk_size)
+                if not chunk:
+                    break
+                await ws.send_bytes(chunk)
+                await asyncio.sleep(self.pacer.next_delay(len(chunk)))
+
+            self.audio_source.input.close()
+        else:
+            if isinstance(self.audio_source.input, asyncio.Queue):
+                await self._send_queued_audio(self._get_async)
+            else:
+                put_event = asyncio.Event()
+                loop = asyncio.get_running_loop()
+
+                def wakeup():
+                    try:
+                        loop.call_soon_threadsafe(put_event.set)
+                    except RuntimeError:
+                        # the loop is closed
+                        pass
+
+                with self.audio_source.notify_on_put(wakeup):
+                    await self._send_queued_audio(
+                        lambda: self._get_threadsafe(put_event))
+            await self.send_buffered_audio(b'', flush=True)
+
+        await asyncio.sleep(TEN_MILLISECONDS)
+        await ws.send_str(
+            RecognizeListener.build_closing_message().decode('utf8'))
+
+    async def _send_queued_audio(self, get):
+        while True:
+            chunk = await get()
+            if chunk is None:
+                if self.audio_source.is_recording:
+                    continue
+                break
+            data, finished = self.audio_source.read_backlog(
+                chunk, MAX_COALESCED_SIZE)
+            await self.send_buffered_audio(data)
+            if finished:
+                break
+
+    async def _get_async(self):
+        try:
+            return await asyncio.wait_for(self.audio_source.input.get(),
+                                          QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            return None
+
+    async def _get_threadsafe(self, put_event):
+        # Clear the event before looking at the queue, so that a put made
+        # after the check still wakes the wait below.
+        put_event.clear()
+        try:
+            return self.audio_source.input.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            await asyncio.wait_for(put_event.wait(), QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            return None
+        try:
+            return self.audio_source.input.get_nowait()
+        except queue.Empty:
+            return None
+
+    async def send_buffered_audio(self, data, flush=False):
+        """
+        Converts audio taken from a buffered source and sends it
+
+        :param bytes data: The audio
+        :param bool flush: `True` at the end of the stream
+        """
+        if self.converter is not None:
+            data = self.converter.convert(data)
+            if flush:
+                data += self.converter.flush()
+        if data:
+            await self.ws_client.send_bytes(data)
+
+    async def on_open(self):
+        """
+        Called when a connection is opened to the server. Sends the start
+        message.
+        """
+        self.callback.on_connected()
+
+        init_data = RecognizeListener.build_start_message(self.options)
+        await self.ws_client.send_str(json.dumps(init_data))
+
+    async def on_data(self, message):
+        """
+        Called when a message is received from the server.
+
+        :param str message: utf-8 string which we get from the server.
+        """
+        try:
+            json_object = decode_json(message)
+        except Exception:
+            self.on_error('Unable to parse received message.')
+            return
+
+        if 'error' in json_object:
+            error = json_object['error']
+            if error.startswith(TIMEOUT_PREFIX):
+                self.callback.on_inactivity_timeout(error)
+            else:
+                self.on_error(error)
+
+        elif 'state' in json_object:
+            if not self.isListening:
+                self.isListening = True
+                self.callback.on_listening()
+                self._send_task = asyncio.ensure_future(self.send_audio())
+                self._send_task.add_done_callback(self._on_send_done)
+            else:
+                await self.ws_client.close()
+
+        elif 'results' in json_object or 'speaker_labels' in json_object:
+            if self.time_map is not None:
+                json_object = remap_results(json_object,
+                                            self.time_map.to_original)
+            RecognizeListener.process_results(json_object, self.options,
+                                              self.callback,
+                                              self.hypothesis_throttle)
+            # let a callback that buffers results hold up reading
+            drain = getattr(self.callback, 'drain', None)
+            if drain is not None:
+                await drain()
+
+    def _on_send_done(self, task):
+        if not task.cancelled() and task.exception() is not None:
+            self.on_error(task.exception())
+
+    def on_error(self, error):
+        """
+        Called when an error is received
+
+        :param error: Exception object
+        """
+        self.callback.on_error(error)
+
+    def on_close(self):
+        """
+        Called when the websocket connection is closed
+        """
+        self.callback.on_close()
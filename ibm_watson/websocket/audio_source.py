@@ -14,6 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import contextlib
+import queue
+
+# Placed on the queue of a buffered source by `completed_recording()`
+END_OF_STREAM = object()
+
 
 class AudioSource(object):
     """"Audio source for the speech to text recognize using websocket"""
@@ -31,6 +38,64 @@ class AudioSource(object):
 
     def completed_recording(self):
         """
-        Sets the `is_recording` to False
+        Sets the `is_recording` to False. For a buffered source, also queues an
+        end-of-stream marker so the listener stops as soon as the queued audio
+        has been sent. With an `asyncio.Queue`, call this from the event loop
+        thread.
         """
         self.is_recording = False
+        if self.is_buffer:
+            try:
+                self.input.put_nowait(END_OF_STREAM)
+            except (queue.Full, asyncio.QueueFull):
+                pass
+
+    @contextlib.contextmanager
+    def notify_on_put(self, wakeup):
+        """
+        Calls `wakeup` whenever an item is put in the thread-safe queue of a
+        buffered source, from the thread that puts it, so that a consumer can
+        wait for audio without blocking a thread of its own. `wakeup` must
+        not block, as it runs while the queue is locked.
+
+        :param callable wakeup: Called without arguments after each put.
+        """
+        buffer = self.input
+        put = buffer._put
+
+        def notifying_put(item):
+            put(item)
+            wakeup()
+
+        buffer._put = notifying_put
+        try:
+            yield
+        finally:
+            del buffer._put
+
+    def read_backlog(self, chunk, max_size):
+        """
+        Joins `chunk` with audio that is already waiting in the queue, without
+        blocking, so that a backlog is sent as fewer, larger messages.
+
+        :param bytes chunk: A chunk taken from the queue.
+        :param int max_size: Stop coalescing once this many bytes are joined.
+        :return: The joined audio and whether the end-of-stream marker was read.
+        :rtype: tuple
+        """
+        if chunk is END_OF_STREAM:
+            return b'', True
+        chunks = [chunk]
+        size = len(chunk)
+        finished = False
+        while size < max_size:
+            try:
+                chunk = self.input.get_nowait()
+            except (queue.Empty, asyncio.QueueEmpty):
+                break
+            if chunk is END_OF_STREAM:
+                finished = True
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+        return b''.join(chunks), finished
@@ -0,0 +1,161 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+import time
+from collections import deque
+
+# Seconds to wait before retrying after a connection could not be opened
+RETRY_DELAY = 1
+
+logger = logging.getLogger(__name__)
+
+
+class RecognizeConnectionPool(object):
+    """
+    Keeps connections to the Speech to Text websocket interface open and
+    authenticated ahead of time, so that a recognize session can send its start
+    message without waiting for the TLS and websocket handshakes.
+
+    A background thread keeps `size` idle connections ready. An idle
+    connection is replaced after `idle_timeout` seconds, before the service
+    closes it, and before the access token it was opened with expires.
+    `acquire` opens a connection directly when none is ready. Create pools
+    with `SpeechToTextV1.create_websocket_pool`.
+
+    :param connect: A function that opens a connection and returns it with
+           the time, in epoch seconds, at which its access token expires, or
+           `None`.
+    :param str url: The URL the connections are opened to.
+    :param int size: (optional) Number of idle connections to keep.
+    :param float idle_timeout: (optional) Seconds an idle connection is kept.
+    :attr int hits: Number of connections acquired from the pool.
+    :attr int misses: Number of connections opened because none was ready.
+    """
+
+    def __init__(self, connect, url, size=1, idle_timeout=20.0):
+        if size < 1:
+            raise ValueError('size must be at least 1')
+        self.url = url
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.hits = 0
+        self.misses = 0
+        self._connect = connect
+        self._idle = deque()
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._maintain, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def acquire(self):
+        """
+        Takes an open connection out of the pool. The caller owns the
+        connection and closes it when done.
+
+        :rtype: websocket.WebSocket
+        """
+        stale = []
+        connection = None
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('The connection pool is closed')
+            now = time.time()
+            while self._idle:
+                candidate, expires_at = self._idle.popleft()
+                if expires_at > now and candidate.connected:
+                    connection = candidate
+                    break
+                stale.append(candidate)
+            if connection is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._condition.notify_all()
+        self._close_all(stale)
+        if connection is None:
+            connection = self._open()[0]
+        return connection
+
+    def close(self):
+        """Closes the idle connections and stops refilling the pool."""
+        with self._condition:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._condition.notify_all()
+        self._close_all(idle)
+        self._thread.join()
+
+    def _open(self):
+        connection, token_expiry = self._connect()
+        expires_at = time.time() + self.idle_timeout
+        if token_expiry:
+            expires_at = min(expires_at, token_expiry)
+        return connection, expires_at
+
+    def _maintain(self):
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+                now = time.time()
+                fresh, stale = deque(), []
+                for connection, expires_at in self._idle:
+                    if expires_at > now and connection.connected:
+                        fresh.append((connection, expires_at))
+                    else:
+                        stale.append(connection)
+                self._idle = fresh
+                missing = self.size - len(self._idle)
+            self._close_all(stale)
+
+            if missing > 0:
+                try:
+                    entry = self._open()
+                except Exception as error:  # pylint: disable=broad-except
+                    logger.debug('Could not open a pooled connection: %s',
+                                 error)
+                    with self._condition:
+                        self._condition.wait(RETRY_DELAY)
+                    continue
+                with self._condition:
+                    if not self._closed:
+                        self._idle.append(entry)
+                        continue
+                self._close_all([entry[0]])
+                return
+
+            with self._condition:
+                if self._closed:
+                    return
+                next_expiry = min(expires_at for _, expires_at in self._idle)
+                self._condition.wait(max(0, next_expiry - time.time()))
+
+    @staticmethod
+    def _close_all(connections):
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception:  # pylint: disable=broad-except
+                pass
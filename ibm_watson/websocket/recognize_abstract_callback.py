@@ -50,6 +50,13 @@ class RecognizeCallback(object):
         Called when an interim result is received.
         """
 
+    def on_hypothesis_diff(self, keep, text):
+        """
+        Called instead of `on_hypothesis` when a `HypothesisThrottle` delivers
+        diffs. The new hypothesis is the first `keep` characters of the
+        previous one followed by `text`.
+        """
+
     def on_data(self, data):
         """
         Called when the service returns results. The data is returned unparsed.
@@ -16,8 +16,15 @@
 
 import websocket
 import json
+import os
+import queue
+import threading
 import time
 import ssl
+from collections import deque
+from ..audio_utils import peek_audio_format, parse_content_type
+from ..common import decode_json
+from ..recognition_results import remap_results, offset_results
 try:
     import thread
 except ImportError:
@@ -30,9 +37,201 @@ STATE = "state"
 ACTION = "action"
 START = "start"
 STOP = "stop"
+PACING_FAST = "fast"
+PACING_REALTIME = "realtime"
+# Seconds of audio sent per websocket message when the byte rate is known
+PACKET_DURATION = 0.1
+# Message size for compressed audio, whose byte rate is unknown
+COMPRESSED_CHUNK_SIZE = 16 * ONE_KB
+# Largest message built by coalescing a backlog of buffered audio
+MAX_COALESCED_SIZE = 64 * ONE_KB
+# How long to block on an empty buffer before re-checking `is_recording`, for
+# callers that clear it without calling `AudioSource.completed_recording()`
+QUEUE_TIMEOUT = 1
+# Seconds to wait before reconnecting, doubled after each failed attempt
+RECONNECT_DELAY = 1
+MAX_RECONNECT_DELAY = 30
+
+
+class AudioPacer(object):
+    """
+    Decides how much audio to send per websocket message and how long to wait
+    between messages.
+
+    With `pacing=None` audio is sent in 1 KB chunks every 10 ms. `fast` sends
+    as fast as the connection allows, in chunks sized for the audio format.
+    `realtime` sends audio at the rate it would play back, which requires the
+    byte rate to be known from `content_type` or the WAV header; otherwise it
+    falls back to the default cadence.
+    """
+
+    def __init__(self, pacing=None, audio_format=None):
+        if pacing not in (None, PACING_FAST, PACING_REALTIME):
+            raise ValueError(
+                'pacing must be one of None, "{0}" or "{1}"'.format(
+                    PACING_FAST, PACING_REALTIME))
+        bytes_per_second = audio_format.bytes_per_second \
+            if audio_format is not None else None
+        if pacing == PACING_REALTIME and bytes_per_second is None:
+            pacing = None
+        self.pacing = pacing
+        self.bytes_per_second = bytes_per_second
+
+        if pacing is None:
+            self.chunk_size = ONE_KB
+        elif bytes_per_second is not None:
+            frame_size = audio_format.frame_size
+            self.chunk_size = max(
+                frame_size,
+                int(bytes_per_second * PACKET_DURATION) // frame_size *
+                frame_size)
+        else:
+            self.chunk_size = COMPRESSED_CHUNK_SIZE
+        self._start = None
+        self._sent = 0
+
+    @classmethod
+    def for_source(cls, pacing, content_type, audio_source):
+        """
+        Creates a pacer for an `AudioSource`, reading the WAV header of
+        seekable file input when needed.
+        """
+        if pacing is None or content_type is None:
+            return cls(pacing)
+        stream = None if audio_source.is_buffer else audio_source.input
+        return cls(pacing, peek_audio_format(content_type, stream))
+
+    def next_delay(self, sent):
+        """
+        Records that `sent` bytes were sent and returns the number of seconds
+        to wait before sending the next chunk.
+        """
+        if self.pacing is None:
+            return TEN_MILLISECONDS
+        if self.pacing == PACING_FAST:
+            return 0
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+        self._sent += sent
+        return max(0, self._start + self._sent / self.bytes_per_second - now)
+
+
+class HypothesisThrottle(object):
+    """
+    Reduces the interim hypotheses delivered to a `RecognizeCallback`.
+
+    An interim result is only delivered, to `on_hypothesis` and `on_data`,
+    when at least `min_interval` seconds have passed since the last delivered
+    one and, with `stable_prefix`, when the hypothesis changed other than in
+    its last word, which the service revises most often. Final results are
+    always delivered. With `diffs`, `on_hypothesis_diff` receives the change
+    from the previous hypothesis of the same result instead of `on_hypothesis`
+    receiving the whole text.
+
+    A throttle keeps state and must not be shared between sessions.
+
+    :param float min_interval: (optional) Minimum seconds between delivered
+           interim results.
+    :param bool stable_prefix: (optional) Only deliver interim results whose
+           hypothesis changed before its last word.
+    :param bool diffs: (optional) Deliver hypotheses to `on_hypothesis_diff`.
+    """
+
+    def __init__(self, min_interval=0, stable_prefix=False, diffs=False):
+        self.min_interval = min_interval
+        self.stable_prefix = stable_prefix
+        self.diffs = diffs
+        self.reset()
+
+    def reset(self):
+        """Forgets the previous hypotheses, as at the start of a session."""
+        self._delivered_at = None
+        self._prefix = None
+        self._text = ''
+
+    def accept(self, hypothesis, final):
+        """
+        Whether a result with `hypothesis` should be delivered.
+
+        :rtype: bool
+        """
+        if final:
+            return True
+        now = time.monotonic()
+        if self._delivered_at is not None and \
+                now - self._delivered_at < self.min_interval:
+            return False
+        if self.stable_prefix:
+            prefix = (hypothesis or '').split()[:-1]
+            if prefix == self._prefix:
+                return False
+            self._prefix = prefix
+        self._delivered_at = now
+        return True
+
+    def deliver(self, hypothesis, final, callback):
+        """Passes an accepted hypothesis to the callback."""
+        if not self.diffs:
+            callback.on_hypothesis(hypothesis)
+        else:
+            keep = len(os.path.commonprefix([self._text, hypothesis]))
+            callback.on_hypothesis_diff(keep, hypothesis[keep:])
+            self._text = hypothesis
+        if final:
+            # the next hypothesis belongs to a new result
+            self._text = ''
+            self._prefix = None
+
+
+class AudioHistory(object):
+    """
+    Ring buffer of the most recent audio sent in a session, addressed by byte
+    offset from the start of the stream.
+
+    :param int max_size: Number of bytes to keep.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.start = 0
+        self.end = 0
+        self._chunks = deque()
+
+    def append(self, data):
+        """Adds audio, dropping the oldest audio beyond `max_size`."""
+        self._chunks.append(data)
+        self.end += len(data)
+        while self.end - self.start - len(self._chunks[0]) >= self.max_size:
+            self.start += len(self._chunks.popleft())
+
+    def read_from(self, offset):
+        """
+        Returns the audio from `offset` to the end and the offset it starts at,
+        which is later than `offset` if that audio was already dropped.
+
+        :rtype: tuple
+        """
+        data = b''.join(self._chunks)
+        offset = min(max(offset, self.start), self.end)
+        return data[offset - self.start:], offset
 
 
 class RecognizeListener(object):
+    """
+    Runs a recognize session over a websocket. The constructor returns when the
+    session ends.
+
+    With `max_reconnects` set, a session that fails after the service started
+    listening is resumed on a new connection: the audio sent since the end of
+    the last final result is replayed from a ring buffer of the last
+    `replay_buffer_seconds` seconds, and the times and indexes in the results
+    of the new connection are shifted to continue those of the previous ones.
+    This requires audio with a fixed byte rate (`audio/l16`, `audio/mulaw`,
+    `audio/alaw` or `audio/basic`) and turns on `timestamps`. Errors and
+    `on_close` are then only reported once no further attempt is made, and
+    `on_connected` and `on_listening` only for the first connection.
+    """
 
     def __init__(self,
                  audio_source,
@@ -42,7 +241,15 @@ class RecognizeListener(object):
                  headers,
                  http_proxy_host=None,
                  http_proxy_port=None,
-                 verify=None):
+                 verify=None,
+                 pacing=None,
+                 converter=None,
+                 time_map=None,
+                 max_reconnects=0,
+                 replay_buffer_seconds=60,
+                 connection=None,
+                 keep_open=False,
+                 hypothesis_throttle=None):
         self.audio_source = audio_source
         self.options = options
         self.callback = callback
@@ -52,10 +259,108 @@ class RecognizeListener(object):
         self.http_proxy_port = http_proxy_port
         self.isListening = False
         self.verify = verify
-
+        self.pacer = AudioPacer.for_source(pacing, options.get('content_type'),
+                                           audio_source)
+        self.converter = converter
+        self.time_map = time_map
+        self.max_reconnects = max_reconnects
+        self.history = None
+        if max_reconnects:
+            audio_format = parse_content_type(options.get('content_type'))
+            if audio_format.bytes_per_second is None:
+                raise ValueError(
+                    'Reconnecting requires audio with a known byte rate, such '
+                    'as audio/l16;rate=16000')
+            self.bytes_per_second = audio_format.bytes_per_second
+            self.frame_size = audio_format.frame_size
+            self.history = AudioHistory(
+                int(self.bytes_per_second * replay_buffer_seconds))
+            options['timestamps'] = True
+        self._send_lock = threading.Lock()
+        self._sending = False
+        self._ready = False
+        self._audio_done = False
+        self._finished = False
+        self.completed = False
+        self._error = None
+        self._time_base = 0.0
+        self._index_base = 0
+        self._resume_time = 0.0
+        self._next_index = 0
+        self.connection = connection
+        self.keep_open = keep_open
+        self.hypothesis_throttle = hypothesis_throttle
+        if hypothesis_throttle is not None:
+            hypothesis_throttle.reset()
+
+        self.ws_client = None
+        attempts = 0
+        while True:
+            next_index = self._next_index
+            self.connect()
+            if self.history is None or self._finished or not self._sending:
+                break
+            if self._next_index > next_index:
+                # the connection made progress before it failed
+                attempts = 0
+            if attempts >= self.max_reconnects:
+                break
+            time.sleep(min(RECONNECT_DELAY * 2**attempts, MAX_RECONNECT_DELAY))
+            attempts += 1
+        if self.history is not None:
+            if self._error is None and self._sending and not self._finished:
+                self._error = 'The connection closed before the session ended'
+            if self._error is not None:
+                self.callback.on_error(self._error)
+            self.callback.on_close()
+
+    def connect(self):
+        """
+        Opens a connection, or takes the one passed to the constructor, and
+        runs it until it is closed.
+        """
+        self.isListening = False
+        connection, self.connection = self.connection, None
+        if connection is not None:
+            self.run_connection(connection)
+        else:
+            self.run_app()
+        with self._send_lock:
+            self._ready = False
+
+    def run_connection(self, connection):
+        """
+        Runs the session on an already open `websocket.WebSocket`, such as one
+        taken from a `RecognizeConnectionPool`. With `keep_open`, a connection
+        that completes the session is left open for another one.
+        """
+        self.ws_client = connection
+        kept_open = False
+        try:
+            self.on_open(connection)
+            while connection.connected:
+                opcode, data = connection.recv_data()
+                if opcode == websocket.ABNF.OPCODE_CLOSE:
+                    break
+                self.on_data(connection, data, opcode, True)
+                if self.keep_open and self.completed:
+                    # the service is listening for the next request
+                    kept_open = True
+                    break
+        except (websocket.WebSocketException, OSError) as error:
+            self.on_error(connection, error)
+        finally:
+            if not kept_open:
+                connection.close()
+                self.on_close(connection)
+
+    def run_app(self):
+        """
+        Opens a new connection and runs it until it is closed.
+        """
         self.ws_client = websocket.WebSocketApp(
             self.url,
-            header=self.headers,
+            header=self.headers() if callable(self.headers) else self.headers,
             on_open=self.on_open,
             on_data=self.on_data,
             on_error=self.on_error,
@@ -87,6 +392,48 @@ class RecognizeListener(object):
             transcripts.append(transcript)
         return transcripts
 
+    @classmethod
+    def process_results(cls, json_object, options, callback, throttle=None):
+        """
+        Dispatch a `results` or `speaker_labels` message to the callback
+
+        :param dict json_object: Parsed message received from the server
+        :param dict options: The recognition options sent in the start message
+        :param RecognizeCallback callback: The callback to notify
+        :param HypothesisThrottle throttle: (optional) Filters interim results
+        """
+        # If results are present, extract the hypothesis and, if finalized, the full
+        # set of transcriptions and send them to the appropriate callbacks.
+        results = json_object.get('results')
+        if results:
+            if (options.get('interim_results') is True):
+                b_final = (results[0].get('final') is True)
+                alternatives = results[0].get('alternatives')
+                if alternatives:
+                    hypothesis = alternatives[0].get('transcript')
+                    if throttle is not None and \
+                            not throttle.accept(hypothesis, b_final):
+                        return
+                    transcripts = cls.extract_transcripts(alternatives)
+                    if b_final:
+                        callback.on_transcription(transcripts)
+                    if hypothesis:
+                        if throttle is not None:
+                            throttle.deliver(hypothesis, b_final, callback)
+                        else:
+                            callback.on_hypothesis(hypothesis)
+            else:
+                final_transcript = []
+                for result in results:
+                    transcript = cls.extract_transcripts(
+                        result.get('alternatives'))
+                    final_transcript.append(transcript)
+
+                callback.on_transcription(final_transcript)
+
+        # Always call the on_data callback if 'results' or 'speaker_labels' are present
+        callback.on_data(json_object)
+
     def send(self, data, opcode=websocket.ABNF.OPCODE_TEXT):
         """
         Send message to server.
@@ -108,38 +455,140 @@ class RecognizeListener(object):
             """Background process to stream the data"""
             if not self.audio_source.is_buffer:
                 while True:
-                    chunk = self.audio_source.input.read(ONE_KB)
+                    chunk = self.audio_source.input.read(self.pacer.chunk_size)
                     if not chunk:
                         break
-                    self.ws_client.send(chunk, websocket.ABNF.OPCODE_BINARY)
-                    time.sleep(TEN_MILLISECONDS)
+                    if not self.send_audio_data(chunk):
+                        return
+                    delay = self.pacer.next_delay(len(chunk))
+                    if delay:
+                        time.sleep(delay)
 
                 self.audio_source.input.close()
             else:
                 while True:
                     try:
-                        if not self.audio_source.input.empty():
-                            chunk = self.audio_source.input.get()
-                            self.ws_client.send(chunk,
-                                                websocket.ABNF.OPCODE_BINARY)
-                            time.sleep(TEN_MILLISECONDS)
-                        if self.audio_source.input.empty():
-                            if self.audio_source.is_recording:
-                                time.sleep(TEN_MILLISECONDS)
-                            else:
-                                break
-                    except Exception:
+                        chunk = self.audio_source.input.get(
+                            timeout=QUEUE_TIMEOUT)
+                    except queue.Empty:
                         if self.audio_source.is_recording:
-                            time.sleep(TEN_MILLISECONDS)
-                        else:
-                            break
+                            continue
+                        break
+                    data, finished = self.audio_source.read_backlog(
+                        chunk, MAX_COALESCED_SIZE)
+                    if not self.send_buffered_audio(data):
+                        return
+                    if finished:
+                        break
+                if not self.send_buffered_audio(b'', flush=True):
+                    return
 
             time.sleep(TEN_MILLISECONDS)
-            self.ws_client.send(self.build_closing_message(),
-                                websocket.ABNF.OPCODE_TEXT)
+            self.send_closing_message()
 
+        self._sending = True
+        self._ready = True
         thread.start_new_thread(run, ())
 
+    def send_buffered_audio(self, data, flush=False):
+        """
+        Converts audio taken from a buffered source and sends it
+
+        :param bytes data: The audio
+        :param bool flush: `True` at the end of the stream
+        :return: `False` if the connection failed
+        """
+        if self.converter is not None:
+            data = self.converter.convert(data)
+            if flush:
+                data += self.converter.flush()
+        if data:
+            return self.send_audio_data(data)
+        return True
+
+    def send_audio_data(self, data):
+        """
+        Sends audio on the current connection. When reconnecting is enabled the
+        audio is also kept for replay, and audio sent while disconnected is
+        only kept.
+
+        :param bytes data: The audio
+        :return: `False` if the connection failed and cannot be resumed
+        """
+        with self._send_lock:
+            if self.history is not None:
+                self.history.append(data)
+                if not self._ready:
+                    return True
+            try:
+                self.ws_client.send(data, websocket.ABNF.OPCODE_BINARY)
+            except websocket.WebSocketException as error:
+                if self.history is not None:
+                    self._ready = False
+                    return True
+                self.on_error(self.ws_client, error)
+                return False
+        return True
+
+    def send_closing_message(self):
+        """
+        Tells the service that all audio was sent. When disconnected, the
+        message is sent after the audio is replayed on the next connection.
+        """
+        with self._send_lock:
+            self._audio_done = True
+            if self.history is None:
+                self.ws_client.send(self.build_closing_message(),
+                                    websocket.ABNF.OPCODE_TEXT)
+            elif self._ready:
+                try:
+                    self.ws_client.send(self.build_closing_message(),
+                                        websocket.ABNF.OPCODE_TEXT)
+                except websocket.WebSocketException:
+                    self._ready = False
+
+    def resume(self):
+        """
+        Replays the audio sent since the end of the last final result on a new
+        connection and continues streaming on it.
+        """
+        with self._send_lock:
+            offset = int(self._resume_time * self.bytes_per_second)
+            offset -= offset % self.frame_size
+            data, offset = self.history.read_from(offset)
+            self._time_base = offset / float(self.bytes_per_second)
+            self._index_base = self._next_index
+            try:
+                for i in range(0, len(data), MAX_COALESCED_SIZE):
+                    self.ws_client.send(data[i:i + MAX_COALESCED_SIZE],
+                                        websocket.ABNF.OPCODE_BINARY)
+                if self._audio_done:
+                    self.ws_client.send(self.build_closing_message(),
+                                        websocket.ABNF.OPCODE_TEXT)
+            except websocket.WebSocketException:
+                return
+            self._error = None
+            self._ready = True
+
+    def rebase_results(self, json_object):
+        """
+        Moves results received on a resumed connection onto the timeline of the
+        whole stream, and records where the last final result ends.
+        """
+        if self._time_base or self._index_base:
+            json_object = offset_results(json_object, self._time_base,
+                                         self._index_base)
+        result_index = json_object.get('result_index', self._index_base)
+        for i, result in enumerate(json_object.get('results', [])):
+            if not result.get('final'):
+                continue
+            self._next_index = max(self._next_index, result_index + i + 1)
+            alternatives = result.get('alternatives') or [{}]
+            timestamps = alternatives[0].get('timestamps')
+            if timestamps:
+                self._resume_time = max(self._resume_time, timestamps[-1][2])
+        return json_object
+
     def on_open(self, ws):
         """
         Callback executed when a connection is opened to the server.
@@ -147,7 +596,8 @@ class RecognizeListener(object):
 
         :param ws: Websocket client
         """
-        self.callback.on_connected()
+        if not self._sending:
+            self.callback.on_connected()
 
         # Send initialization message
         init_data = self.build_start_message(self.options)
@@ -165,9 +615,10 @@ class RecognizeListener(object):
         """
 
         try:
-            json_object = json.loads(message)
+            json_object = decode_json(message)
         except Exception:
             self.on_error(ws, 'Unable to parse received message.')
+            return
 
         if 'error' in json_object:
             # Only call on_error() if a real error occurred. The STT service sends
@@ -175,6 +626,7 @@ class RecognizeListener(object):
             # options.inactivity_timeout
             error = json_object['error']
             if error.startswith(TIMEOUT_PREFIX):
+                self._finished = True
                 self.callback.on_inactivity_timeout(error)
             else:
                 self.on_error(ws, error)
@@ -183,40 +635,29 @@ class RecognizeListener(object):
         elif 'state' in json_object:
             if not self.isListening:
                 self.isListening = True
-                self.callback.on_listening()
-                self.send_audio(ws)
+                if self._sending:
+                    self.resume()
+                else:
+                    self.callback.on_listening()
+                    self.send_audio(ws)
             else:
                 # close the connection
-                self.callback.on_close()
-                ws.close()
+                self._finished = True
+                self.completed = True
+                if self.history is None:
+                    self.callback.on_close()
+                if not self.keep_open:
+                    ws.close()
 
         # if in streaming
         elif 'results' in json_object or 'speaker_labels' in json_object:
-            # If results are present, extract the hypothesis and, if finalized, the full
-            # set of transcriptions and send them to the appropriate callbacks.
-            results = json_object.get('results')
-            if results:
-                if (self.options.get('interim_results') is True):
-                    b_final = (results[0].get('final') is True)
-                    alternatives = results[0].get('alternatives')
-                    if alternatives:
-                        hypothesis = alternatives[0].get('transcript')
-                        transcripts = self.extract_transcripts(alternatives)
-                        if b_final:
-                            self.callback.on_transcription(transcripts)
-                        if hypothesis:
-                            self.callback.on_hypothesis(hypothesis)
-                else:
-                    final_transcript = []
-                    for result in results:
-                        transcript = self.extract_transcripts(
-                            result.get('alternatives'))
-                        final_transcript.append(transcript)
-
-                    self.callback.on_transcription(final_transcript)
-
-            # Always call the on_data callback if 'results' or 'speaker_labels' are present
-            self.callback.on_data(json_object)
+            if self.history is not None:
+                json_object = self.rebase_results(json_object)
+            if self.time_map is not None:
+                json_object = remap_results(json_object,
+                                            self.time_map.to_original)
+            self.process_results(json_object, self.options, self.callback,
+                                 self.hypothesis_throttle)
 
     def on_error(self, ws, error):
         """
@@ -225,6 +666,11 @@ class RecognizeListener(object):
         :param ws: Websocket client
         :param error: Exception object
         """
+        if self.history is not None and self._sending:
+            # reported when the session ends without being resumed
+            self._error = error
+            return
+        self._finished = True
         self.callback.on_error(error)
 
     def on_close(self, ws, *args):
@@ -233,4 +679,5 @@ class RecognizeListener(object):
 
         :param ws: Websocket client
         """
-        self.callback.on_close()
+        if self.history is None:
+            self.callback.on_close()
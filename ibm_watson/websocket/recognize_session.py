@@ -0,0 +1,181 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import threading
+
+from .audio_source import AudioSource
+from .recognize_abstract_callback import RecognizeCallback
+from .recognize_listener import RecognizeListener
+
+
+class _UtteranceCallback(RecognizeCallback):
+    """
+    Collects the final results of one utterance and forwards every event to
+    the caller's callback, if any.
+    """
+
+    def __init__(self, callback=None):
+        RecognizeCallback.__init__(self)
+        self.callback = callback or RecognizeCallback()
+        self.results = {}
+        self.speaker_labels = []
+        self.warnings = []
+        self.errors = []
+
+    def on_transcription(self, transcript):
+        self.callback.on_transcription(transcript)
+
+    def on_connected(self):
+        self.callback.on_connected()
+
+    def on_error(self, error):
+        self.errors.append(error)
+        self.callback.on_error(error)
+
+    def on_inactivity_timeout(self, error):
+        self.callback.on_inactivity_timeout(error)
+
+    def on_listening(self):
+        self.callback.on_listening()
+
+    def on_hypothesis(self, hypothesis):
+        self.callback.on_hypothesis(hypothesis)
+
+    def on_hypothesis_diff(self, keep, text):
+        self.callback.on_hypothesis_diff(keep, text)
+
+    def on_data(self, data):
+        result_index = data.get('result_index', 0)
+        for i, result in enumerate(data.get('results', [])):
+            if result.get('final'):
+                self.results[result_index + i] = result
+        self.speaker_labels.extend(data.get('speaker_labels', []))
+        for warning in data.get('warnings', []):
+            if warning not in self.warnings:
+                self.warnings.append(warning)
+        self.callback.on_data(data)
+
+    def on_close(self):
+        self.callback.on_close()
+
+    def speech_recognition_results(self):
+        results = {
+            'result_index': 0,
+            'results': [self.results[i] for i in sorted(self.results)]
+        }
+        if self.speaker_labels:
+            results['speaker_labels'] = self.speaker_labels
+        if self.warnings:
+            results['warnings'] = self.warnings
+        return results
+
+
+class RecognizeSession(object):
+    """
+    Recognizes a series of utterances, such as the turns of a voice dialog,
+    over one websocket connection instead of opening a connection for each.
+    Create sessions with `SpeechToTextV1.recognize_session`.
+
+    Each call to `recognize_utterance` sends a start message, the audio and a
+    stop message, and returns once the service has sent the final results and
+    is listening again. Utterances are recognized one at a time. A connection
+    that was closed, for example by an inactivity timeout, is reopened for the
+    next utterance.
+
+    :param connect: A function that returns an open `websocket.WebSocket`.
+    :param str url: The URL the connections are opened to.
+    :param str content_type: The format (MIME type) of the audio.
+    :param dict options: Recognition options sent in every start message.
+    :param str pacing: (optional) How audio read from a file-like
+           `AudioSource` is paced; see `recognize_using_websocket`.
+    :param preprocess: (optional) A function that takes an `AudioSource` and
+           its content type and returns the `AudioSource` to send, its content
+           type, a converter for buffered audio and a `TimeMap`.
+    """
+
+    def __init__(self,
+                 connect,
+                 url,
+                 content_type,
+                 options,
+                 pacing=None,
+                 preprocess=None):
+        self.url = url
+        self.content_type = content_type
+        self.options = options
+        self.pacing = pacing
+        self._connect = connect
+        self._preprocess = preprocess
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def recognize_utterance(self, audio, recognize_callback=None):
+        """
+        Recognizes one utterance.
+
+        :param audio: The audio, as an `AudioSource` or `bytes`.
+        :param RecognizeCallback recognize_callback: (optional) A callback that
+               receives the events of the utterance as it is recognized.
+        :return: A `dict` containing the `SpeechRecognitionResults` of the
+                 utterance, with the final results only.
+        :rtype: dict
+        """
+        if isinstance(audio, (bytes, bytearray)):
+            audio = AudioSource(io.BytesIO(audio))
+        if not isinstance(audio, AudioSource):
+            raise Exception(
+                'audio is not of type AudioSource. Import the class from ibm_watson.websocket'
+            )
+        content_type, converter, time_map = self.content_type, None, None
+        if self._preprocess is not None:
+            audio, content_type, converter, time_map = self._preprocess(
+                audio, content_type)
+        options = dict(self.options, content_type=content_type)
+        callback = _UtteranceCallback(recognize_callback)
+
+        with self._lock:
+            if self._connection is None or not self._connection.connected:
+                self._connection = self._connect()
+            listener = RecognizeListener(audio,
+                                         options,
+                                         callback,
+                                         self.url,
+                                         None,
+                                         pacing=self.pacing,
+                                         converter=converter,
+                                         time_map=time_map,
+                                         connection=self._connection,
+                                         keep_open=True)
+            if not listener.completed:
+                self._connection = None
+        if callback.errors:
+            error = callback.errors[0]
+            raise error if isinstance(error, Exception) else Exception(error)
+        return callback.speech_recognition_results()
+
+    def close(self):
+        """Closes the connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
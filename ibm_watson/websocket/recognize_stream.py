@@ -0,0 +1,296 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+from collections import deque
+
+from .recognize_abstract_callback import RecognizeCallback
+
+# Interim policies for a full buffer
+BLOCK = 'block'
+DROP_INTERIM = 'drop_interim'
+
+
+def is_interim(event):
+    """
+    Whether a `SpeechRecognitionResults` message holds an interim hypothesis
+    rather than final results.
+    """
+    results = event.get('results')
+    return bool(results) and not results[-1].get('final', False)
+
+
+def _as_exception(error):
+    if isinstance(error, BaseException):
+        return error
+    return Exception(error)
+
+
+class _ResultBuffer(RecognizeCallback):
+    """
+    Bounded buffer of `SpeechRecognitionResults` messages shared by the
+    synchronous and asyncio streams.
+    """
+
+    def __init__(self, buffer_size, interim_policy):
+        RecognizeCallback.__init__(self)
+        if buffer_size < 1:
+            raise ValueError('buffer_size must be at least 1')
+        if interim_policy not in (BLOCK, DROP_INTERIM):
+            raise ValueError('interim_policy must be "{0}" or "{1}"'.format(
+                BLOCK, DROP_INTERIM))
+        self.buffer_size = buffer_size
+        self.interim_policy = interim_policy
+        self.dropped = 0
+        self._events = deque()
+        self._finished = False
+        self._closed = False
+        self._error = None
+
+    def _is_full(self):
+        return len(self._events) >= self.buffer_size and not self._closed
+
+    def _make_room(self, event):
+        """
+        Applies the `drop_interim` policy to a full buffer: the oldest buffered
+        hypothesis is dropped, or else `event` itself if it is a hypothesis.
+
+        :return: `True` if `event` should be added, `False` if it was dropped
+                 and `None` if the caller must wait for room instead.
+        """
+        if self.interim_policy != DROP_INTERIM:
+            return None
+        for i, queued in enumerate(self._events):
+            if is_interim(queued):
+                del self._events[i]
+                self.dropped += 1
+                return True
+        if is_interim(event):
+            self.dropped += 1
+            return False
+        return None
+
+    def _finish(self, error=None):
+        if error is not None and self._error is None:
+            self._error = _as_exception(error)
+        self._finished = True
+
+    def _next_event(self):
+        if self._events:
+            return self._events.popleft()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        return None
+
+
+class _ThreadResultBuffer(_ResultBuffer):
+    """
+    The callback of a `RecognizeStream`, called from the websocket thread.
+    """
+
+    def __init__(self, buffer_size, interim_policy):
+        _ResultBuffer.__init__(self, buffer_size, interim_policy)
+        self._condition = threading.Condition()
+
+    def on_data(self, data):
+        with self._condition:
+            while self._is_full():
+                room = self._make_room(data)
+                if room is False:
+                    return
+                if room:
+                    break
+                self._condition.wait()
+            if self._closed:
+                return
+            self._events.append(data)
+            self._condition.notify_all()
+
+    def on_error(self, error):
+        with self._condition:
+            self._finish(error)
+            self._condition.notify_all()
+
+    def on_close(self):
+        with self._condition:
+            self._finish()
+            self._condition.notify_all()
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._events.clear()
+            self._condition.notify_all()
+
+    def next_event(self):
+        with self._condition:
+            while not self._events and not self._finished and \
+                    not self._closed:
+                self._condition.wait()
+            event = self._next_event()
+            self._condition.notify_all()
+            return event
+
+
+class RecognizeStream(object):
+    """
+    An iterator over the `SpeechRecognitionResults` messages of a websocket
+    recognize session, returned by `SpeechToTextV1.recognize_stream`.
+
+    Messages are buffered between the websocket thread and the consumer. When
+    `buffer_size` messages are waiting, the `block` policy stops reading from
+    the websocket until the consumer catches up, so no message is lost. The
+    `drop_interim` policy instead discards interim hypotheses, oldest first,
+    and only blocks for final results; `dropped` counts the discarded
+    hypotheses. An error reported by the service or the connection is raised
+    from the iterator once the buffered messages have been consumed.
+
+    A consumer that stops iterating early should call `close`, or use the
+    stream as a context manager, so that the websocket thread is not left
+    waiting for room in the buffer. A stream that is garbage collected is
+    closed as well.
+
+        with speech_to_text.recognize_stream(audio, content_type) as stream:
+            for message in stream:
+                ...
+
+    :param int buffer_size: (optional) Maximum number of buffered messages.
+    :param str interim_policy: (optional) `block` or `drop_interim`.
+    :attr RecognizeCallback callback: The callback the messages are passed
+          to. It holds no reference to the stream.
+    """
+
+    def __init__(self, buffer_size=100, interim_policy=BLOCK):
+        self.callback = _ThreadResultBuffer(buffer_size, interim_policy)
+
+    @property
+    def dropped(self):
+        """Number of interim hypotheses discarded by `drop_interim`."""
+        return self.callback.dropped
+
+    def close(self):
+        """
+        Stops consuming messages. The rest of the session is discarded.
+        """
+        self.callback.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        callback = getattr(self, 'callback', None)
+        if callback is not None:
+            callback.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        event = self.callback.next_event()
+        if event is None:
+            raise StopIteration
+        return event
+
+
+class AsyncRecognizeStream(_ResultBuffer):
+    """
+    asyncio counterpart of `RecognizeStream`, returned by
+    `SpeechToTextV1.recognize_stream_async`. The session starts when iteration
+    starts.
+
+    :param session: A function that takes this stream and returns a coroutine
+           running the recognize session with the stream as its callback.
+    :param int buffer_size: (optional) Maximum number of buffered messages.
+    :param str interim_policy: (optional) `block` or `drop_interim`.
+    """
+
+    def __init__(self, session, buffer_size=100, interim_policy=BLOCK):
+        _ResultBuffer.__init__(self, buffer_size, interim_policy)
+        self._session = session
+        self._task = None
+        self._changed = None
+
+    def on_data(self, data):
+        if self._is_full():
+            room = self._make_room(data)
+            if room is False:
+                return
+        if not self._closed:
+            self._events.append(data)
+            self._notify()
+
+    def on_error(self, error):
+        self._finish(error)
+        self._notify()
+
+    def on_close(self):
+        self._finish()
+        self._notify()
+
+    async def drain(self):
+        """
+        Waits until the buffer has room. Awaited by `AsyncRecognizeListener`
+        after each message, so that a full buffer stops reading from the
+        websocket.
+        """
+        while self._is_full():
+            await self._wait()
+
+    async def aclose(self):
+        """
+        Stops the recognize session and discards its remaining messages.
+        """
+        self._closed = True
+        self._events.clear()
+        self._notify()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    def _notify(self):
+        if self._changed is not None:
+            self._changed.set()
+
+    async def _wait(self):
+        self._changed.clear()
+        await self._changed.wait()
+
+    def _on_done(self, task):
+        if not task.cancelled() and task.exception() is not None:
+            self.on_error(task.exception())
+        self.on_close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._task is None:
+            if self._closed:
+                raise StopAsyncIteration
+            self._changed = asyncio.Event()
+            self._task = asyncio.ensure_future(self._session(self))
+            self._task.add_done_callback(self._on_done)
+        while not self._events and not self._finished and not self._closed:
+            await self._wait()
+        event = self._next_event()
+        if event is None:
+            raise StopAsyncIteration
+        self._notify()
+        return event
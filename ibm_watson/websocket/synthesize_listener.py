@@ -18,6 +18,7 @@ import websocket
 import json
 import ssl
 import time
+from ..common import decode_json
 try:
     import thread
 except ImportError:
@@ -94,7 +95,7 @@ class SynthesizeListener(object):
         """
         try:
             if message_type == websocket.ABNF.OPCODE_TEXT:
-                json_object = json.loads(message)
+                json_object = decode_json(message)
                 if 'binary_streams' in json_object:
                     self.callback.on_content_type(
                         json_object['binary_streams'][0]['content_type'])
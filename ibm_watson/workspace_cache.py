@@ -0,0 +1,243 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+On-disk cache of exported AssistantV1 workspaces.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+from .common import decode_json
+
+
+class WorkspaceCache(object):
+    """
+    Caches the responses of `AssistantV1.get_workspace` and
+    `export_workspace_async` on disk, gzip-compressed, and serves them again
+    while the workspace is unchanged.
+
+    A cached response is revalidated on every call with one small request:
+    if the service returned an `ETag` for it, the call is sent again with
+    `If-None-Match` and an HTTP 304 response confirms the cached copy.
+    Otherwise the `updated` timestamp of the workspace is fetched with
+    `get_workspace(export=False, include_audit=True)`, which returns no
+    workspace content, and compared with the timestamp the response was
+    cached for. Only when the workspace changed is the full response fetched
+    again.
+
+    Responses are keyed by workspace ID and the query parameters of the call,
+    so `get_workspace(export=True)` and `get_workspace(export=True,
+    sort='stable')` are cached separately. An export that is still being
+    processed is not cached. Once the files exceed `max_size` bytes, the
+    least recently used responses are deleted. The cache is thread safe, and
+    several caches can share a directory only if they are not used at the
+    same time.
+
+        cache = WorkspaceCache(assistant, '.workspace-cache')
+        workspace = cache.get_workspace(workspace_id, export=True).get_result()
+
+    :param AssistantV1 assistant: The client used to call the service.
+    :param str directory: The directory the responses are stored in.
+    :param int max_size: (optional) Maximum size in bytes of the compressed
+           responses.
+    :param int compresslevel: (optional) The gzip compression level.
+    :attr int hits: Number of calls answered from the cache.
+    :attr int misses: Number of calls that fetched the full response.
+    :attr int evictions: Number of responses deleted to stay within
+          `max_size`.
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self,
+                 assistant,
+                 directory: str,
+                 max_size: int = 512 * 1024 * 1024,
+                 compresslevel: int = 6) -> None:
+        self.assistant = assistant
+        self.directory = directory
+        self.max_size = max_size
+        self.compresslevel = compresslevel
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._index = self._load_index()
+
+    def get_workspace(self, workspace_id: str, **kwargs) -> DetailedResponse:
+        """
+        Get information about a workspace, from the cache if the workspace is
+        unchanged.
+
+        Accepts the arguments of `AssistantV1.get_workspace`.
+
+        :rtype: DetailedResponse with `dict` result representing a `Workspace`
+                object
+        """
+        return self._get('get_workspace', workspace_id, kwargs)
+
+    def export_workspace_async(self, workspace_id: str,
+                               **kwargs) -> DetailedResponse:
+        """
+        Export workspace asynchronously, from the cache if the workspace is
+        unchanged.
+
+        Accepts the arguments of `AssistantV1.export_workspace_async`. A
+        cached export is returned without starting a new one.
+
+        :rtype: DetailedResponse with `dict` result representing a `Workspace`
+                object
+        """
+        return self._get('export_workspace_async', workspace_id, kwargs)
+
+    def clear(self) -> None:
+        """Deletes all cached responses."""
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+            self._save_index()
+
+    def _get(self, method_name, workspace_id, kwargs):
+        method = getattr(self.assistant, method_name)
+        params = {
+            name: value
+            for name, value in kwargs.items()
+            if name != 'headers' and value is not None
+        }
+        key = hashlib.sha256(
+            json.dumps([method_name, workspace_id, params],
+                       sort_keys=True).encode('utf-8')).hexdigest()
+        with self._lock:
+            entry = self._index.get(key)
+
+        updated = None
+        if entry is not None and entry.get('etag'):
+            headers = dict(kwargs.get('headers') or {})
+            headers['If-None-Match'] = entry['etag']
+            try:
+                response = method(workspace_id,
+                                  **dict(kwargs, headers=headers))
+            except ApiException as error:
+                if error.status_code != 304:
+                    raise
+                cached = self._read(key)
+                if cached is not None:
+                    return cached
+                response = method(workspace_id, **kwargs)
+        else:
+            updated = self._updated(workspace_id)
+            if entry is not None and entry.get('updated') == updated:
+                cached = self._read(key)
+                if cached is not None:
+                    return cached
+            response = method(workspace_id, **kwargs)
+
+        self.misses += 1
+        result = response.get_result()
+        if method_name == 'export_workspace_async' and \
+                result.get('status') != 'Available':
+            return response
+        self._write(key, response, updated)
+        return response
+
+    def _updated(self, workspace_id) -> Optional[str]:
+        response = self.assistant.get_workspace(workspace_id,
+                                                export=False,
+                                                include_audit=True)
+        return response.get_result().get('updated')
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.json.gz')
+
+    def _read(self, key):
+        try:
+            with open(self._path(key), 'rb') as file:
+                cached = decode_json(gzip.decompress(file.read()))
+        except (OSError, ValueError):
+            with self._lock:
+                self._remove(key)
+                self._save_index()
+            return None
+        with self._lock:
+            if key in self._index:
+                self._index[key]['last_used'] = time.time()
+                self._save_index()
+        self.hits += 1
+        return DetailedResponse(response=cached['result'],
+                                headers=cached['headers'],
+                                status_code=cached['status_code'])
+
+    def _write(self, key, response, updated):
+        headers = dict(response.get_headers() or {})
+        data = gzip.compress(
+            json.dumps({
+                'result': response.get_result(),
+                'headers': headers,
+                'status_code': response.get_status_code()
+            }).encode('utf-8'), self.compresslevel)
+        if len(data) > self.max_size:
+            return
+        etag = next((value for name, value in headers.items()
+                     if name.lower() == 'etag'), None)
+        with self._lock:
+            path = self._path(key)
+            with open(path + '.tmp', 'wb') as file:
+                file.write(data)
+            os.replace(path + '.tmp', path)
+            self._index[key] = {
+                'updated': updated,
+                'etag': etag,
+                'size': len(data),
+                'last_used': time.time()
+            }
+            total = sum(entry['size'] for entry in self._index.values())
+            for old in sorted(self._index,
+                              key=lambda k: self._index[k]['last_used']):
+                if total <= self.max_size:
+                    break
+                total -= self._index[old]['size']
+                self._remove(old)
+                self.evictions += 1
+            self._save_index()
+
+    def _remove(self, key):
+        self._index.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _load_index(self):
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        with open(path + '.tmp', 'w', encoding='utf-8') as file:
+            json.dump(self._index, file)
+        os.replace(path + '.tmp', path)
@@ -0,0 +1,420 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Incremental synchronization of AssistantV1 workspaces.
+"""
+
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+from .common import retry_delay
+from .pagination import is_retryable
+
+# Workspace properties that are updated with `update_workspace`
+WORKSPACE_PROPERTIES = [
+    'name', 'description', 'language', 'metadata', 'learning_opt_out',
+    'system_settings', 'webhooks'
+]
+# Dialog node properties that `update_dialog_node` can change
+DIALOG_NODE_PROPERTIES = [
+    'description', 'conditions', 'parent', 'previous_sibling', 'output',
+    'context', 'metadata', 'next_step', 'title', 'type', 'event_name',
+    'variable', 'actions', 'digress_in', 'digress_out', 'digress_out_slots',
+    'user_label', 'disambiguation_opt_out'
+]
+# Properties set by the service that are not compared
+AUDIT_PROPERTIES = ('created', 'updated')
+
+
+class WorkspaceChange(
+        namedtuple('WorkspaceChange', ['action', 'kind', 'name', 'method',
+                                       'kwargs'])):
+    """
+    A call that changes one element of a workspace.
+
+    :attr str action: `create`, `update` or `delete`.
+    :attr str kind: `workspace`, `intent`, `entity`, `counterexample`,
+          `dialog_node` or `dialog_nodes` when all dialog nodes are replaced.
+    :attr str name: The name of the element.
+    :attr str method: The name of the `AssistantV1` method to call.
+    :attr dict kwargs: The keyword arguments of the call, other than
+          `workspace_id`.
+    """
+
+
+def _clean(value):
+    if isinstance(value, dict):
+        return {
+            key: _clean(item)
+            for key, item in value.items()
+            if item is not None and key not in AUDIT_PROPERTIES
+        }
+    if isinstance(value, list):
+        return [_clean(item) for item in value]
+    return value
+
+
+def _intent(intent):
+    intent = _clean(intent)
+    examples = sorted(intent.get('examples', []),
+                      key=lambda example: example['text'])
+    intent['examples'] = [{
+        key: value
+        for key, value in example.items()
+        if key != 'mentions' or value
+    } for example in examples]
+    intent.setdefault('description', '')
+    return intent
+
+
+def _entity(entity):
+    entity = _clean(entity)
+    values = []
+    for value in sorted(entity.get('values', []),
+                        key=lambda value: value['value']):
+        value = dict(value)
+        value.setdefault('type', 'synonyms')
+        for key in ('synonyms', 'patterns', 'metadata'):
+            # An empty property is the same as a missing one.
+            if not value.get(key):
+                value.pop(key, None)
+        for key in ('synonyms', 'patterns'):
+            if key in value:
+                value[key] = sorted(value[key])
+        values.append(value)
+    entity['values'] = values
+    entity.setdefault('description', '')
+    entity.setdefault('metadata', {})
+    entity.setdefault('fuzzy_match', False)
+    return entity
+
+
+def _dialog_node(node):
+    node = _clean(node)
+    node.setdefault('type', 'standard')
+    if node.get('disabled') is False:
+        del node['disabled']
+    return node
+
+
+def _by_key(elements, key, canonical=_clean):
+    return {element[key]: canonical(element) for element in elements or []}
+
+
+class WorkspaceSync(object):
+    """
+    Deploys a local workspace definition by changing only what differs from
+    the live workspace, instead of sending the whole workspace with
+    `update_workspace`.
+
+    `plan` compares the definition with the live workspace, fetched with
+    `get_workspace(export=True)`, and returns the calls that make them
+    equal:
+
+    * changed workspace properties, such as `name` or `system_settings`, with
+      one `update_workspace` call that includes no elements,
+    * one `create_*`, `update_*` or `delete_*` call for each intent, entity,
+      counterexample and dialog node that was added, changed or removed.
+      A changed intent or entity is sent with all its examples or values.
+
+    `apply` sends the calls of a plan concurrently, in stages that keep the
+    dialog tree valid: new dialog nodes are created after their parent and
+    previous sibling, moved nodes are updated one at a time after that, and
+    removed nodes are deleted last, without their removed descendants. If a
+    dialog node change cannot be made with `create_dialog_node` or
+    `update_dialog_node`, such as removing a property or changing `disabled`,
+    all dialog nodes are replaced with one `update_workspace` call instead.
+    Requests that are rate limited or fail with HTTP 5xx are sent again.
+
+    Elements are matched by name, so a renamed element is deleted and
+    created again. Properties the service fills in with a default, such as
+    the `type` of an entity value or dialog node, are compared with that
+    default. A kind of element that the definition has no key for, such as
+    `intents`, is left unchanged.
+
+        sync = WorkspaceSync(assistant, workspace_id)
+        changes = sync.sync(json.load(open('workspace.json')))
+
+    :param AssistantV1 assistant: The client used to call the service.
+    :param str workspace_id: Unique identifier of the workspace.
+    :param int max_workers: (optional) Number of calls sent at the same time.
+    :param int max_retries: (optional) Number of times a failed request is
+           sent again.
+    :attr int calls: Number of calls that succeeded.
+    :attr int retries: Number of calls sent again.
+    """
+
+    def __init__(self,
+                 assistant,
+                 workspace_id: str,
+                 max_workers: int = 8,
+                 max_retries: int = 5) -> None:
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        self.assistant = assistant
+        self.workspace_id = workspace_id
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.calls = 0
+        self.retries = 0
+
+    def sync(self, workspace) -> List[WorkspaceChange]:
+        """
+        Makes the live workspace equal to a local definition.
+
+        :param workspace: The definition, as a `Workspace` or the `dict` of an
+               exported workspace.
+        :return: The changes that were made.
+        :rtype: list[WorkspaceChange]
+        """
+        changes = self.plan(workspace)
+        self.apply(changes)
+        return changes
+
+    def plan(self, workspace, live: Dict = None) -> List[WorkspaceChange]:
+        """
+        Returns the changes that make the live workspace equal to a local
+        definition, in the order `apply` sends them.
+
+        :param workspace: The definition, as a `Workspace` or the `dict` of an
+               exported workspace.
+        :param dict live: (optional) The live workspace, as returned by
+               `get_workspace(export=True)`. Fetched if not given.
+        :rtype: list[WorkspaceChange]
+        """
+        if not isinstance(workspace, dict):
+            workspace = workspace.to_dict()
+        if live is None:
+            live = self.assistant.get_workspace(self.workspace_id,
+                                                export=True).get_result()
+        changes = []
+        changes.extend(self._plan_properties(workspace, live))
+        for elements, kind, key, canonical, to_kwargs in (
+            ('intents', 'intent', 'intent', _intent, self._intent_kwargs),
+            ('entities', 'entity', 'entity', _entity, self._entity_kwargs),
+            ('counterexamples', 'counterexample', 'text', _clean, None),
+        ):
+            if workspace.get(elements) is None:
+                continue
+            changes.extend(
+                self._plan_elements(kind, key, canonical, workspace[elements],
+                                    live.get(elements), to_kwargs))
+        changes.extend(
+            self._plan_dialog_nodes(workspace.get('dialog_nodes'),
+                                    live.get('dialog_nodes')))
+        return changes
+
+    def apply(self, changes: List[WorkspaceChange]) -> None:
+        """
+        Sends the calls of the changes returned by `plan`. Consecutive
+        changes that do not depend on each other are sent concurrently; the
+        first error is raised once they have completed, and no later changes
+        are sent.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for stage in self._stages(changes):
+                futures = [
+                    executor.submit(self._call, change) for change in stage
+                ]
+                for future in futures:
+                    future.exception()
+                for future in futures:
+                    future.result()
+
+    def _plan_properties(self, workspace, live):
+        changed = {
+            key: workspace[key]
+            for key in WORKSPACE_PROPERTIES
+            if key in workspace and
+            _clean(workspace[key]) != _clean(live.get(key))
+        }
+        if not changed:
+            return []
+        return [
+            WorkspaceChange('update', 'workspace', workspace.get('name'),
+                            'update_workspace', changed)
+        ]
+
+    @staticmethod
+    def _intent_kwargs(intent, new):
+        prefix = '' if new else 'new_'
+        kwargs = {
+            prefix + 'description': intent['description'],
+            prefix + 'examples': intent['examples']
+        }
+        if not new:
+            kwargs['append'] = False
+        return kwargs
+
+    @staticmethod
+    def _entity_kwargs(entity, new):
+        prefix = '' if new else 'new_'
+        kwargs = {
+            prefix + key: entity[key]
+            for key in ('description', 'metadata', 'fuzzy_match', 'values')
+        }
+        if not new:
+            kwargs['append'] = False
+        return kwargs
+
+    @staticmethod
+    def _plan_elements(kind, key, canonical, local, live, to_kwargs):
+        local = _by_key(local, key, canonical)
+        live = _by_key(live, key, canonical)
+        changes = []
+        for name, element in local.items():
+            if name not in live:
+                kwargs = {key: name}
+                if to_kwargs is not None:
+                    kwargs.update(to_kwargs(element, True))
+                changes.append(
+                    WorkspaceChange('create', kind, name, 'create_' + kind,
+                                    kwargs))
+            elif element != live[name] and to_kwargs is not None:
+                kwargs = {key: name}
+                kwargs.update(to_kwargs(element, False))
+                changes.append(
+                    WorkspaceChange('update', kind, name, 'update_' + kind,
+                                    kwargs))
+        for name in live:
+            if name not in local:
+                changes.append(
+                    WorkspaceChange('delete', kind, name, 'delete_' + kind,
+                                    {key: name}))
+        return changes
+
+    @staticmethod
+    def _plan_dialog_nodes(local_nodes, live_nodes):
+        if local_nodes is None:
+            return []
+        local = _by_key(local_nodes, 'dialog_node', _dialog_node)
+        live = _by_key(live_nodes, 'dialog_node', _dialog_node)
+        created, updated, deleted = [], [], []
+        supported = True
+        for name, node in local.items():
+            properties = set(node) - {'dialog_node'}
+            if name not in live:
+                created.append(node)
+                supported &= properties <= set(DIALOG_NODE_PROPERTIES)
+            elif node != live[name]:
+                changed = {
+                    key for key in properties
+                    if node[key] != live[name].get(key)
+                }
+                supported &= changed <= set(DIALOG_NODE_PROPERTIES) and \
+                    set(live[name]) <= set(node)
+                updated.append(node)
+        if not supported:
+            return [
+                WorkspaceChange('update', 'dialog_nodes', None,
+                                'update_workspace',
+                                {'dialog_nodes': local_nodes})
+            ]
+        deleted = [node for name, node in live.items() if name not in local]
+
+        changes = []
+        # Create each node after the new nodes it is placed under or after.
+        pending = {node['dialog_node']: node for node in created}
+        while pending:
+            wave = [
+                node for node in pending.values()
+                if node.get('parent') not in pending and
+                node.get('previous_sibling') not in pending
+            ]
+            if not wave:
+                raise ValueError('The dialog nodes {0} form a cycle'.format(
+                    sorted(pending)))
+            for node in wave:
+                del pending[node['dialog_node']]
+                changes.append(
+                    WorkspaceChange('create', 'dialog_node',
+                                    node['dialog_node'], 'create_dialog_node',
+                                    dict(node)))
+        for node in updated:
+            kwargs = {'dialog_node': node['dialog_node']}
+            kwargs.update(('new_' + key, value)
+                          for key, value in node.items()
+                          if key != 'dialog_node' and
+                          value != live[node['dialog_node']].get(key))
+            changes.append(
+                WorkspaceChange('update', 'dialog_node', node['dialog_node'],
+                                'update_dialog_node', kwargs))
+        deleted_names = {node['dialog_node'] for node in deleted}
+        for node in deleted:
+            # Deleting a node also deletes its descendants.
+            if node.get('parent') not in deleted_names:
+                changes.append(
+                    WorkspaceChange('delete', 'dialog_node',
+                                    node['dialog_node'], 'delete_dialog_node',
+                                    {'dialog_node': node['dialog_node']}))
+        return changes
+
+    @staticmethod
+    def _stages(changes):
+        stage = []
+        # What the dialog node changes of the current stage do
+        created, actions, moved = set(), set(), False
+        for change in changes:
+            node = change.kind == 'dialog_node'
+            moves = node and change.action == 'update' and (
+                'new_parent' in change.kwargs or
+                'new_previous_sibling' in change.kwargs)
+            if change.kind == 'dialog_nodes' or 'replace' in actions:
+                wait = True
+            elif not node:
+                wait = False
+            elif moved or (moves and actions):
+                wait = True
+            elif change.action == 'create':
+                wait = change.kwargs.get('parent') in created or \
+                    change.kwargs.get('previous_sibling') in created
+            elif change.action == 'update':
+                wait = 'create' in actions
+            else:
+                wait = bool(actions - {'delete'})
+            if stage and wait:
+                yield stage
+                stage = []
+                created, actions, moved = set(), set(), False
+            stage.append(change)
+            if change.kind == 'dialog_nodes':
+                actions.add('replace')
+            elif node:
+                actions.add(change.action)
+                moved |= moves
+                if change.action == 'create':
+                    created.add(change.name)
+        if stage:
+            yield stage
+
+    def _call(self, change) -> DetailedResponse:
+        method = getattr(self.assistant, change.method)
+        attempt = 0
+        while True:
+            try:
+                response = method(self.workspace_id, **change.kwargs)
+                self.calls += 1
+                return response
+            except Exception as error:  # pylint: disable=broad-except
+                if not is_retryable(error) or attempt >= self.max_retries:
+                    raise
+                time.sleep(retry_delay(error, attempt))
+                attempt += 1
+                self.retries += 1
@@ -26,7 +26,12 @@ import pytest
 import re
 import requests
 import responses
+import threading
+import time
 import urllib
+from ibm_cloud_sdk_core import ApiException
+from ibm_watson import common
+from ibm_watson.bulk_classify import BulkClassifyStats
 from ibm_watson.assistant_v1 import *
 
 version = 'testString'
@@ -465,6 +470,67 @@ class TestBulkClassify:
         self.test_bulk_classify_value_error()
 
 
+class TestBulkClassifyAll:
+    """
+    Test Class for bulk_classify_all
+    """
+
+    def classify_callback(self, request):
+        utterances = json.loads(request.body)['input']
+        with self.lock:
+            self.chunk_sizes.append(len(utterances))
+            # rate limit the second chunk once, whichever request arrives first
+            rate_limited = utterances[0]['text'] == 'utterance 50' and not self.rate_limited
+            self.rate_limited = self.rate_limited or rate_limited
+        if rate_limited:
+            return (429, {'Retry-After': '0'}, json.dumps({'error': 'Too many requests'}))
+        output = [{'input': {'text': u['text']}, 'entities': [], 'intents': []} for u in utterances]
+        return (200, {'Content-Type': 'application/json'}, json.dumps({'output': output}))
+
+    @responses.activate
+    def test_bulk_classify_all(self):
+        """
+        bulk_classify_all()
+        """
+        self.lock = threading.Lock()
+        self.chunk_sizes = []
+        self.rate_limited = False
+        url = preprocess_url('/v1/workspaces/testString/bulk_classify')
+        responses.add_callback(responses.POST, url, callback=self.classify_callback)
+
+        texts = ('utterance {0}'.format(i) for i in range(120))
+        stats = BulkClassifyStats()
+        outputs = list(_service.bulk_classify_all('testString', texts, chunk_size=50, max_workers=3, stats=stats))
+
+        assert all(isinstance(output, BulkClassifyOutput) for output in outputs)
+        assert [output.input.text for output in outputs] == ['utterance {0}'.format(i) for i in range(120)]
+        assert sorted(self.chunk_sizes) == [20, 50, 50, 50]
+        assert stats.utterances == 120
+        assert stats.requests == 3
+        assert stats.retries == 1
+        assert stats.utterances_per_second > 0
+
+    @responses.activate
+    def test_bulk_classify_all_gives_up_after_max_retries(self):
+        """
+        bulk_classify_all() raises once a request was rate limited too often.
+        """
+        url = preprocess_url('/v1/workspaces/testString/bulk_classify')
+        responses.add(responses.POST, url, status=429, headers={'Retry-After': '0'}, json={'error': 'Too many requests'})
+
+        with pytest.raises(ApiException) as error:
+            list(_service.bulk_classify_all('testString', ['hello'], max_retries=2))
+        assert error.value.status_code == 429
+        assert len(responses.calls) == 3
+
+    def test_bulk_classify_all_value_error(self):
+        """
+        test_bulk_classify_all_value_error()
+        """
+        with pytest.raises(ValueError):
+            list(_service.bulk_classify_all('testString', ['hello'], chunk_size=51))
+
+
 # endregion
 ##############################################################################
 # End of Service: BulkClassify
@@ -2897,6 +2963,55 @@ class TestDeleteIntent:
         self.test_delete_intent_value_error()
 
 
+class TestListIntentsIter:
+    """
+    Test Class for list_intents_iter
+    """
+
+    def intents_callback(self, request):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+        self.queries.append(query)
+        page = int(query.get('cursor', ['0'])[0])
+        body = {'intents': [{'intent': 'intent{0}-{1}'.format(page, i)} for i in range(2)], 'pagination': {'refresh_url': 'refresh_url'}}
+        if page < 2:
+            body['pagination']['next_cursor'] = str(page + 1)
+        return (200, {'Content-Type': 'application/json'}, json.dumps(body))
+
+    @responses.activate
+    def test_list_intents_iter(self):
+        """
+        list_intents_iter() yields the intents of all pages.
+        """
+        self.queries = []
+        url = preprocess_url('/v1/workspaces/testString/intents')
+        responses.add_callback(responses.GET, url, callback=self.intents_callback)
+
+        pager = _service.list_intents_iter('testString', page_limit=2, export=True, sort='intent')
+        intents = list(pager)
+
+        assert all(isinstance(intent, Intent) for intent in intents)
+        assert [intent.intent for intent in intents] == ['intent0-0', 'intent0-1', 'intent1-0', 'intent1-1', 'intent2-0', 'intent2-1']
+        assert [query.get('cursor') for query in self.queries] == [None, ['1'], ['2']]
+        for query in self.queries:
+            assert query['page_limit'] == ['2']
+            assert query['export'] == ['true']
+            assert query['sort'] == ['intent']
+        assert pager.pages == 3
+
+    @responses.activate
+    def test_paginate_yields_dicts(self):
+        """
+        paginate() yields the items as dicts without a model class.
+        """
+        self.queries = []
+        url = preprocess_url('/v1/workspaces/testString/intents')
+        responses.add_callback(responses.GET, url, callback=self.intents_callback)
+
+        pager = _service.paginate(_service.list_intents, 'testString', items_key='intents', cursor='2', prefetch=False)
+        assert list(pager) == [{'intent': 'intent2-0'}, {'intent': 'intent2-1'}]
+        assert len(self.queries) == 1
+
+
 # endregion
 ##############################################################################
 # End of Service: Intents
@@ -6561,6 +6676,27 @@ class TestDeleteSynonym:
         self.test_delete_synonym_value_error()
 
 
+class TestListSynonymsIter:
+    """
+    Test Class for list_synonyms_iter
+    """
+
+    @responses.activate
+    def test_list_synonyms_iter(self):
+        """
+        list_synonyms_iter() passes the path parameters to every page request.
+        """
+        url = preprocess_url('/v1/workspaces/testString/entities/testString/values/testString/synonyms')
+        responses.add(responses.GET, url, json={'synonyms': [{'synonym': 'a'}], 'pagination': {'refresh_url': 'r', 'next_cursor': 'c1'}}, status=200)
+        responses.add(responses.GET, url, json={'synonyms': [{'synonym': 'b'}], 'pagination': {'refresh_url': 'r'}}, status=200)
+
+        synonyms = list(_service.list_synonyms_iter('testString', 'testString', 'testString'))
+
+        assert [synonym.synonym for synonym in synonyms] == ['a', 'b']
+        assert all(isinstance(synonym, Synonym) for synonym in synonyms)
+        assert 'cursor=c1' in responses.calls[1].request.url
+
+
 # endregion
 ##############################################################################
 # End of Service: Synonyms
@@ -8007,6 +8143,88 @@ class TestListAllLogs:
         self.test_list_all_logs_value_error()
 
 
+class TestListLogsIter:
+    """
+    Test Class for list_logs_iter and list_all_logs_iter
+    """
+
+    def log(self, log_id):
+        return {'request': {}, 'response': {'input': {}, 'intents': [], 'entities': [], 'context': {}, 'output': {'log_messages': [], 'text': []}, 'user_id': 'u'},
+                'log_id': log_id, 'request_timestamp': 't', 'response_timestamp': 't', 'workspace_id': 'w', 'language': 'en'}
+
+    def logs_callback(self, request):
+        cursor = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query).get('cursor', [None])[0]
+        self.cursors.append(cursor)
+        if cursor in self.failures and self.failures[cursor] > 0:
+            self.failures[cursor] -= 1
+            return (503, {}, json.dumps({'error': 'Service unavailable'}))
+        page = {None: 0, 'c1': 1, 'c2': 2}[cursor]
+        body = {'logs': [self.log('log{0}-{1}'.format(page, i)) for i in range(2)], 'pagination': {}}
+        if page < 2:
+            body['pagination']['next_cursor'] = 'c{0}'.format(page + 1)
+        return (200, {'Content-Type': 'application/json'}, json.dumps(body))
+
+    @responses.activate
+    def test_list_logs_iter(self):
+        """
+        list_logs_iter() follows cursors and retries failed pages.
+        """
+        self.cursors, self.failures = [], {'c1': 1}
+        url = preprocess_url('/v1/workspaces/testString/logs')
+        responses.add_callback(responses.GET, url, callback=self.logs_callback)
+
+        common.RETRY_BASE_DELAY = 0
+        try:
+            pager = _service.list_logs_iter('testString', filter='language::en', page_limit=2)
+            logs = list(pager)
+        finally:
+            common.RETRY_BASE_DELAY = 1
+
+        assert all(isinstance(log, Log) for log in logs)
+        assert [log.log_id for log in logs] == ['log0-0', 'log0-1', 'log1-0', 'log1-1', 'log2-0', 'log2-1']
+        assert self.cursors == [None, 'c1', 'c1', 'c2']
+        assert pager.pages == 3
+        assert pager.retries == 1
+        assert 'filter=language%3A%3Aen' in responses.calls[0].request.url
+        assert 'page_limit=2' in responses.calls[0].request.url
+
+    @responses.activate
+    def test_list_all_logs_iter_prefetches_next_page(self):
+        """
+        list_all_logs_iter() fetches the next page while the current one is consumed.
+        """
+        self.cursors, self.failures = [], {}
+        url = preprocess_url('/v1/logs')
+        responses.add_callback(responses.GET, url, callback=self.logs_callback)
+
+        logs = iter(_service.list_all_logs_iter('language::en'))
+        next(logs)
+        deadline = time.time() + 5
+        while len(self.cursors) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert self.cursors == [None, 'c1']
+        assert len(list(logs)) == 5
+
+    @responses.activate
+    def test_list_logs_iter_keeps_position_after_failure(self):
+        """
+        The cursor of the page that could not be fetched is kept.
+        """
+        self.cursors, self.failures = [], {'c2': 1}
+        url = preprocess_url('/v1/workspaces/testString/logs')
+        responses.add_callback(responses.GET, url, callback=self.logs_callback)
+
+        pager = _service.list_logs_iter('testString', prefetch=False, max_retries=0)
+        logs = []
+        with pytest.raises(ApiException):
+            for log in pager:
+                logs.append(log.log_id)
+        assert logs == ['log0-0', 'log0-1', 'log1-0', 'log1-1']
+        assert pager.cursor == 'c2'
+        resumed = _service.list_logs_iter('testString', cursor=pager.cursor)
+        assert [log.log_id for log in resumed] == ['log2-0', 'log2-1']
+
+
 # endregion
 ##############################################################################
 # End of Service: Logs
@@ -28,7 +28,10 @@ import re
 import requests
 import responses
 import tempfile
+import threading
 import urllib
+from ibm_cloud_sdk_core import ApiException
+from ibm_watson.bulk_classify import BulkClassifyStats
 from ibm_watson.assistant_v2 import *
 
 version = 'testString'
@@ -927,6 +930,29 @@ class TestDeleteAssistant:
         self.test_delete_assistant_value_error()
 
 
+class TestListAssistantsIter:
+    """
+    Test Class for list_assistants_iter
+    """
+
+    @responses.activate
+    def test_list_assistants_iter(self):
+        """
+        list_assistants_iter() yields the assistants of all pages.
+        """
+        url = preprocess_url('/v2/assistants')
+        responses.add(responses.GET, url, json={'assistants': [{'name': 'a', 'language': 'en'}], 'pagination': {'refresh_url': 'r', 'next_cursor': 'c1'}}, status=200)
+        responses.add(responses.GET, url, json={'assistants': [{'name': 'b', 'language': 'en'}], 'pagination': {'refresh_url': 'r'}}, status=200)
+
+        assistants = list(_service.list_assistants_iter(page_limit=1, include_audit=True))
+
+        assert [assistant.name for assistant in assistants] == ['a', 'b']
+        assert all(isinstance(assistant, AssistantData) for assistant in assistants)
+        assert 'cursor=c1' in responses.calls[1].request.url
+        assert 'include_audit=true' in responses.calls[1].request.url
+        assert 'page_limit=1' in responses.calls[1].request.url
+
+
 # endregion
 ##############################################################################
 # End of Service: Assistants
@@ -2290,6 +2316,74 @@ class TestMessageStreamStateless:
         self.test_message_stream_stateless_value_error()
 
 
+class TestMessageStreamIter:
+    """
+    Test Class for message_stream_iter and message_stream_stateless_iter
+    """
+
+    events = [
+        {'partial_item': {'response_type': 'text', 'text': 'Hello', 'streaming_metadata': {'response_id': 'r1'}}},
+        {'partial_item': {'response_type': 'text', 'text': ', wor', 'streaming_metadata': {'response_id': 'r1'}}},
+        {'partial_item': {'response_type': 'text', 'text': 'ld', 'streaming_metadata': {'response_id': 'r1'}}},
+        {'partial_item': {'response_type': 'text', 'text': 'Bye', 'streaming_metadata': {'response_id': 'r2'}}},
+        {'complete_item': {'response_type': 'text', 'text': 'Hello, world', 'streaming_metadata': {'response_id': 'r1'}}},
+        {'final_response': {'output': {'generic': [{'response_type': 'text', 'text': 'Hello, world'}]}, 'context': {}, 'user_id': 'u1'}},
+    ]
+
+    def body(self):
+        return ''.join('event: message\ndata: {0}\n\n'.format(json.dumps(event)) for event in self.events)
+
+    @responses.activate
+    def test_message_stream_iter(self):
+        """
+        message_stream_iter()
+        """
+        url = preprocess_url('/v2/assistants/testString/environments/testString/sessions/testString/message_stream')
+        responses.add(responses.POST, url, body=self.body(), content_type='text/event-stream', status=200)
+
+        with _service.message_stream_iter('testString', 'testString', 'testString') as stream:
+            events = list(stream)
+
+        assert [type(event) for event in events] == [PartialItemEvent] * 4 + [CompleteItemEvent, FinalResponseEvent]
+        assert [event.text for event in events[:3]] == ['Hello', ', wor', 'ld']
+        assert events[0].response_id == 'r1'
+        assert events[3].item['text'] == 'Bye'
+        assert stream.response_ids == ['r1', 'r2']
+        assert stream.text('r1') == 'Hello, world'
+        assert stream.text('r2') == 'Bye'
+        assert stream.text('r3') is None
+        assert isinstance(stream.final_response, StatefulMessageResponse)
+        assert events[-1].response is stream.final_response
+        assert stream.final_response.user_id == 'u1'
+        assert stream.final_response.output.generic[0].text == 'Hello, world'
+
+    @responses.activate
+    def test_message_stream_iter_collects_text_incrementally(self):
+        """
+        text() returns the text received so far while iterating.
+        """
+        url = preprocess_url('/v2/assistants/testString/environments/testString/message_stream')
+        responses.add(responses.POST, url, body=self.body(), content_type='text/event-stream', status=200)
+
+        stream = _service.message_stream_stateless_iter('testString', 'testString')
+        texts = []
+        for event in stream:
+            if isinstance(event, PartialItemEvent) and event.response_id == 'r1':
+                texts.append(stream.text('r1'))
+            else:
+                assert stream.final_response is None or isinstance(event, FinalResponseEvent)
+        assert texts == ['Hello', 'Hello, wor', 'Hello, world']
+        assert isinstance(stream.final_response, StatelessMessageResponse)
+
+    def test_message_stream_iter_skips_unknown_events(self):
+        """
+        Data of unknown events is skipped.
+        """
+        stream = MessageStream(iter([{'unknown': {}}, self.events[0]]), StatelessMessageResponse)
+        assert [event.text for event in stream] == ['Hello']
+        assert stream.final_response is None
+
+
 # endregion
 ##############################################################################
 # End of Service: MessageStream
@@ -2397,6 +2491,67 @@ class TestBulkClassify:
         self.test_bulk_classify_value_error()
 
 
+class TestBulkClassifyAll:
+    """
+    Test Class for bulk_classify_all
+    """
+
+    def classify_callback(self, request):
+        utterances = json.loads(request.body)['input']
+        with self.lock:
+            self.chunk_sizes.append(len(utterances))
+            # rate limit the second chunk once, whichever request arrives first
+            rate_limited = utterances[0]['text'] == 'utterance 50' and not self.rate_limited
+            self.rate_limited = self.rate_limited or rate_limited
+        if rate_limited:
+            return (429, {'Retry-After': '0'}, json.dumps({'error': 'Too many requests'}))
+        output = [{'input': {'text': u['text']}, 'entities': [], 'intents': []} for u in utterances]
+        return (200, {'Content-Type': 'application/json'}, json.dumps({'output': output}))
+
+    @responses.activate
+    def test_bulk_classify_all(self):
+        """
+        bulk_classify_all()
+        """
+        self.lock = threading.Lock()
+        self.chunk_sizes = []
+        self.rate_limited = False
+        url = preprocess_url('/v2/skills/testString/workspace/bulk_classify')
+        responses.add_callback(responses.POST, url, callback=self.classify_callback)
+
+        texts = ('utterance {0}'.format(i) for i in range(120))
+        stats = BulkClassifyStats()
+        outputs = list(_service.bulk_classify_all('testString', texts, chunk_size=50, max_workers=3, stats=stats))
+
+        assert all(isinstance(output, BulkClassifyOutput) for output in outputs)
+        assert [output.input.text for output in outputs] == ['utterance {0}'.format(i) for i in range(120)]
+        assert sorted(self.chunk_sizes) == [20, 50, 50, 50]
+        assert stats.utterances == 120
+        assert stats.requests == 3
+        assert stats.retries == 1
+        assert stats.utterances_per_second > 0
+
+    @responses.activate
+    def test_bulk_classify_all_gives_up_after_max_retries(self):
+        """
+        bulk_classify_all() raises once a request was rate limited too often.
+        """
+        url = preprocess_url('/v2/skills/testString/workspace/bulk_classify')
+        responses.add(responses.POST, url, status=429, headers={'Retry-After': '0'}, json={'error': 'Too many requests'})
+
+        with pytest.raises(ApiException) as error:
+            list(_service.bulk_classify_all('testString', ['hello'], max_retries=2))
+        assert error.value.status_code == 429
+        assert len(responses.calls) == 3
+
+    def test_bulk_classify_all_value_error(self):
+        """
+        test_bulk_classify_all_value_error()
+        """
+        with pytest.raises(ValueError):
+            list(_service.bulk_classify_all('testString', ['hello'], chunk_size=51))
+
+
 # endregion
 ##############################################################################
 # End of Service: BulkClassify
@@ -2542,6 +2697,38 @@ class TestListLogs:
         self.test_list_logs_value_error()
 
 
+class TestListLogsIter:
+    """
+    Test Class for list_logs_iter
+    """
+
+    def logs_callback(self, request):
+        self.requests += 1
+        cursor = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query).get('cursor', [None])[0]
+        if self.requests == 1:
+            return (429, {'Retry-After': '0'}, json.dumps({'error': 'Too many requests'}))
+        page = 0 if cursor is None else 1
+        body = {'logs': [{'log_id': 'log{0}'.format(page), 'request': {}, 'response': {'output': {}, 'user_id': 'u'},
+                          'assistant_id': 'a', 'session_id': 's', 'skill_id': 'k', 'snapshot': 'x', 'request_timestamp': 't',
+                          'response_timestamp': 't', 'language': 'en'}],
+                'pagination': {'next_cursor': 'c1'} if page == 0 else {}}
+        return (200, {'Content-Type': 'application/json'}, json.dumps(body))
+
+    @responses.activate
+    def test_list_logs_iter(self):
+        """
+        list_logs_iter()
+        """
+        self.requests = 0
+        url = preprocess_url('/v2/assistants/testString/logs')
+        responses.add_callback(responses.GET, url, callback=self.logs_callback)
+
+        pager = _service.list_logs_iter('testString')
+        assert [log.log_id for log in pager] == ['log0', 'log1']
+        assert all(isinstance(log, Log) for log in _service.list_logs_iter('testString'))
+        assert pager.retries == 1
+
+
 # endregion
 ##############################################################################
 # End of Service: Logs
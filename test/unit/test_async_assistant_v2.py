@@ -0,0 +1,232 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for AsyncAssistantV2
+"""
+
+import asyncio
+import json
+import time
+import jwt
+import pytest
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import IAMAuthenticator, NoAuthAuthenticator
+from ibm_watson import AsyncAssistantV2
+from ibm_watson.assistant_v2 import MessageInput, StatefulMessageResponse
+from ibm_watson.assistant_v2_stream import PartialItemEvent, FinalResponseEvent
+from ibm_watson.bulk_classify import BulkClassifyStats
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+
+
+class FakeAssistantServer(object):
+    """Local stand-in for the assistant service, run on the test's loop."""
+
+    def __init__(self):
+        self.requests = []
+        self.token_requests = 0
+        self.delay = 0
+        self.runner = None
+        self.url = None
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post('/identity/token', self._token)
+        app.router.add_post('/v2/assistants/{assistant_id}/sessions', self._create_session)
+        app.router.add_post('/v2/assistants/{assistant_id}/sessions/{session_id}/message', self._message)
+        app.router.add_post('/v2/skills/{skill_id}/workspace/bulk_classify', self._bulk_classify)
+        app.router.add_get('/v2/assistants/{assistant_id}/logs', self._logs)
+        app.router.add_post(
+            '/v2/assistants/{assistant_id}/environments/{environment_id}/sessions/{session_id}/message_stream',
+            self._message_stream)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        self.url = 'http://127.0.0.1:{0}'.format(site._server.sockets[0].getsockname()[1])
+        return self
+
+    async def __aexit__(self, *args):
+        await self.runner.cleanup()
+
+    async def _token(self, request):
+        self.token_requests += 1
+        now = int(time.time())
+        token = jwt.encode({'iat': now, 'exp': now + 3600}, 'a-secret-of-at-least-thirty-two-bytes', algorithm='HS256')
+        return web.json_response({'access_token': token, 'refresh_token': 'r', 'token_type': 'Bearer',
+                                  'expires_in': 3600, 'expiration': now + 3600})
+
+    async def _create_session(self, request):
+        self.requests.append(request)
+        if request.match_info['assistant_id'] == 'missing':
+            return web.json_response({'error': 'Resource not found', 'code': 404}, status=404)
+        return web.json_response({'session_id': 'session-1'}, status=201)
+
+    async def _message(self, request):
+        self.requests.append(request)
+        body = await request.json()
+        await asyncio.sleep(self.delay)
+        return web.json_response({
+            'output': {'generic': [{'response_type': 'text', 'text': 'You said ' + body['input']['text']}]},
+            'user_id': 'user-1'
+        })
+
+    async def _bulk_classify(self, request):
+        self.requests.append(request)
+        if len(self.requests) == 1:
+            return web.json_response({'error': 'Too many requests'}, status=429, headers={'Retry-After': '0'})
+        utterances = (await request.json())['input']
+        await asyncio.sleep(0.01 * (10 - len(utterances)))
+        return web.json_response({'output': [{'input': u, 'entities': [], 'intents': []} for u in utterances]})
+
+    async def _logs(self, request):
+        self.requests.append(request)
+        if len(self.requests) == 2:
+            return web.json_response({'error': 'Service unavailable'}, status=503, headers={'Retry-After': '0'})
+        page = int(request.query.get('cursor', 0))
+        logs = [{'log_id': 'log{0}'.format(page), 'request': {}, 'response': {'output': {}, 'user_id': 'u'},
+                 'assistant_id': 'a', 'session_id': 's', 'skill_id': 'k', 'snapshot': 'x', 'request_timestamp': 't',
+                 'response_timestamp': 't', 'language': 'en'}]
+        pagination = {'next_cursor': str(page + 1)} if page < 2 else {}
+        return web.json_response({'logs': logs, 'pagination': pagination})
+
+    async def _message_stream(self, request):
+        self.requests.append(request)
+        response = web.StreamResponse(headers={'Content-Type': 'text/event-stream'})
+        await response.prepare(request)
+        for text in ['Hel', 'lo']:
+            data = {'partial_item': {'response_type': 'text', 'text': text, 'streaming_metadata': {'response_id': 'a'}}}
+            await response.write('data: {0}\n\n'.format(json.dumps(data)).encode('utf-8'))
+        final = {'final_response': {'output': {'generic': [{'response_type': 'text', 'text': 'Hello'}]},
+                                    'user_id': 'user-1'}}
+        await response.write('event: message\ndata: {0}\n\n'.format(json.dumps(final)).encode('utf-8'))
+        await response.write_eof()
+        return response
+
+
+def run(test):
+    async def main():
+        async with FakeAssistantServer() as server:
+            await test(server)
+    asyncio.run(main())
+
+
+def client(server, authenticator=None):
+    assistant = AsyncAssistantV2('2024-08-25', authenticator=authenticator or NoAuthAuthenticator())
+    assistant.set_service_url(server.url)
+    return assistant
+
+
+def test_methods_return_detailed_responses():
+    async def test(server):
+        async with client(server) as assistant:
+            session = await assistant.create_session('assistant', headers={'X-Custom': '1'})
+            assert session.get_status_code() == 201
+            assert session.get_result() == {'session_id': 'session-1'}
+            response = await assistant.message('assistant', 'environment', 'session-1',
+                                               input=MessageInput(text='hi'))
+            assert response.get_result()['output']['generic'][0]['text'] == 'You said hi'
+        request = server.requests[0]
+        assert request.query['version'] == '2024-08-25'
+        assert request.headers['X-Custom'] == '1'
+        assert 'operation_id=create_session' in request.headers['X-IBMCloud-SDK-Analytics']
+    run(test)
+
+
+def test_error_raises_api_exception():
+    async def test(server):
+        async with client(server) as assistant:
+            with pytest.raises(ApiException) as error:
+                await assistant.create_session('missing')
+        assert error.value.status_code == 404
+        assert error.value.message == 'Resource not found'
+        assert error.value.http_response.json()['code'] == 404
+    run(test)
+
+
+def test_requests_run_concurrently_on_one_loop():
+    async def test(server):
+        server.delay = 0.3
+        async with client(server) as assistant:
+            start = time.time()
+            responses = await asyncio.gather(*[
+                assistant.message('assistant', 'environment', 'session-1', input=MessageInput(text=str(i)))
+                for i in range(20)
+            ])
+            elapsed = time.time() - start
+        assert [r.get_result()['output']['generic'][0]['text'] for r in responses] == \
+            ['You said {0}'.format(i) for i in range(20)]
+        assert elapsed < 2
+    run(test)
+
+
+def test_timeout_is_honored():
+    async def test(server):
+        server.delay = 2
+        async with client(server) as assistant:
+            with pytest.raises(asyncio.TimeoutError):
+                await assistant.message('assistant', 'environment', 'session-1',
+                                        input=MessageInput(text='hi'), timeout=0.2)
+    run(test)
+
+
+def test_tokens_are_fetched_without_blocking_the_loop():
+    # The token service runs on the same loop as the client, so a blocking
+    # token fetch would never be answered.
+    async def test(server):
+        authenticator = IAMAuthenticator('apikey', url=server.url)
+        async with client(server, authenticator) as assistant:
+            await asyncio.gather(*[assistant.create_session('assistant') for _ in range(5)])
+        assert server.token_requests == 1
+        assert all(request.headers['Authorization'].startswith('Bearer ') for request in server.requests)
+    run(test)
+
+
+def test_message_stream_iter():
+    async def test(server):
+        async with client(server) as assistant:
+            stream = await assistant.message_stream_iter('assistant', 'environment', 'session-1')
+            async with stream:
+                events = [event async for event in stream]
+        assert [type(event) for event in events] == [PartialItemEvent, PartialItemEvent, FinalResponseEvent]
+        assert stream.text('a') == 'Hello'
+        assert isinstance(stream.final_response, StatefulMessageResponse)
+    run(test)
+
+
+def test_bulk_classify_all():
+    async def test(server):
+        stats = BulkClassifyStats()
+        async with client(server) as assistant:
+            texts = ['utterance {0}'.format(i) for i in range(25)]
+            outputs = [output async for output in assistant.bulk_classify_all('skill', texts, chunk_size=10,
+                                                                              max_workers=2, stats=stats)]
+        assert [output.input.text for output in outputs] == texts
+        assert stats.requests == 3
+        assert stats.retries == 1
+    run(test)
+
+
+def test_list_logs_iter():
+    async def test(server):
+        async with client(server) as assistant:
+            pager = assistant.list_logs_iter('assistant')
+            logs = [log.log_id async for log in pager]
+        assert logs == ['log0', 'log1', 'log2']
+        assert [request.query.get('cursor') for request in server.requests] == [None, '1', '1', '2']
+        assert pager.retries == 1
+    run(test)
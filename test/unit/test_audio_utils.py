@@ -0,0 +1,282 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for audio_utils
+"""
+
+import io
+import os
+import wave
+import pytest
+from array import array
+from ibm_watson.audio_utils import (AudioFormat, parse_content_type,
+                                    read_wav_header, peek_audio_format,
+                                    read_pcm, pcm_to_wav, split_pcm,
+                                    model_sample_rate, PcmConverter,
+                                    AudioPreprocessor, SilenceTrimmer,
+                                    TimeMap, frame_energies)
+from ibm_watson.websocket.recognize_listener import AudioPacer
+
+_resources = os.path.join(os.path.dirname(__file__), '..', '..', 'resources')
+
+
+def make_wav(frames, rate=16000, channels=1):
+    output = io.BytesIO()
+    with wave.open(output, 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(frames)
+    return output.getvalue()
+
+
+class TestParseContentType:
+
+    def test_l16(self):
+        audio_format = parse_content_type('audio/l16; rate=16000; channels=2')
+        assert audio_format == AudioFormat('audio/l16', 16000, 2, 2, True)
+        assert audio_format.bytes_per_second == 64000
+        assert audio_format.is_pcm
+
+    def test_mulaw(self):
+        audio_format = parse_content_type('audio/mulaw;rate=8000')
+        assert audio_format.bytes_per_second == 8000
+        assert not audio_format.is_pcm
+
+    def test_compressed(self):
+        audio_format = parse_content_type('audio/ogg;codecs=opus')
+        assert audio_format.bytes_per_second is None
+        assert audio_format.frame_size is None
+
+
+class TestReadWavHeader:
+
+    def test_read_wav_header(self):
+        data = make_wav(b'\x00\x00' * 100, rate=22050)
+        audio_format, offset, length = read_wav_header(data)
+        assert audio_format == AudioFormat('audio/wav', 22050, 1, 2)
+        assert offset == 44
+        assert length == 200
+
+    def test_resource_file(self):
+        with open(os.path.join(_resources, 'speech.wav'), 'rb') as audio_file:
+            audio_format = peek_audio_format('audio/wav', audio_file)
+            assert audio_file.tell() == 0
+        assert audio_format.rate is not None
+        assert audio_format.sample_width == 2
+
+    def test_not_wav(self):
+        with pytest.raises(ValueError):
+            read_wav_header(b'OggS' + b'\x00' * 40)
+
+
+class TestSplitPcm:
+
+    def test_fixed_windows(self):
+        audio_format = AudioFormat('audio/l16', 100, 1, 2)
+        data = b'\x01\x00' * 1000
+        assert split_pcm(data, audio_format, 4) == [(0, 800), (800, 1600),
+                                                    (1600, 2000)]
+
+    def test_overlap(self):
+        audio_format = AudioFormat('audio/l16', 100, 1, 2)
+        data = b'\x01\x00' * 1000
+        assert split_pcm(data, audio_format, 5, overlap=1) == [(0, 1100),
+                                                               (900, 2000)]
+
+    def test_cuts_at_silence(self):
+        audio_format = AudioFormat('audio/l16', 100, 1, 2)
+        samples = array('h', [1000] * 1000)
+        for i in range(300, 310):
+            samples[i] = 0
+        data = samples.tobytes()
+        bounds = split_pcm(data, audio_format, 4, search=2,
+                           frame_duration=0.1)
+        assert bounds[0] == (0, 600)
+
+    def test_read_pcm_round_trip(self):
+        data = b'\x01\x02' * 50
+        audio_format, pcm = read_pcm(make_wav(data), 'audio/wav')
+        assert pcm == data
+        assert read_pcm(pcm_to_wav(pcm, audio_format), 'audio/wav')[1] == data
+
+    def test_read_pcm_rejects_compressed(self):
+        with pytest.raises(ValueError):
+            read_pcm(b'fLaC', 'audio/flac')
+
+
+class TestPcmConverter:
+
+    def test_downmix_and_downsample(self):
+        audio_format = AudioFormat('audio/l16', 48000, 2, 2)
+        # left and right channels average to 300
+        samples = array('h', [200, 400] * 4800)
+        converter = PcmConverter(audio_format, 16000)
+        output = array('h', converter.convert(samples.tobytes()) +
+                       converter.flush())
+        assert len(output) == 1600
+        assert set(output) == {300}
+        assert converter.content_type == \
+            'audio/l16;rate=16000;channels=1;endianness=little-endian'
+
+    def test_streaming_matches_whole(self):
+        audio_format = AudioFormat('audio/l16', 44100, 1, 2)
+        data = array('h', [(i * 37) % 2000 - 1000 for i in range(44100)]).tobytes()
+        whole = PcmConverter(audio_format, 8000)
+        expected = whole.convert(data) + whole.flush()
+        streamed = PcmConverter(audio_format, 8000)
+        output = b''.join(
+            streamed.convert(data[i:i + 999])
+            for i in range(0, len(data), 999)) + streamed.flush()
+        assert output == expected
+        assert len(output) == 16000
+
+    def test_no_upsampling(self):
+        converter = PcmConverter(AudioFormat('audio/l16', 8000, 1, 2), 16000)
+        assert converter.rate == 8000
+        assert converter.is_identity
+
+
+class TestAudioPreprocessor:
+
+    def test_model_sample_rate(self):
+        assert model_sample_rate('en-US_NarrowbandModel') == 8000
+        assert model_sample_rate('en-US_Telephony') == 8000
+        assert model_sample_rate('en-US_Multimedia') == 16000
+        assert model_sample_rate() == 16000
+
+    def test_process_wav(self):
+        audio = make_wav(b'\x10\x00' * 44100, rate=44100, channels=1)
+        data, content_type, _ = AudioPreprocessor().process(
+            audio, 'audio/wav', 'en-US_Telephony')
+        assert content_type == \
+            'audio/l16;rate=8000;channels=1;endianness=little-endian'
+        assert len(data) == 16000
+
+    def test_process_flac(self):
+        soundfile = pytest.importorskip('soundfile')
+        audio = make_wav(b'\x10\x00' * 32000, rate=32000)
+        data, content_type, _ = AudioPreprocessor(encoding='flac').process(
+            audio, 'audio/wav')
+        assert content_type == 'audio/flac'
+        info = soundfile.info(io.BytesIO(data))
+        assert (info.samplerate, info.channels, info.frames) == (16000, 1, 16000)
+
+    def test_process_passes_compressed_through(self):
+        data, content_type, _ = AudioPreprocessor().process(b'ID3', 'audio/mp3')
+        assert (data, content_type) == (b'ID3', 'audio/mp3')
+
+    def test_converter_for_matching_audio(self):
+        assert AudioPreprocessor().converter('audio/l16;rate=16000') is None
+
+
+def tone(seconds, rate=16000):
+    return array('h', [8000, -8000] * int(rate * seconds / 2)).tobytes()
+
+
+def silence(seconds, rate=16000):
+    return b'\x00\x00' * int(rate * seconds)
+
+
+class TestSilenceTrimmer:
+
+    fmt = AudioFormat('audio/l16', 16000, 1, 2)
+
+    def test_frame_energies(self):
+        energies = frame_energies(tone(0.04) + silence(0.03), self.fmt, 0.02)
+        assert energies == [64000000.0, 64000000.0, 0.0, 0.0]
+
+    def test_time_map(self):
+        time_map = TimeMap()
+        time_map.add(1.0, 5.0)
+        assert time_map.to_original(0.5) == 0.5
+        assert time_map.to_original(1.0) == 5.0
+        assert time_map.to_original(2.25) == 6.25
+
+    def test_long_silence_is_shortened(self):
+        audio = tone(1) + silence(5) + tone(1)
+        trimmer = SilenceTrimmer(self.fmt)
+        output = b''.join(
+            trimmer.convert(audio[i:i + 1000])
+            for i in range(0, len(audio), 1000)) + trimmer.flush()
+        # 1 s of tone, 0.3 s of silence and 1 s of tone
+        assert len(output) == 2 * int(16000 * 2.3)
+        assert output[:32000] == audio[:32000]
+        assert output[-32000:] == audio[-32000:]
+        # the second tone starts at 1.3 s in the output and 6 s originally
+        assert trimmer.time_map.to_original(1.3) == 6.0
+        assert trimmer.time_map.to_original(2.0) == 6.7
+        assert trimmer.time_map.to_original(0.5) == 0.5
+
+    def test_short_silence_is_kept(self):
+        audio = tone(1) + silence(0.8) + tone(1)
+        trimmer = SilenceTrimmer(self.fmt)
+        assert trimmer.convert(audio) + trimmer.flush() == audio
+        assert trimmer.time_map.to_original(2.5) == 2.5
+
+    def test_trailing_silence(self):
+        trimmer = SilenceTrimmer(self.fmt)
+        output = trimmer.convert(tone(1) + silence(3)) + trimmer.flush()
+        assert len(output) == 2 * int(16000 * 1.3)
+
+    def test_preprocessor_trims_silence(self):
+        audio = make_wav(tone(1) + silence(5) + tone(1))
+        data, content_type, time_map = AudioPreprocessor(
+            trim_silence=True).process(audio, 'audio/wav')
+        assert content_type == \
+            'audio/l16;rate=16000;channels=1;endianness=little-endian'
+        assert len(data) == 2 * int(16000 * 2.3)
+        assert time_map.to_original(1.3) == 6.0
+
+    def test_preprocessor_converter_trims_silence(self):
+        converter = AudioPreprocessor(trim_silence=True).converter(
+            'audio/l16;rate=16000')
+        output = converter.convert(tone(1) + silence(5) + tone(1)) + \
+            converter.flush()
+        assert len(output) == 2 * int(16000 * 2.3)
+        assert converter.time_map.to_original(1.3) == 6.0
+
+
+class TestAudioPacer:
+
+    def test_default_cadence(self):
+        pacer = AudioPacer()
+        assert pacer.chunk_size == 1024
+        assert pacer.next_delay(1024) == 0.01
+
+    def test_fast_pcm(self):
+        pacer = AudioPacer('fast', parse_content_type('audio/l16;rate=16000'))
+        assert pacer.chunk_size == 3200
+        assert pacer.next_delay(3200) == 0
+
+    def test_fast_compressed(self):
+        pacer = AudioPacer('fast', parse_content_type('audio/ogg;codecs=opus'))
+        assert pacer.chunk_size == 16 * 1024
+
+    def test_realtime(self):
+        pacer = AudioPacer('realtime',
+                           parse_content_type('audio/l16;rate=16000'))
+        delay = pacer.next_delay(32000)
+        assert 0.9 < delay <= 1.0
+
+    def test_realtime_unknown_rate_falls_back(self):
+        pacer = AudioPacer('realtime', parse_content_type('audio/mp3'))
+        assert pacer.pacing is None
+        assert pacer.chunk_size == 1024
+
+    def test_invalid_pacing(self):
+        with pytest.raises(ValueError):
+            AudioPacer('slow')
@@ -15,6 +15,8 @@
 # limitations under the License.
 
 from ibm_watson import get_sdk_headers
+from ibm_watson import common
+import json
 import unittest
 
 
@@ -30,3 +32,97 @@ class TestCommon(unittest.TestCase):
             headers.get('X-IBMCloud-SDK-Analytics'),
             'service_name=my_service;service_version=v1;operation_id=my_operation'
         )
+
+
+class FakeStreamResponse(object):
+
+    def __init__(self, body, chunk_size=7):
+        self.body = body
+        self.chunk_size = chunk_size
+
+    def iter_content(self, chunk_size=None):
+        chunk_size = chunk_size or self.chunk_size
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+
+class TestJsonDecoder(unittest.TestCase):
+
+    def tearDown(self):
+        common.set_json_decoder()
+
+    def test_decodes_bytes_and_str(self):
+        self.assertEqual(common.decode_json(b'{"a": [1, "\xc3\xa9"]}'),
+                         {'a': [1, '\u00e9']})
+        self.assertEqual(common.decode_json('{"a": 1}'), {'a': 1})
+
+    def test_set_json_decoder(self):
+        calls = []
+
+        def decoder(data):
+            calls.append(data)
+            return json.loads(data)
+
+        common.set_json_decoder(decoder)
+        body = b'event: message\ndata: {"output": 1}\n\n'
+        self.assertEqual(
+            list(common.parse_sse_stream_data(FakeStreamResponse(body))),
+            [{'output': 1}])
+        self.assertEqual(calls, [b'{"output": 1}'])
+
+        common.set_json_decoder()
+        self.assertIs(common.json_decoder, common.default_json_decoder())
+
+
+class TestSSEParser(unittest.TestCase):
+
+    def parse(self, body, chunk_size):
+        parser = common.SSEParser()
+        events = []
+        for i in range(0, len(body), chunk_size):
+            events.extend(parser.feed(body[i:i + chunk_size]))
+        return events
+
+    def test_spec_fields(self):
+        body = (b'\xef\xbb\xbf: comment\r\n'
+                b'retry: 3000\r\n'
+                b'id: 7\r\n'
+                b'event: message\r\n'
+                b'data: {"a":\r\n'
+                b'data:1}\r\n'
+                b'\r\n'
+                b'data: plain\r'
+                b'\r'
+                b'event: ignored\n'
+                b'\n'
+                b'data\n'
+                b'\n'
+                b'data: unterminated')
+        for chunk_size in (1, 2, 5, len(body)):
+            events = self.parse(body, chunk_size)
+            self.assertEqual(events, [
+                common.ServerSentEvent('message', b'{"a":\n1}', '7', 3000),
+                common.ServerSentEvent('message', b'plain', '7', 3000),
+                common.ServerSentEvent('message', b'', '7', 3000),
+            ])
+
+    def test_lf_after_unfinished_line_is_kept(self):
+        parser = common.SSEParser()
+        self.assertEqual(parser.feed(b'data: 1\rdata: 2'), [])
+        self.assertEqual(parser.feed(b'\n\n'), [
+            common.ServerSentEvent('message', b'1\n2', None, None),
+        ])
+
+    def test_parse_sse_stream_data(self):
+        body = (b'event: message\ndata: {"partial_item": {"text": "He"}}\n\n'
+                b'event: message\ndata: {"partial_item": {"text": "llo"}}\n\n'
+                b': keep-alive\n\n')
+        metrics = common.StreamMetrics()
+        data = list(
+            common.parse_sse_stream_data(FakeStreamResponse(body, 3),
+                                         metrics=metrics))
+        self.assertEqual([d['partial_item']['text'] for d in data],
+                         ['He', 'llo'])
+        self.assertEqual(metrics.events, 2)
+        self.assertEqual(metrics.bytes_received, len(body))
+        self.assertIsNotNone(metrics.first_event_latency)
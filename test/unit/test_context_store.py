@@ -0,0 +1,109 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for ContextStore
+"""
+
+import gzip
+import json
+import responses
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_watson import AssistantV2, ContextStore
+from ibm_watson.assistant_v2 import MessageInput
+from ibm_watson.context_store import context_delta, merge_context
+
+
+def session_context(**variables):
+    return {
+        'global': {'system': {'turn_count': 3}, 'session_id': 's1'},
+        'skills': {
+            'actions skill': {
+                'skill_variables': dict({'name': 'Ann', 'plan': {'id': 7}}, **variables),
+                'system': {'state': 'abc'},
+            },
+        },
+    }
+
+
+def test_merge_context_merges_skill_variables():
+    base = session_context()
+    merged = merge_context(base, {'skills': {'actions skill': {'skill_variables': {'name': 'Bob'}}},
+                                  'integrations': {'chat': {}}})
+    assert merged['skills']['actions skill']['skill_variables'] == {'name': 'Bob', 'plan': {'id': 7}}
+    assert merged['skills']['actions skill']['system'] is base['skills']['actions skill']['system']
+    assert merged['global'] is base['global']
+    assert merged['integrations'] == {'chat': {}}
+    assert base == session_context()
+
+
+def test_merge_context_replaces_other_properties():
+    merged = merge_context({'name': 'Ann', 'system': {'dialog_stack': [1]}}, {'system': {'dialog_turn_counter': 2}})
+    assert merged == {'name': 'Ann', 'system': {'dialog_turn_counter': 2}}
+    assert merge_context(None, {'a': 1}) == {'a': 1}
+
+
+def test_context_delta_strips_unchanged_variables():
+    base = session_context()
+    context = session_context(name='Bob', city='Paris')
+    assert context_delta(base, context) == {
+        'skills': {'actions skill': {'skill_variables': {'name': 'Bob', 'city': 'Paris'}}}
+    }
+    assert context_delta(base, session_context()) == {}
+    assert context_delta(None, context) == context
+
+
+def test_store_evicts_least_recently_used():
+    store = ContextStore(max_conversations=2)
+    store.set('a', {'x': 1})
+    store.set('b', {'x': 2})
+    store.get('a')
+    store.set('c', {'x': 3})
+    assert 'a' in store and 'c' in store and 'b' not in store
+    store.set('a', None)
+    assert store.get('a') == {'x': 1}
+    store.remove('a')
+    assert len(store) == 1
+
+
+def test_request_context_and_delta():
+    store = ContextStore()
+    assert store.request_context('a') is None
+    store.set('a', session_context())
+    assert store.request_context('a') is store.get('a')
+    changed = store.request_context('a', {'skills': {'actions skill': {'skill_variables': {'name': 'Bob'}}}})
+    assert changed == session_context(name='Bob')
+    assert store.request_delta('a', session_context()) is None
+    assert store.request_delta('a', changed) == {'skills': {'actions skill': {'skill_variables': {'name': 'Bob'}}}}
+    assert store.merge('a', {'global': {}})['global'] == {}
+
+
+@responses.activate
+def test_store_with_compressed_stateless_messages():
+    url = 'https://api.us-south.assistant.watson.cloud.ibm.com/v2/assistants/a/message'
+    responses.add(responses.POST, url, json={'output': {}, 'context': session_context(), 'user_id': 'u'})
+    assistant = AssistantV2('2024-08-25', authenticator=NoAuthAuthenticator())
+    assistant.set_service_url('https://api.us-south.assistant.watson.cloud.ibm.com')
+    assistant.set_enable_gzip_compression(True)
+    store = ContextStore()
+
+    for _ in range(2):
+        response = assistant.message_stateless('a', 'e', input=MessageInput(text='hi'),
+                                               context=store.request_context('user'))
+        store.set('user', response.get_result()['context'])
+
+    request = responses.calls[1].request
+    assert request.headers['content-encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(request.body))['context'] == session_context()
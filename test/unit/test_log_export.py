@@ -0,0 +1,172 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for LogExporter
+"""
+
+import gzip
+import json
+import os
+import threading
+import pytest
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_watson import LogExporter
+from ibm_watson import log_export
+from ibm_watson.log_export import time_slices
+
+
+class FakeLogService(object):
+    """Serves log events sorted by request_timestamp, honoring timestamp filters."""
+
+    def __init__(self, timestamps):
+        self.logs = [{'log_id': 'log{0}'.format(i), 'request_timestamp': timestamp,
+                      'request': {'input': {'text': str(i)}}, 'response': {}, 'language': 'en'}
+                     for i, timestamp in enumerate(timestamps)]
+        self.requests = []
+        # cursor -> status code of the error returned for it
+        self.fail_on = {}
+        self.lock = threading.Lock()
+
+    def list_all_logs(self, filter, *, sort=None, page_limit=None, cursor=None, **kwargs):
+        with self.lock:
+            self.requests.append((filter, cursor))
+            if cursor in self.fail_on:
+                raise ApiException(self.fail_on[cursor], message='Failed')
+        assert sort == 'request_timestamp'
+        logs = self.logs
+        for part in filter.split(','):
+            if part.startswith('request_timestamp>='):
+                logs = [log for log in logs if log['request_timestamp'] >= part[19:]]
+            elif part.startswith('request_timestamp<'):
+                logs = [log for log in logs if log['request_timestamp'] < part[18:]]
+        start = int(cursor.split('@')[0]) if cursor else 0
+        page = {'logs': logs[start:start + page_limit], 'pagination': {}}
+        if start + page_limit < len(logs):
+            page['pagination']['next_cursor'] = '{0}@{1}'.format(start + page_limit, filter)
+        return DetailedResponse(response=page, status_code=200)
+
+
+def read_ndjson(path):
+    with gzip.open(path, 'rb') as file:
+        return [json.loads(line) for line in file.read().splitlines()]
+
+
+def timestamps(count, day='2026-01-01'):
+    return ['{0}T{1:02d}:00:00.000Z'.format(day, i) for i in range(count)]
+
+
+def test_time_slices():
+    assert time_slices('2026-01-01', '2026-01-01T04:00:00+02:00', 2) == [
+        ('2026-01-01T00:00:00.000Z', '2026-01-01T01:00:00.000Z'),
+        ('2026-01-01T01:00:00.000Z', '2026-01-01T02:00:00.000Z')]
+    with pytest.raises(ValueError):
+        time_slices('2026-01-02', '2026-01-01', 2)
+
+
+def test_export_writes_all_pages_to_gzip_ndjson(tmpdir):
+    service = FakeLogService(timestamps(7))
+    exporter = LogExporter(service.list_all_logs, 'language::en', str(tmpdir), page_limit=3)
+    assert exporter.export() == 7
+
+    assert read_ndjson(os.path.join(str(tmpdir), 'logs-000.ndjson.gz')) == service.logs
+    assert [cursor for _, cursor in service.requests] == [None, '3@language::en', '6@language::en']
+    with open(os.path.join(str(tmpdir), 'checkpoint.json')) as file:
+        state = json.load(file)['slices']['0']
+    assert state['done']
+    assert state['request_timestamp'] == '2026-01-01T06:00:00.000Z'
+
+    # a finished export is not repeated
+    assert LogExporter(service.list_all_logs, 'language::en', str(tmpdir)).export() == 0
+    assert len(service.requests) == 3
+
+
+def test_export_resumes_from_the_checkpointed_cursor(tmpdir):
+    service = FakeLogService(timestamps(7))
+    service.fail_on['6@language::en'] = 403
+    exporter = LogExporter(service.list_all_logs, 'language::en', str(tmpdir),
+                           page_limit=3, checkpoint_interval=3)
+    with pytest.raises(ApiException):
+        exporter.export()
+    assert exporter.exported == 6
+
+    service.fail_on.clear()
+    exporter = LogExporter(service.list_all_logs, 'language::en', str(tmpdir), page_limit=3)
+    assert exporter.export() == 1
+    assert service.requests[-1] == ('language::en', '6@language::en')
+    assert read_ndjson(os.path.join(str(tmpdir), 'logs-000.ndjson.gz')) == service.logs
+
+
+def test_export_restarts_from_the_last_timestamp_when_the_cursor_expired(tmpdir):
+    # two events share the timestamp at the page boundary
+    service = FakeLogService(timestamps(2) + ['2026-01-01T02:00:00.000Z'] * 2 + timestamps(6)[4:])
+    service.fail_on['3@language::en'] = 403
+    exporter = LogExporter(service.list_all_logs, 'language::en', str(tmpdir),
+                           page_limit=3, checkpoint_interval=3)
+    with pytest.raises(ApiException):
+        exporter.export()
+
+    service.fail_on.clear()
+    log_export.CURSOR_LIFETIME = 0
+    try:
+        exporter = LogExporter(service.list_all_logs, 'language::en', str(tmpdir), page_limit=3)
+        assert exporter.export() == 3
+    finally:
+        log_export.CURSOR_LIFETIME = 300
+    assert service.requests[-2] == ('language::en,request_timestamp>=2026-01-01T02:00:00.000Z', None)
+    assert read_ndjson(os.path.join(str(tmpdir), 'logs-000.ndjson.gz')) == service.logs
+
+
+def test_export_falls_back_to_the_timestamp_when_the_cursor_is_rejected(tmpdir):
+    service = FakeLogService(timestamps(5))
+    service.fail_on['4@language::en'] = 400
+    exporter = LogExporter(service.list_all_logs, 'language::en', str(tmpdir),
+                           page_limit=2, checkpoint_interval=2)
+    assert exporter.export() == 5
+    assert service.requests[-1] == ('language::en,request_timestamp>=2026-01-01T03:00:00.000Z', None)
+    assert read_ndjson(os.path.join(str(tmpdir), 'logs-000.ndjson.gz')) == service.logs
+
+
+def test_time_sliced_export(tmpdir):
+    service = FakeLogService(timestamps(12) + timestamps(12, day='2026-01-02'))
+    exporter = LogExporter(service.list_all_logs, 'language::en', str(tmpdir), page_limit=5)
+    assert exporter.export('2026-01-01', '2026-01-03', slices=4) == 24
+
+    filters = sorted(set(query for query, cursor in service.requests if cursor is None))
+    assert filters[0] == 'language::en,request_timestamp>=2026-01-01T00:00:00.000Z,' \
+                         'request_timestamp<2026-01-01T12:00:00.000Z'
+    logs = []
+    for index in range(4):
+        logs.extend(read_ndjson(os.path.join(str(tmpdir), 'logs-{0:03d}.ndjson.gz'.format(index))))
+    assert logs == service.logs
+
+    with pytest.raises(ValueError):
+        exporter.export('2026-01-01', '2026-01-03', slices=2)
+
+
+def test_parquet_export(tmpdir):
+    parquet = pytest.importorskip('pyarrow.parquet')
+    service = FakeLogService(timestamps(5))
+    exporter = LogExporter(service.list_all_logs, 'language::en', str(tmpdir),
+                           format='parquet', page_limit=2, checkpoint_interval=4)
+    assert exporter.export() == 5
+
+    rows = []
+    for name in sorted(os.listdir(str(tmpdir))):
+        if name.endswith('.parquet'):
+            rows.extend(parquet.read_table(os.path.join(str(tmpdir), name)).to_pylist())
+    assert [row['log_id'] for row in rows] == [log['log_id'] for log in service.logs]
+    assert json.loads(rows[0]['request']) == {'input': {'text': '0'}}
+    assert rows[0]['assistant_id'] is None
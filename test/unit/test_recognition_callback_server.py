@@ -0,0 +1,112 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for RecognitionCallbackServer
+"""
+
+import asyncio
+import http.client
+import json
+import requests
+from ibm_watson.recognition_callback_server import (RecognitionCallbackServer,
+                                                    callback_signature)
+
+_notification = {
+    'id': '4bd734c0-e575-21f3-de03-f932aa0468a0',
+    'event': 'recognitions.completed_with_results',
+    'user_token': 'job25110',
+    'results': [{'result_index': 0, 'results': []}]
+}
+
+
+def url_of(server, path='/'):
+    return 'http://127.0.0.1:{0}{1}'.format(server.server_address[1], path)
+
+
+class TestRecognitionCallbackServer:
+
+    def test_challenge(self):
+        with RecognitionCallbackServer(host='127.0.0.1') as server:
+            response = requests.get(url_of(server),
+                                    params={'challenge_string': 'abc123'})
+        assert response.status_code == 200
+        assert response.text == 'abc123'
+        assert response.headers['Content-Type'] == 'text/plain'
+
+    def test_signed_challenge(self):
+        with RecognitionCallbackServer(host='127.0.0.1',
+                                       user_secret='secret') as server:
+            signed = requests.get(
+                url_of(server),
+                params={'challenge_string': 'abc123'},
+                headers={
+                    'X-Callback-Signature': callback_signature('secret',
+                                                               'abc123')
+                })
+            unsigned = requests.get(url_of(server),
+                                    params={'challenge_string': 'abc123'})
+        assert signed.status_code == 200
+        assert unsigned.status_code == 401
+
+    def test_notification(self):
+        body = json.dumps(_notification).encode('utf-8')
+        with RecognitionCallbackServer(host='127.0.0.1', user_secret='secret',
+                                       path='/results') as server:
+            response = requests.post(
+                url_of(server, '/results'),
+                data=body,
+                headers={'X-Callback-Signature': callback_signature('secret', body)})
+            forged = requests.post(url_of(server, '/results'),
+                                   data=body,
+                                   headers={'X-Callback-Signature': 'forged'})
+            wrong_path = requests.post(url_of(server, '/other'), data=body)
+            notification = server.notifications.get(timeout=5)
+        assert response.status_code == 200
+        assert forged.status_code == 401
+        assert wrong_path.status_code == 404
+        assert notification == _notification
+        assert server.notifications.empty()
+
+    def test_invalid_content_length(self):
+        with RecognitionCallbackServer(max_body_size=10) as server:
+            assert server.server_address[0] == '127.0.0.1'
+            statuses = []
+            for headers in ({}, {'Content-Length': 'abc'},
+                            {'Content-Length': '-1'},
+                            {'Content-Length': '11'}):
+                connection = http.client.HTTPConnection(
+                    *server.server_address)
+                connection.putrequest('POST', '/')
+                for name, value in headers.items():
+                    connection.putheader(name, value)
+                connection.endheaders()
+                statuses.append(connection.getresponse().status)
+                connection.close()
+            assert server.notifications.empty()
+        assert statuses == [400, 400, 400, 413]
+
+    def test_async_queue(self):
+        with RecognitionCallbackServer(host='127.0.0.1') as server:
+
+            async def receive():
+                notifications = server.async_queue()
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    None, lambda: requests.post(url_of(server),
+                                                json=_notification))
+                return await asyncio.wait_for(notifications.get(), 5)
+
+            assert asyncio.run(receive()) == _notification
@@ -0,0 +1,140 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for RecognitionJobManager
+"""
+
+import json
+import re
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_watson import SpeechToTextV1
+from ibm_watson.recognition_jobs import RecognitionJobManager
+
+_base_url = 'https://api.us-south.speech-to-text.watson.cloud.ibm.com'
+
+
+class FakeJobService(object):
+    """Jobs finish after they have been reported by check_jobs twice."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.polls = 0
+        self.max_in_flight = 0
+        self.create_failures = []
+
+    def create_job(self, request):
+        if self.create_failures:
+            status = self.create_failures.pop(0)
+            return (status, {'Retry-After': '0'}, json.dumps({'error': 'Try again'}))
+        job_id = 'job-{0}'.format(len(self.jobs))
+        self.jobs[job_id] = {'id': job_id, 'status': 'waiting', 'checks': 0,
+                             'params': request.url}
+        outstanding = [j for j in self.jobs.values() if j['status'] != 'completed']
+        self.max_in_flight = max(self.max_in_flight, len(outstanding))
+        return (201, {}, json.dumps({'id': job_id, 'status': 'waiting'}))
+
+    def check_jobs(self, request):
+        self.polls += 1
+        for job in self.jobs.values():
+            job['checks'] += 1
+            if job['checks'] >= 2:
+                job['status'] = 'completed'
+        body = {'recognitions': [
+            {'id': j['id'], 'status': j['status']} for j in self.jobs.values()
+        ]}
+        return (200, {}, json.dumps(body))
+
+    def check_job(self, request):
+        job = self.jobs[request.url.rsplit('/', 1)[-1]]
+        body = {'id': job['id'], 'status': job['status'], 'created': 'now'}
+        if job['status'] == 'completed':
+            body['results'] = [{'result_index': 0, 'results': []}]
+        return (200, {}, json.dumps(body))
+
+    def register(self):
+        responses.add_callback(responses.POST, _base_url + '/v1/recognitions',
+                               callback=self.create_job,
+                               content_type='application/json')
+        responses.add_callback(responses.GET, _base_url + '/v1/recognitions',
+                               callback=self.check_jobs,
+                               content_type='application/json')
+        responses.add_callback(responses.GET,
+                               re.compile(_base_url + '/v1/recognitions/.+'),
+                               callback=self.check_job,
+                               content_type='application/json')
+
+
+def make_service():
+    service = SpeechToTextV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+class TestRecognitionJobManager:
+
+    @responses.activate
+    def test_run(self):
+        fake = FakeJobService()
+        fake.register()
+        manager = RecognitionJobManager(make_service(),
+                                        max_in_flight=3,
+                                        min_interval=0,
+                                        results_ttl=30)
+        requests = [{'audio': b'x', 'content_type': 'audio/wav', 'model': str(i)}
+                    for i in range(7)]
+
+        finished = list(manager.run(requests))
+
+        assert sorted(request['model'] for request, _ in finished) == \
+            [str(i) for i in range(7)]
+        assert all(job.status == 'completed' for _, job in finished)
+        assert all(job.results is not None for _, job in finished)
+        assert fake.max_in_flight <= 3
+        assert 'results_ttl=30' in fake.jobs['job-0']['params']
+        # one check_job call per finished job, never per poll
+        check_job_calls = [c for c in responses.calls
+                           if re.search('/v1/recognitions/.+', c.request.url)]
+        assert len(check_job_calls) == 7
+
+    @responses.activate
+    def test_failed_create_job_is_retried(self):
+        fake = FakeJobService()
+        fake.create_failures = [429, 503]
+        fake.register()
+        manager = RecognitionJobManager(make_service(), min_interval=0)
+
+        finished = list(manager.run([{'audio': b'x', 'content_type': 'audio/wav'}]))
+
+        assert [job.status for _, job in finished] == ['completed']
+        assert len(fake.jobs) == 1
+        assert manager.retries == 2
+
+        fake.create_failures = [503]
+        manager = RecognitionJobManager(make_service(), min_interval=0, max_retries=0)
+        with pytest.raises(ApiException):
+            list(manager.run([{'audio': b'x', 'content_type': 'audio/wav'}]))
+
+    def test_results_ttl_caps_interval(self):
+        manager = RecognitionJobManager(make_service(), max_interval=600,
+                                        results_ttl=4)
+        assert manager.max_interval == 60
+
+    def test_max_in_flight_limit(self):
+        with pytest.raises(ValueError):
+            RecognitionJobManager(make_service(), max_in_flight=101)
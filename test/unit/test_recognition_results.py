@@ -0,0 +1,106 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for recognition_results
+"""
+
+from ibm_watson.recognition_results import (offset_results, clip_results,
+                                            merge_results)
+
+
+def make_results(words, speaker_labels=None):
+    """Builds results with one result per word list of (word, start, end)."""
+    results = {
+        'result_index': 0,
+        'results': [{
+            'final': True,
+            'alternatives': [{
+                'transcript': ' '.join(w[0] for w in phrase) + ' ',
+                'confidence': 0.9,
+                'timestamps': [list(w) for w in phrase],
+                'word_confidence': [[w[0], 0.9] for w in phrase],
+            }]
+        } for phrase in words]
+    }
+    if speaker_labels is not None:
+        results['speaker_labels'] = speaker_labels
+    return results
+
+
+class TestOffsetResults:
+
+    def test_offset_results(self):
+        results = make_results([[('hello', 0.5, 1.0)]], [{
+            'from': 0.5,
+            'to': 1.0,
+            'speaker': 0,
+            'confidence': 0.8,
+            'final': True
+        }])
+        shifted = offset_results(results, 10, index_offset=3)
+        assert shifted['results'][0]['alternatives'][0]['timestamps'] == [[
+            'hello', 10.5, 11.0
+        ]]
+        assert shifted['speaker_labels'][0]['from'] == 10.5
+        assert shifted['result_index'] == 3
+        # the input is left untouched
+        assert results['results'][0]['alternatives'][0]['timestamps'][0][1] == 0.5
+
+
+class TestClipResults:
+
+    def test_trims_partial_result(self):
+        results = make_results([[('one', 0.0, 0.4), ('two', 0.5, 0.9),
+                                 ('three', 1.0, 1.4)]])
+        clipped = clip_results(results, 0.45, 1.0)
+        best = clipped['results'][0]['alternatives'][0]
+        assert best['transcript'] == 'two '
+        assert best['timestamps'] == [['two', 0.5, 0.9]]
+        assert best['word_confidence'] == [['two', 0.9]]
+
+    def test_drops_results_outside_range(self):
+        results = make_results([[('one', 0.0, 0.4)], [('two', 2.0, 2.4)]])
+        clipped = clip_results(results, 1.0, None)
+        assert len(clipped['results']) == 1
+        assert clipped['results'][0]['alternatives'][0]['transcript'] == 'two '
+
+
+class TestMergeResults:
+
+    def test_merge_overlapping_pieces(self):
+        # Piece one covers 0-11 s and piece two 9-20 s; "overlap" is heard by both.
+        first = make_results([[('before', 1.0, 1.5)],
+                              [('overlap', 9.6, 9.9), ('late', 10.5, 10.8)]])
+        second = make_results([[('overlap', 0.6, 0.9), ('late', 1.5, 1.8)],
+                               [('after', 5.0, 5.5)]])
+        merged = merge_results([(0, 11, first), (9, 20, second)])
+        words = [
+            timestamp[0] for result in merged['results']
+            for timestamp in result['alternatives'][0]['timestamps']
+        ]
+        assert words == ['before', 'overlap', 'late', 'after']
+        assert merged['results'][-1]['alternatives'][0]['timestamps'] == [[
+            'after', 14.0, 14.5
+        ]]
+        assert merged['result_index'] == 0
+
+    def test_merge_speaker_labels(self):
+        label = {'from': 1.0, 'to': 1.5, 'speaker': 0, 'confidence': 0.5,
+                 'final': True}
+        first = make_results([[('a', 1.0, 1.5)]], [dict(label)])
+        second = make_results([[('b', 1.0, 1.5)]], [dict(label)])
+        merged = merge_results([(0, 5, first), (5, 10, second)])
+        assert [l['from'] for l in merged['speaker_labels']] == [1.0, 6.0]
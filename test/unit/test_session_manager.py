@@ -0,0 +1,127 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for SessionManager
+"""
+
+import threading
+import time
+import pytest
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_watson import SessionManager
+
+
+class FakeAssistant(object):
+    """Records session calls and expires sessions on demand."""
+
+    def __init__(self):
+        self.created = []
+        self.deleted = []
+        self.expired = set()
+        self.messages = []
+        self.lock = threading.Lock()
+
+    def create_session(self, assistant_id, **kwargs):
+        with self.lock:
+            session_id = 'session-{0}'.format(len(self.created))
+            self.created.append(session_id)
+        return DetailedResponse(response={'session_id': session_id}, status_code=201)
+
+    def delete_session(self, assistant_id, session_id, **kwargs):
+        with self.lock:
+            self.deleted.append(session_id)
+        return DetailedResponse(status_code=200)
+
+    def message(self, assistant_id, environment_id, session_id, **kwargs):
+        if session_id in self.expired:
+            raise ApiException(404, message='Invalid Session')
+        self.messages.append((session_id, kwargs))
+        return DetailedResponse(response={'session_id': session_id}, status_code=200)
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_pooled_session_is_used_for_a_new_conversation():
+    assistant = FakeAssistant()
+    with SessionManager(assistant, 'assistant', 'environment', pool_size=2) as manager:
+        wait_for(lambda: len(assistant.created) == 2)
+        response = manager.message('alice', input={'text': 'hi'})
+        assert response.get_result()['session_id'] == 'session-0'
+        assert assistant.messages[0][1] == {'input': {'text': 'hi'}}
+        assert manager.session('alice') == 'session-0'
+        assert manager.hits == 1
+        assert manager.misses == 0
+        # the pool is refilled in the background
+        wait_for(lambda: len(assistant.created) == 3)
+
+
+def test_session_is_created_when_the_pool_is_empty():
+    assistant = FakeAssistant()
+    with SessionManager(assistant, 'assistant', 'environment', pool_size=0) as manager:
+        assert manager.session('alice') == 'session-0'
+        assert manager.session('bob') == 'session-1'
+        assert manager.misses == 2
+
+
+def test_inactive_session_is_replaced_before_the_next_message():
+    assistant = FakeAssistant()
+    with SessionManager(assistant, 'assistant', 'environment', pool_size=0,
+                        inactivity_timeout=0.3, expiry_margin=0.1) as manager:
+        assert manager.session('alice') == 'session-0'
+        time.sleep(0.25)
+        assert manager.session('alice') == 'session-1'
+        assert manager.recreated == 1
+
+
+def test_pooled_sessions_are_replaced_before_they_expire():
+    assistant = FakeAssistant()
+    with SessionManager(assistant, 'assistant', 'environment', pool_size=1,
+                        inactivity_timeout=0.3, expiry_margin=0.1):
+        wait_for(lambda: len(assistant.created) >= 3)
+
+
+def test_message_is_retried_once_in_a_new_session():
+    assistant = FakeAssistant()
+    with SessionManager(assistant, 'assistant', 'environment', pool_size=0) as manager:
+        manager.message('alice')
+        assistant.expired.add('session-0')
+        response = manager.message('alice', input={'text': 'again'})
+        assert response.get_result()['session_id'] == 'session-1'
+        assert manager.recreated == 1
+        assert manager.session('alice') == 'session-1'
+
+        assistant.expired.update(['session-1', 'session-2'])
+        with pytest.raises(ApiException):
+            manager.message('alice')
+
+
+def test_close_deletes_all_sessions():
+    assistant = FakeAssistant()
+    manager = SessionManager(assistant, 'assistant', 'environment', pool_size=2)
+    wait_for(lambda: len(assistant.created) == 2)
+    for name in ['alice', 'bob', 'carol']:
+        manager.session(name)
+    manager.end('carol')
+    assert len(assistant.deleted) == 1
+    manager.close()
+    assert sorted(assistant.deleted) == sorted(assistant.created)
+    with pytest.raises(RuntimeError):
+        manager.session('alice')
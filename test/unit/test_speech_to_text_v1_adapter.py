@@ -0,0 +1,934 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for SpeechToTextV1Adapter
+"""
+
+import asyncio
+import concurrent.futures
+import io
+import json
+import queue
+import threading
+import time
+import pytest
+import responses
+import wave
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_watson import SpeechToTextV1
+from ibm_watson.websocket import AudioSource, RecognizeCallback, HypothesisThrottle
+from ibm_watson.websocket.audio_source import END_OF_STREAM
+from ibm_watson.websocket import recognize_listener
+from ibm_watson.websocket.recognize_listener import RecognizeListener, AudioHistory
+from ibm_watson.websocket.recognize_stream import RecognizeStream
+from array import array
+from ibm_watson.audio_utils import AudioPreprocessor
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+
+
+class FakeRecognizeServer(object):
+    """Local stand-in for the speech to text websocket interface."""
+
+    def __init__(self):
+        self.received_audio = []
+        self.start_messages = []
+        self.connections = 0
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever,
+                                       daemon=True)
+        self.runner = None
+        self.port = None
+
+    def __enter__(self):
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+        return self
+
+    def __exit__(self, *args):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(),
+                                         self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+    @property
+    def url(self):
+        return 'ws://127.0.0.1:{0}'.format(self.port)
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get('/v1/recognize', self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def _handle(self, request):
+        self.connections += 1
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        audio = bytearray()
+        async for message in ws:
+            if message.type == aiohttp.WSMsgType.BINARY:
+                audio.extend(message.data)
+                continue
+            data = json.loads(message.data)
+            if data.get('action') == 'start':
+                self.start_messages.append(data)
+                audio = bytearray()
+                await ws.send_str(json.dumps({'state': 'listening'}))
+            elif data.get('action') == 'stop':
+                self.received_audio.append(bytes(audio))
+                await ws.send_str(json.dumps(self.results_for(audio)))
+                await ws.send_str(json.dumps({'state': 'listening'}))
+        return ws
+
+    @staticmethod
+    def results_for(audio):
+        # the timestamp assumes 16 kHz mono audio
+        return {
+            'result_index': 0,
+            'results': [{
+                'final': True,
+                'alternatives': [{
+                    'transcript': 'received {0} bytes'.format(len(audio)),
+                    'confidence': 0.9,
+                    'timestamps': [['received', 0.0,
+                                    round(len(audio) / 32000.0, 2)]]
+                }]
+            }]
+        }
+
+
+class FlakyRecognizeServer(FakeRecognizeServer):
+    """
+    Drops the first `drops` connections after a final result for their first
+    second.
+    """
+
+    drops = 1
+    send_result = True
+
+    async def _handle(self, request):
+        if len(self.start_messages) >= self.drops:
+            return await FakeRecognizeServer._handle(self, request)
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        audio = bytearray()
+        async for message in ws:
+            if message.type == aiohttp.WSMsgType.BINARY:
+                audio.extend(message.data)
+                if len(audio) >= 32000:
+                    self.received_audio.append(bytes(audio))
+                    if not self.send_result:
+                        await ws.close()
+                        break
+                    await ws.send_str(json.dumps({
+                        'result_index': 0,
+                        'results': [{
+                            'final': True,
+                            'alternatives': [{
+                                'transcript': 'first ',
+                                'timestamps': [['first', 0.1, 0.5]]
+                            }]
+                        }]
+                    }))
+                    await ws.close()
+                    break
+            elif json.loads(message.data).get('action') == 'start':
+                self.start_messages.append(json.loads(message.data))
+                await ws.send_str(json.dumps({'state': 'listening'}))
+        return ws
+
+
+class CollectingCallback(RecognizeCallback):
+
+    def __init__(self):
+        RecognizeCallback.__init__(self)
+        self.events = []
+        self.transcripts = []
+        self.data = []
+        self.errors = []
+
+    def on_connected(self):
+        self.events.append('connected')
+
+    def on_listening(self):
+        self.events.append('listening')
+
+    def on_transcription(self, transcript):
+        self.transcripts.append(transcript)
+
+    def on_data(self, data):
+        self.data.append(data)
+
+    def on_error(self, error):
+        self.errors.append(error)
+
+    def on_close(self):
+        self.events.append('close')
+
+
+def make_service(url):
+    service = SpeechToTextV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(url)
+    return service
+
+
+class TestRecognizeUsingWebsocket:
+
+    def test_recognize_using_websocket(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            callback = CollectingCallback()
+            audio = AudioSource(io.BytesIO(b'\x00' * 4000))
+
+            service.recognize_using_websocket(audio, 'audio/l16;rate=16000',
+                                              callback)
+
+        assert callback.errors == []
+        assert callback.events[:2] == ['connected', 'listening']
+        assert callback.transcripts == [[[{
+            'transcript': 'received 4000 bytes',
+            'confidence': 0.9
+        }]]]
+
+    def test_fast_pacing(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            callback = CollectingCallback()
+            audio = AudioSource(io.BytesIO(b'\x00' * 320000))
+
+            service.recognize_using_websocket(audio,
+                                              'audio/l16;rate=16000',
+                                              callback,
+                                              pacing='fast')
+
+        assert callback.errors == []
+        assert server.received_audio == [b'\x00' * 320000]
+        assert 'pacing' not in server.start_messages[0]
+
+
+    def test_buffered_queue(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            callback = CollectingCallback()
+            buffer = queue.Queue()
+            audio = AudioSource(buffer, is_recording=True, is_buffer=True)
+
+            def record():
+                for _ in range(5):
+                    buffer.put(b'\x03' * 10)
+                audio.completed_recording()
+
+            threading.Thread(target=record).start()
+            service.recognize_using_websocket(audio, 'audio/l16;rate=16000',
+                                              callback)
+
+        assert callback.errors == []
+        assert server.received_audio == [b'\x03' * 50]
+
+
+class TestReconnect:
+
+    def test_resume_after_dropped_connection(self, monkeypatch):
+        monkeypatch.setattr(recognize_listener, 'RECONNECT_DELAY', 0)
+        with FlakyRecognizeServer() as server:
+            service = make_service(server.url)
+            callback = CollectingCallback()
+            audio = AudioSource(io.BytesIO(b'\x01\x00' * 48000))
+
+            service.recognize_using_websocket(audio,
+                                              'audio/l16;rate=16000',
+                                              callback,
+                                              pacing='fast',
+                                              max_reconnects=2)
+
+        assert callback.errors == []
+        assert callback.events == ['connected', 'listening', 'close']
+        assert len(server.start_messages) == 2
+        assert server.start_messages[1]['timestamps'] is True
+        # the audio after the end of the first final result is replayed
+        assert server.received_audio[1] == b'\x01\x00' * 40000
+        assert [data['result_index'] for data in callback.data] == [0, 1]
+        assert callback.data[1]['results'][0]['alternatives'][0][
+            'timestamps'] == [['received', 0.5, 3.0]]
+
+    def test_gives_up_after_max_reconnects(self, monkeypatch):
+        monkeypatch.setattr(recognize_listener, 'RECONNECT_DELAY', 0)
+        with FlakyRecognizeServer() as server:
+            service = make_service(server.url)
+            callback = CollectingCallback()
+            audio = AudioSource(io.BytesIO(b'\x01\x00' * 48000))
+            server.drops = 10
+            server.send_result = False
+
+            service.recognize_using_websocket(audio,
+                                              'audio/l16;rate=16000',
+                                              callback,
+                                              pacing='fast',
+                                              max_reconnects=1)
+
+        assert len(server.start_messages) == 2
+        assert len(callback.errors) == 1
+        assert callback.events == ['connected', 'listening', 'close']
+
+    def test_requires_known_byte_rate(self):
+        with pytest.raises(ValueError):
+            RecognizeListener(AudioSource(io.BytesIO(b'')),
+                              {'content_type': 'audio/ogg'},
+                              CollectingCallback(), 'ws://localhost', {},
+                              max_reconnects=1)
+
+    def test_audio_history(self):
+        history = AudioHistory(8)
+        for i in range(5):
+            history.append(bytes([i]) * 4)
+        assert (history.start, history.end) == (12, 20)
+        assert history.read_from(14) == (b'\x03\x03\x04\x04\x04\x04', 14)
+        assert history.read_from(0) == (b'\x03' * 4 + b'\x04' * 4, 12)
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+class TestConnectionPool:
+
+    def test_recognize_with_pooled_connection(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            with service.create_websocket_pool(model='en-US') as pool:
+                wait_for(lambda: server.connections == 1)
+                callback = CollectingCallback()
+                service.recognize_using_websocket(
+                    AudioSource(io.BytesIO(b'\x00' * 4000)),
+                    'audio/l16;rate=16000',
+                    callback,
+                    model='en-US',
+                    connection_pool=pool)
+                # the pool opens a replacement for the connection taken
+                wait_for(lambda: server.connections == 2)
+
+        assert (pool.hits, pool.misses) == (1, 0)
+        assert callback.errors == []
+        assert callback.events == ['connected', 'listening', 'close', 'close']
+        assert server.received_audio == [b'\x00' * 4000]
+
+    def test_idle_connections_are_replaced(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            with service.create_websocket_pool(size=2, idle_timeout=0.1):
+                wait_for(lambda: server.connections >= 6)
+
+    def test_pool_for_other_model(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            with service.create_websocket_pool(model='en-US') as pool:
+                with pytest.raises(ValueError):
+                    service.recognize_using_websocket(
+                        AudioSource(io.BytesIO(b'\x00')),
+                        'audio/l16;rate=16000',
+                        CollectingCallback(),
+                        connection_pool=pool)
+
+
+class TestRecognizeSession:
+
+    def test_utterances_share_a_connection(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            callback = CollectingCallback()
+            with service.recognize_session('audio/l16;rate=16000',
+                                           model='en-US',
+                                           timestamps=True) as session:
+                first = session.recognize_utterance(b'\x00' * 4000, callback)
+                second = session.recognize_utterance(
+                    AudioSource(io.BytesIO(b'\x00' * 2000)))
+
+        assert server.connections == 1
+        assert [m['timestamps'] for m in server.start_messages] == [True, True]
+        assert server.received_audio == [b'\x00' * 4000, b'\x00' * 2000]
+        assert first['results'][0]['alternatives'][0]['transcript'] == \
+            'received 4000 bytes'
+        assert second['results'][0]['alternatives'][0]['transcript'] == \
+            'received 2000 bytes'
+        assert callback.errors == []
+        assert callback.events[:2] == ['connected', 'listening']
+
+    def test_reconnects_after_close(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            session = service.recognize_session('audio/l16;rate=16000')
+            session.recognize_utterance(b'\x00' * 10)
+            session._connection.close()
+            results = session.recognize_utterance(b'\x00' * 20)
+            session.close()
+
+        assert server.connections == 2
+        assert results['results'][0]['alternatives'][0]['transcript'] == \
+            'received 20 bytes'
+
+    def test_session_from_pool(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            with service.create_websocket_pool() as pool:
+                with service.recognize_session(
+                        'audio/l16;rate=16000',
+                        connection_pool=pool) as session:
+                    session.recognize_utterance(b'\x00' * 10)
+                    session.recognize_utterance(b'\x00' * 10)
+
+        assert pool.hits + pool.misses == 1
+        assert len(server.start_messages) == 2
+
+
+class TestAudioSource:
+
+    def test_completed_recording_queues_marker(self):
+        buffer = queue.Queue()
+        audio = AudioSource(buffer, is_recording=True, is_buffer=True)
+        audio.completed_recording()
+        assert not audio.is_recording
+        assert buffer.get_nowait() is END_OF_STREAM
+
+    def test_read_backlog(self):
+        buffer = queue.Queue()
+        audio = AudioSource(buffer, is_recording=True, is_buffer=True)
+        for i in range(4):
+            buffer.put(bytes([i]) * 4)
+        audio.completed_recording()
+
+        data, finished = audio.read_backlog(buffer.get(), 8)
+        assert (data, finished) == (b'\x00' * 4 + b'\x01' * 4, False)
+        data, finished = audio.read_backlog(buffer.get(), 1024)
+        assert (data, finished) == (b'\x02' * 4 + b'\x03' * 4, True)
+
+
+class NoExecutor(concurrent.futures.ThreadPoolExecutor):
+    """Fails any work handed to it."""
+
+    def submit(self, fn, *args, **kwargs):
+        raise AssertionError('unexpected executor call to {0}'.format(fn))
+
+
+class TestRecognizeUsingWebsocketAsync:
+
+    def test_recognize_using_websocket_async(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            callback = CollectingCallback()
+            audio = AudioSource(io.BytesIO(b'\x00' * 4000))
+
+            asyncio.run(
+                service.recognize_using_websocket_async(
+                    audio, 'audio/l16;rate=16000', callback, model='en-US'))
+
+        assert callback.errors == []
+        assert callback.events == ['connected', 'listening', 'close']
+        assert callback.transcripts == [[[{
+            'transcript': 'received 4000 bytes',
+            'confidence': 0.9
+        }]]]
+        assert server.start_messages[0]['content_type'] == 'audio/l16;rate=16000'
+
+    def test_file_input_is_read_off_the_loop(self):
+        reader_threads = []
+
+        class RecordingBytesIO(io.BytesIO):
+
+            def read(self, *args):
+                reader_threads.append(threading.current_thread())
+                return super().read(*args)
+
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            callback = CollectingCallback()
+            audio = AudioSource(RecordingBytesIO(b'\x00' * 4000))
+            asyncio.run(
+                service.recognize_using_websocket_async(
+                    audio, 'audio/l16;rate=16000', callback))
+
+        assert callback.errors == []
+        assert server.received_audio == [b'\x00' * 4000]
+        assert threading.current_thread() not in reader_threads
+
+    def test_concurrent_sessions_share_one_loop(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            callbacks = [CollectingCallback() for _ in range(5)]
+
+            async def run_all():
+                async with aiohttp.ClientSession() as session:
+                    await asyncio.gather(*[
+                        service.recognize_using_websocket_async(
+                            AudioSource(io.BytesIO(b'\x01' * (100 * (i + 1)))),
+                            'audio/l16;rate=16000',
+                            callback,
+                            http_session=session)
+                        for i, callback in enumerate(callbacks)
+                    ])
+
+            asyncio.run(run_all())
+
+        assert sorted(server.received_audio, key=len) == [
+            b'\x01' * (100 * (i + 1)) for i in range(5)
+        ]
+        for callback in callbacks:
+            assert callback.errors == []
+            assert callback.events[-1] == 'close'
+
+    def test_buffered_asyncio_queue(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            callback = CollectingCallback()
+
+            async def run():
+                queue = asyncio.Queue()
+                audio = AudioSource(queue, is_recording=True, is_buffer=True)
+
+                async def record():
+                    for _ in range(3):
+                        await queue.put(b'\x02' * 10)
+                        await asyncio.sleep(0.01)
+                    audio.completed_recording()
+
+                await asyncio.gather(
+                    record(),
+                    service.recognize_using_websocket_async(
+                        audio, 'audio/l16;rate=16000', callback))
+
+            asyncio.run(run())
+
+        assert server.received_audio == [b'\x02' * 30]
+
+    def test_buffered_thread_safe_queue(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            callback = CollectingCallback()
+            buffer = queue.Queue()
+            audio = AudioSource(buffer, is_recording=True, is_buffer=True)
+            ticks = []
+
+            def record():
+                for _ in range(3):
+                    time.sleep(0.05)
+                    buffer.put(b'\x04' * 10)
+                audio.completed_recording()
+
+            async def tick(session):
+                # the loop keeps running while the listener waits for audio
+                while not session.done():
+                    ticks.append(None)
+                    await asyncio.sleep(0.01)
+
+            async def run():
+                # waiting for audio must not park a thread of the executor
+                asyncio.get_running_loop().set_default_executor(NoExecutor())
+                session = asyncio.ensure_future(
+                    service.recognize_using_websocket_async(
+                        audio, 'audio/l16;rate=16000', callback))
+                await asyncio.gather(session, tick(session))
+
+            threading.Thread(target=record).start()
+            asyncio.run(run())
+
+        assert callback.errors == []
+        assert server.received_audio == [b'\x04' * 30]
+        assert len(ticks) >= 10
+
+    def test_cancelled_session_leaves_thread_safe_queue_intact(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            buffer = queue.Queue()
+            audio = AudioSource(buffer, is_recording=True, is_buffer=True)
+
+            async def run():
+                session = asyncio.ensure_future(
+                    service.recognize_using_websocket_async(
+                        audio, 'audio/l16;rate=16000', CollectingCallback()))
+                await asyncio.sleep(0.2)
+                session.cancel()
+                await asyncio.gather(session, return_exceptions=True)
+
+            asyncio.run(run())
+
+        # audio put after the session ended is neither taken nor lost
+        buffer.put(b'\x05')
+        assert buffer.get_nowait() == b'\x05'
+        assert '_put' not in vars(buffer)
+
+    def test_certificates_are_verified_by_default(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            connects = []
+
+            async def run(disable_ssl_verification):
+                service.set_disable_ssl_verification(disable_ssl_verification)
+                async with aiohttp.ClientSession() as session:
+                    ws_connect = session.ws_connect
+
+                    def record(url, **kwargs):
+                        connects.append(kwargs)
+                        return ws_connect(url, **kwargs)
+
+                    session.ws_connect = record
+                    await service.recognize_using_websocket_async(
+                        AudioSource(io.BytesIO(b'\x00' * 10)),
+                        'audio/l16;rate=16000',
+                        CollectingCallback(),
+                        http_session=session)
+
+            asyncio.run(run(False))
+            asyncio.run(run(True))
+
+        assert connects[0]['ssl'] is True
+        assert connects[1]['ssl'] is False
+
+    def test_missing_audio_source(self):
+        service = make_service('https://stream.watsonplatform.net')
+        with pytest.raises(Exception):
+            asyncio.run(
+                service.recognize_using_websocket_async(
+                    b'audio', 'audio/wav', CollectingCallback()))
+
+
+def interim(text):
+    return {'results': [{'final': False, 'alternatives': [{'transcript': text}]}]}
+
+
+def final(text):
+    return {'results': [{'final': True, 'alternatives': [{'transcript': text}]}]}
+
+
+class TestRecognizeStream:
+
+    def test_recognize_stream(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            stream = service.recognize_stream(
+                AudioSource(io.BytesIO(b'\x00' * 4000)), 'audio/l16;rate=16000')
+            events = list(stream)
+
+        assert [event['results'][0]['alternatives'][0]['transcript']
+                for event in events] == ['received 4000 bytes']
+
+    def test_recognize_stream_async(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+
+            async def run():
+                stream = service.recognize_stream_async(
+                    AudioSource(io.BytesIO(b'\x00' * 4000)),
+                    'audio/l16;rate=16000')
+                return [event async for event in stream]
+
+            events = asyncio.run(run())
+
+        assert [event['results'][0]['alternatives'][0]['transcript']
+                for event in events] == ['received 4000 bytes']
+
+    def test_connection_error_is_raised(self):
+        service = make_service('ws://127.0.0.1:1')
+        stream = service.recognize_stream(AudioSource(io.BytesIO(b'\x00')),
+                                          'audio/l16;rate=16000')
+        with pytest.raises(Exception):
+            list(stream)
+
+    def test_drop_interim(self):
+        stream = RecognizeStream(buffer_size=2, interim_policy='drop_interim')
+        stream.callback.on_data(interim('a'))
+        stream.callback.on_data(interim('a b'))
+        stream.callback.on_data(final('a b c'))
+        stream.callback.on_data(interim('d'))
+        stream.callback.on_close()
+
+        assert [event['results'][0]['alternatives'][0]['transcript']
+                for event in stream] == ['a b c', 'd']
+        assert stream.dropped == 2
+
+    def test_block_waits_for_consumer(self):
+        stream = RecognizeStream(buffer_size=1)
+        produced = []
+
+        def produce():
+            for i in range(5):
+                stream.callback.on_data(final(str(i)))
+                produced.append(i)
+            stream.callback.on_close()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        first = next(stream)
+        assert len(produced) <= 2
+        rest = list(stream)
+        producer.join()
+
+        assert [event['results'][0]['alternatives'][0]['transcript']
+                for event in [first] + rest] == ['0', '1', '2', '3', '4']
+        assert stream.dropped == 0
+
+    def test_abandoned_stream_releases_the_producer(self):
+        streams = [RecognizeStream(buffer_size=1), RecognizeStream(buffer_size=1)]
+        callbacks = [stream.callback for stream in streams]
+        producers = []
+        for callback in callbacks:
+
+            def produce(callback=callback):
+                for i in range(5):
+                    callback.on_data(final(str(i)))
+                callback.on_close()
+
+            producers.append(threading.Thread(target=produce, daemon=True))
+            producers[-1].start()
+
+        # leaving a with block closes the stream
+        with streams.pop(0) as stream:
+            for _ in stream:
+                break
+        # so does garbage collection of a stream that was not closed
+        for _ in streams[0]:
+            break
+        del stream, streams
+
+        for producer in producers:
+            producer.join(5)
+            assert not producer.is_alive()
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            RecognizeStream(interim_policy='latest')
+
+
+class TestRecognizeParallel:
+
+    @responses.activate
+    def test_recognize_parallel(self):
+        service = make_service('https://api.us-south.speech-to-text.watson.cloud.ibm.com')
+        rate = 100
+
+        def reply(request):
+            # Each piece hears one word at a quarter past every second.
+            with wave.open(io.BytesIO(request.body), 'rb') as piece:
+                duration = piece.getnframes() // piece.getframerate()
+            timestamps = [['w', k + 0.25, k + 0.5] for k in range(duration)]
+            results = {
+                'result_index': 0,
+                'results': [{
+                    'final': True,
+                    'alternatives': [{
+                        'transcript': 'w ' * duration,
+                        'timestamps': timestamps
+                    }]
+                }]
+            }
+            return (200, {}, json.dumps(results))
+
+        responses.add_callback(responses.POST,
+                               service.service_url + '/v1/recognize',
+                               callback=reply,
+                               content_type='application/json')
+
+        output = io.BytesIO()
+        with wave.open(output, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(rate)
+            wav.writeframes(b'\x01\x00' * rate * 30)
+
+        response = service.recognize_parallel(output.getvalue(),
+                                              'audio/wav',
+                                              window=10,
+                                              overlap=2,
+                                              silence_search=0,
+                                              model='en-US_Telephony')
+        assert len(responses.calls) == 3
+        assert 'timestamps=true' in responses.calls[0].request.url
+        timestamps = [
+            timestamp for result in response.get_result()['results']
+            for timestamp in result['alternatives'][0]['timestamps']
+        ]
+        assert [t[1] for t in timestamps] == [k + 0.25 for k in range(30)]
+
+
+class TestAudioPreprocessor:
+
+    @responses.activate
+    def test_recognize(self):
+        service = make_service('https://api.us-south.speech-to-text.watson.cloud.ibm.com')
+        service.set_audio_preprocessor(AudioPreprocessor())
+        responses.add(responses.POST,
+                      service.service_url + '/v1/recognize',
+                      body='{"results": []}',
+                      content_type='application/json')
+
+        service.recognize(b'\x01\x00' * 48000,
+                          content_type='audio/l16;rate=48000',
+                          model='en-US_NarrowbandModel')
+
+        request = responses.calls[0].request
+        assert request.headers['Content-Type'] == \
+            'audio/l16;rate=8000;channels=1;endianness=little-endian'
+        assert len(request.body) == 16000
+
+    def test_websocket_buffered(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            service.set_audio_preprocessor(AudioPreprocessor())
+            callback = CollectingCallback()
+            buffer = queue.Queue()
+            audio = AudioSource(buffer, is_recording=True, is_buffer=True)
+            for _ in range(10):
+                buffer.put(b'\x01\x00\x01\x00' * 4410)
+            audio.completed_recording()
+
+            service.recognize_using_websocket(audio,
+                                              'audio/l16;rate=44100;channels=2',
+                                              callback)
+
+        assert callback.errors == []
+        assert server.start_messages[0]['content_type'] == \
+            'audio/l16;rate=16000;channels=1;endianness=little-endian'
+        assert len(server.received_audio[0]) == 32000
+
+    @responses.activate
+    def test_recognize_trims_silence(self):
+        service = make_service('https://api.us-south.speech-to-text.watson.cloud.ibm.com')
+        service.set_audio_preprocessor(AudioPreprocessor(trim_silence=True))
+        responses.add(responses.POST,
+                      service.service_url + '/v1/recognize',
+                      body=json.dumps({
+                          'results': [{
+                              'alternatives': [{
+                                  'transcript': 'hello ',
+                                  'timestamps': [['hello', 1.5, 1.9]]
+                              }]
+                          }],
+                          'speaker_labels': [{'from': 1.5, 'to': 1.9}]
+                      }),
+                      content_type='application/json')
+
+        response = service.recognize(speech_and_silence(),
+                                     content_type='audio/l16;rate=16000')
+
+        assert len(responses.calls[0].request.body) == 2 * int(16000 * 2.3)
+        result = response.get_result()
+        assert result['results'][0]['alternatives'][0]['timestamps'] == \
+            [['hello', 6.2, 6.6]]
+        assert result['speaker_labels'] == [{'from': 6.2, 'to': 6.6}]
+
+    def test_websocket_trims_silence(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            service.set_audio_preprocessor(
+                AudioPreprocessor(trim_silence=True))
+            callback = CollectingCallback()
+            buffer = queue.Queue()
+            audio = AudioSource(buffer, is_recording=True, is_buffer=True)
+            buffer.put(speech_and_silence())
+            audio.completed_recording()
+
+            service.recognize_using_websocket(audio, 'audio/l16;rate=16000',
+                                              callback)
+
+        assert callback.errors == []
+        assert len(server.received_audio[0]) == 2 * int(16000 * 2.3)
+        # the end of the trimmed audio maps to the end of the original
+        timestamps = callback.data[0]['results'][0]['alternatives'][0][
+            'timestamps']
+        assert timestamps == [['received', 0.0, 7.0]]
+
+
+def speech_and_silence():
+    """One second of tone, five of silence and another second of tone."""
+    tone = array('h', [8000, -8000] * 8000).tobytes()
+    return tone + b'\x00\x00' * 80000 + tone
+
+
+class HypothesisCallback(RecognizeCallback):
+
+    def __init__(self):
+        RecognizeCallback.__init__(self)
+        self.hypotheses = []
+        self.diffs = []
+        self.data = []
+
+    def on_hypothesis(self, hypothesis):
+        self.hypotheses.append(hypothesis)
+
+    def on_hypothesis_diff(self, keep, text):
+        self.diffs.append((keep, text))
+
+    def on_data(self, data):
+        self.data.append(data)
+
+
+class TestHypothesisThrottle:
+
+    options = {'interim_results': True}
+
+    def feed(self, throttle, callback, hypotheses):
+        for text, final in hypotheses:
+            RecognizeListener.process_results(
+                {'results': [{'final': final,
+                              'alternatives': [{'transcript': text}]}]},
+                self.options, callback, throttle)
+
+    def test_stable_prefix(self):
+        callback = HypothesisCallback()
+        self.feed(HypothesisThrottle(stable_prefix=True), callback, [
+            ('the', False), ('the cat', False), ('the cap', False),
+            ('the cat sat', False), ('the cat sat ', True)
+        ])
+        assert callback.hypotheses == ['the', 'the cat', 'the cat sat',
+                                       'the cat sat ']
+        assert len(callback.data) == 4
+
+    def test_min_interval(self):
+        callback = HypothesisCallback()
+        self.feed(HypothesisThrottle(min_interval=60), callback, [
+            ('a', False), ('a b', False), ('a b c', False), ('a b c ', True),
+            ('d', False)
+        ])
+        assert callback.hypotheses == ['a', 'a b c ']
+
+    def test_diffs(self):
+        callback = HypothesisCallback()
+        self.feed(HypothesisThrottle(diffs=True), callback, [
+            ('the cat', False), ('the cap sat', False), ('the cat sat ', True),
+            ('and', False)
+        ])
+        assert callback.hypotheses == []
+        assert callback.diffs == [(0, 'the cat'), (6, 'p sat'),
+                                  (6, 't sat '), (0, 'and')]
+
+    def test_websocket_option(self):
+        with FakeRecognizeServer() as server:
+            service = make_service(server.url)
+            callback = HypothesisCallback()
+            service.recognize_using_websocket(
+                AudioSource(io.BytesIO(b'\x00' * 10)),
+                'audio/l16;rate=16000',
+                callback,
+                interim_results=True,
+                hypothesis_throttle=HypothesisThrottle(diffs=True))
+
+        assert callback.diffs == [(0, 'received 10 bytes')]
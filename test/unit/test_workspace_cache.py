@@ -0,0 +1,134 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for WorkspaceCache
+"""
+
+import json
+import os
+import urllib
+import responses
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_watson import AssistantV1, WorkspaceCache
+
+_base_url = 'https://api.us-south.assistant.watson.cloud.ibm.com'
+_service = AssistantV1(authenticator=NoAuthAuthenticator(), version='2021-11-27')
+_service.set_service_url(_base_url)
+
+
+class FakeWorkspace(object):
+    """Serves a workspace whose content and updated timestamp can change."""
+
+    def __init__(self, etag=False):
+        self.updated = '2026-01-01T00:00:00.000Z'
+        self.intents = [{'intent': 'greeting', 'examples': [{'text': 'hi'}]}]
+        self.etag = etag
+        self.requests = []
+        self.status = 'Available'
+
+    def callback(self, request):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+        export = query.get('export') == ['true'] or '/export' in request.url
+        self.requests.append('full' if export else 'metadata')
+        body = {'name': 'ws', 'language': 'en', 'learning_opt_out': False, 'updated': self.updated,
+                'status': self.status}
+        if export:
+            body['intents'] = self.intents
+        headers = {'Content-Type': 'application/json'}
+        if self.etag:
+            headers['ETag'] = '"{0}"'.format(self.updated)
+            if request.headers.get('If-None-Match') == headers['ETag']:
+                return (304, headers, '')
+        return (200, headers, json.dumps(body))
+
+    def add(self):
+        responses.add_callback(responses.GET, _base_url + '/v1/workspaces/ws', callback=self.callback)
+        responses.add_callback(responses.GET, _base_url + '/v1/workspaces_async/ws/export', callback=self.callback)
+
+
+@responses.activate
+def test_unchanged_workspace_is_revalidated_with_a_metadata_request(tmpdir):
+    workspace = FakeWorkspace()
+    workspace.add()
+    cache = WorkspaceCache(_service, str(tmpdir))
+
+    first = cache.get_workspace('ws', export=True).get_result()
+    assert workspace.requests == ['metadata', 'full']
+    second = cache.get_workspace('ws', export=True).get_result()
+    assert second == first
+    assert workspace.requests == ['metadata', 'full', 'metadata']
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # a new cache on the same directory uses the stored response
+    cache = WorkspaceCache(_service, str(tmpdir))
+    assert cache.get_workspace('ws', export=True).get_result() == first
+    assert workspace.requests[-1] == 'metadata'
+
+    workspace.updated = '2026-01-02T00:00:00.000Z'
+    workspace.intents = []
+    assert cache.get_workspace('ws', export=True).get_result()['intents'] == []
+    assert workspace.requests[-2:] == ['metadata', 'full']
+
+
+@responses.activate
+def test_etag_is_revalidated_with_if_none_match(tmpdir):
+    workspace = FakeWorkspace(etag=True)
+    workspace.add()
+    cache = WorkspaceCache(_service, str(tmpdir))
+
+    first = cache.get_workspace('ws', export=True, sort='stable')
+    assert cache.get_workspace('ws', export=True, sort='stable').get_result() == first.get_result()
+    assert workspace.requests == ['metadata', 'full', 'full']
+    assert responses.calls[2].request.headers['If-None-Match'] == '"2026-01-01T00:00:00.000Z"'
+    assert responses.calls[2].response.status_code == 304
+    assert cache.hits == 1
+
+    workspace.updated = '2026-01-02T00:00:00.000Z'
+    cache.get_workspace('ws', export=True, sort='stable')
+    assert cache.misses == 2
+
+
+@responses.activate
+def test_export_in_progress_is_not_cached(tmpdir):
+    workspace = FakeWorkspace()
+    workspace.status = 'Processing'
+    workspace.add()
+    cache = WorkspaceCache(_service, str(tmpdir))
+
+    cache.export_workspace_async('ws')
+    workspace.status = 'Available'
+    cache.export_workspace_async('ws')
+    assert cache.export_workspace_async('ws').get_result()['intents'] == workspace.intents
+    assert workspace.requests == ['metadata', 'full', 'metadata', 'full', 'metadata']
+    assert cache.hits == 1
+
+
+@responses.activate
+def test_least_recently_used_responses_are_evicted(tmpdir):
+    workspace = FakeWorkspace()
+    workspace.add()
+    cache = WorkspaceCache(_service, str(tmpdir))
+    cache.get_workspace('ws', export=True)
+    size = sum(os.path.getsize(os.path.join(str(tmpdir), name))
+               for name in os.listdir(str(tmpdir)) if name.endswith('.json.gz'))
+
+    cache = WorkspaceCache(_service, str(tmpdir), max_size=size)
+    cache.get_workspace('ws', export=True, sort='stable')
+    assert cache.evictions == 1
+    assert len([name for name in os.listdir(str(tmpdir)) if name.endswith('.json.gz')]) == 1
+
+    cache.clear()
+    assert [name for name in os.listdir(str(tmpdir)) if name.endswith('.json.gz')] == []
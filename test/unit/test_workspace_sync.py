@@ -0,0 +1,200 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2026.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit Tests for WorkspaceSync
+"""
+
+import copy
+import threading
+import pytest
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_watson import WorkspaceSync
+from ibm_watson import common
+
+LIVE = {
+    'name': 'Car Dashboard',
+    'language': 'en',
+    'learning_opt_out': False,
+    'intents': [
+        {'intent': 'greeting', 'description': 'Hello', 'examples': [{'text': 'hi'}, {'text': 'hello'}],
+         'created': '2026-01-01T00:00:00.000Z'},
+        {'intent': 'goodbye', 'examples': [{'text': 'bye'}]},
+        {'intent': 'weather', 'examples': [{'text': 'is it raining', 'mentions': []}]},
+    ],
+    'entities': [
+        {'entity': 'color', 'values': [{'value': 'red', 'type': 'synonyms', 'synonyms': ['crimson', 'scarlet']}]},
+        {'entity': 'sys-number', 'values': []},
+    ],
+    'counterexamples': [{'text': 'buy a car'}],
+    'dialog_nodes': [
+        {'dialog_node': 'welcome', 'conditions': 'welcome', 'output': {'text': 'Hi'}},
+        {'dialog_node': 'help', 'conditions': '#help', 'previous_sibling': 'welcome'},
+        {'dialog_node': 'help-child', 'parent': 'help'},
+        {'dialog_node': 'anything_else', 'conditions': 'anything_else', 'previous_sibling': 'help'},
+    ],
+}
+
+
+class FakeAssistant(object):
+    """Returns a live workspace and records the calls that change it."""
+
+    def __init__(self, live):
+        self.live = live
+        self.calls = []
+        self.failures = {}
+        self.lock = threading.Lock()
+
+    def get_workspace(self, workspace_id, *, export=None, **kwargs):
+        assert export
+        return DetailedResponse(response=copy.deepcopy(self.live), status_code=200)
+
+    def __getattr__(self, method):
+        if not method.startswith(('create_', 'update_', 'delete_')):
+            raise AttributeError(method)
+
+        def call(workspace_id, **kwargs):
+            assert workspace_id == 'ws'
+            with self.lock:
+                if self.failures.get(method):
+                    self.failures[method] -= 1
+                    raise ApiException(429, message='Rate limit exceeded')
+                self.calls.append((method, kwargs))
+            return DetailedResponse(response={}, status_code=200)
+
+        return call
+
+
+def test_unchanged_workspace_needs_no_calls():
+    assistant = FakeAssistant(LIVE)
+    local = copy.deepcopy(LIVE)
+    # order, audit properties and empty mentions do not count as changes
+    local['intents'][0]['examples'].reverse()
+    del local['intents'][0]['created']
+    del local['intents'][2]['examples'][0]['mentions']
+    local['entities'][0]['values'][0]['synonyms'].reverse()
+    sync = WorkspaceSync(assistant, 'ws')
+    assert sync.sync(local) == []
+    assert assistant.calls == []
+
+
+def test_service_defaults_are_not_changes():
+    live = copy.deepcopy(LIVE)
+    live['entities'][0]['values'][0]['metadata'] = {}
+    live['entities'][0]['values'].append({'value': 'blue', 'type': 'synonyms', 'synonyms': []})
+    for node in live['dialog_nodes']:
+        node.update(type='standard', disabled=False)
+    local = copy.deepcopy(LIVE)
+    del local['entities'][0]['values'][0]['type']
+    local['entities'][0]['values'].append({'value': 'blue'})
+    assert WorkspaceSync(FakeAssistant(live), 'ws').plan(local) == []
+
+
+def test_missing_element_kinds_are_left_unchanged():
+    changes = WorkspaceSync(FakeAssistant(LIVE), 'ws').plan({'name': 'Car Dashboard 2'})
+    assert [(change.method, change.kwargs) for change in changes] == [
+        ('update_workspace', {'name': 'Car Dashboard 2'}),
+    ]
+
+
+def test_changed_elements_are_synced_with_one_call_each():
+    assistant = FakeAssistant(LIVE)
+    local = copy.deepcopy(LIVE)
+    local['name'] = 'Car Dashboard 2'
+    local['intents'][0]['examples'].append({'text': 'hey'})
+    del local['intents'][1]
+    local['intents'].append({'intent': 'thanks', 'examples': [{'text': 'thank you'}]})
+    local['entities'][0]['values'][0]['synonyms'].append('ruby')
+    local['counterexamples'] = [{'text': 'sell a car'}]
+
+    sync = WorkspaceSync(assistant, 'ws')
+    changes = sync.sync(local)
+
+    assert sorted(assistant.calls, key=lambda call: call[0]) == sorted([
+        ('update_workspace', {'name': 'Car Dashboard 2'}),
+        ('update_intent', {'intent': 'greeting', 'new_description': 'Hello', 'append': False,
+                           'new_examples': [{'text': 'hello'}, {'text': 'hey'}, {'text': 'hi'}]}),
+        ('create_intent', {'intent': 'thanks', 'description': '', 'examples': [{'text': 'thank you'}]}),
+        ('delete_intent', {'intent': 'goodbye'}),
+        ('update_entity', {'entity': 'color', 'new_description': '', 'new_metadata': {}, 'new_fuzzy_match': False,
+                           'append': False,
+                           'new_values': [{'value': 'red', 'type': 'synonyms',
+                                           'synonyms': ['crimson', 'ruby', 'scarlet']}]}),
+        ('create_counterexample', {'text': 'sell a car'}),
+        ('delete_counterexample', {'text': 'buy a car'}),
+    ], key=lambda call: call[0])
+    assert len(changes) == sync.calls == 7
+
+
+def test_dialog_nodes_are_created_in_dependency_order_and_deleted_last():
+    assistant = FakeAssistant(LIVE)
+    local = copy.deepcopy(LIVE)
+    nodes = local['dialog_nodes']
+    del nodes[1:3]
+    nodes[1]['previous_sibling'] = 'order'
+    nodes[0]['output'] = {'text': 'Hello'}
+    nodes.extend([
+        {'dialog_node': 'order-child', 'parent': 'order'},
+        {'dialog_node': 'order', 'conditions': '#order', 'previous_sibling': 'welcome'},
+    ])
+
+    sync = WorkspaceSync(assistant, 'ws')
+    changes = sync.plan(local)
+    stages = [[(change.method, change.name) for change in stage] for stage in sync._stages(changes)]
+    assert stages == [
+        [('create_dialog_node', 'order')],
+        [('create_dialog_node', 'order-child')],
+        [('update_dialog_node', 'welcome')],
+        [('update_dialog_node', 'anything_else')],
+        # the child of the deleted node is deleted with it
+        [('delete_dialog_node', 'help')],
+    ]
+    sync.apply(changes)
+    assert assistant.calls[0] == ('create_dialog_node', {'dialog_node': 'order', 'conditions': '#order',
+                                                         'previous_sibling': 'welcome', 'type': 'standard'})
+    assert ('update_dialog_node', {'dialog_node': 'anything_else', 'new_previous_sibling': 'order'}) \
+        in assistant.calls
+    assert ('update_dialog_node', {'dialog_node': 'welcome', 'new_output': {'text': 'Hello'}}) in assistant.calls
+
+
+def test_dialog_nodes_are_replaced_when_a_property_is_removed():
+    assistant = FakeAssistant(LIVE)
+    local = copy.deepcopy(LIVE)
+    del local['dialog_nodes'][0]['output']
+
+    changes = WorkspaceSync(assistant, 'ws').sync(local)
+
+    assert [change.kind for change in changes] == ['dialog_nodes']
+    assert assistant.calls == [('update_workspace', {'dialog_nodes': local['dialog_nodes']})]
+
+
+def test_rate_limited_calls_are_retried():
+    assistant = FakeAssistant(LIVE)
+    assistant.failures['delete_counterexample'] = 2
+    local = copy.deepcopy(LIVE)
+    local['counterexamples'] = []
+
+    sync = WorkspaceSync(assistant, 'ws')
+    common.RETRY_BASE_DELAY = 0
+    try:
+        sync.sync(local)
+    finally:
+        common.RETRY_BASE_DELAY = 1
+    assert assistant.calls == [('delete_counterexample', {'text': 'buy a car'})]
+    assert sync.retries == 2
+
+    assistant.failures['delete_counterexample'] = 1
+    with pytest.raises(ApiException):
+        WorkspaceSync(assistant, 'ws', max_retries=0).sync(local)